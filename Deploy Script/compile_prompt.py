@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compile the prompt of a Use Case into the single text pushed to the robot.
+
+- Entry: the only .txt of Prompt/, or the one named in Prompt/prompt.json
+  ({"entry": "...", "budget_tokens": 8000}), or --prompt on the command line.
+- Fragments: a line "@include path/to/fragment.txt" is replaced by that file, looked
+  up next to the including file, then in "Use cases/_fragments/".
+- Dedup: sections ("== title ==", "=== title ===", "#### title") and paragraphs that
+  repeat an earlier one word for word are dropped; blank lines and trailing spaces
+  are compacted.
+- Tokens: counted with tiktoken when installed (≈ 4 characters per token otherwise)
+  and compared with the budget.
+
+Usage:
+    python compile_prompt.py --use-case "ILMI Board Demo"
+    python compile_prompt.py --use-case "ILMI Board Demo" --prompt ILMI_PREBoard_MasterPrompt.txt --out /tmp/prompt.txt
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Set
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger("deploy")
+
+USE_CASES_DIR = Path(__file__).resolve().parents[1] / "Use cases"
+SHARED_FRAGMENTS = USE_CASES_DIR / "_fragments"
+MANIFEST = "prompt.json"
+DEFAULT_BUDGET_TOKENS = 8000
+MIN_DEDUP_CHARS = 40  # shorter paragraphs ("Example:", "---") may legitimately repeat
+
+INCLUDE = re.compile(r"^@include\s+(.+?)\s*$")
+HEADER = re.compile(r"^(={2,}.*={2,}|#{1,6}\s+\S.*)$")
+
+
+class PromptError(Exception):
+    """Raised when a use case's prompt cannot be compiled."""
+
+
+@dataclass
+class CompiledPrompt:
+    text: str
+    entry: str
+    sources: List[str] = field(default_factory=list)
+    dropped_sections: List[str] = field(default_factory=list)
+    dropped_paragraphs: int = 0
+    raw_tokens: int = 0
+    tokens: int = 0
+    budget: int = DEFAULT_BUDGET_TOKENS
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+    @property
+    def over_budget(self) -> bool:
+        return self.tokens > self.budget
+
+
+def count_tokens(text: str) -> int:
+    if tiktoken is not None:
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    return (len(text) + 3) // 4
+
+
+# === Composition ===
+def _expand(path: Path, seen: Set[Path], sources: List[str]) -> List[str]:
+    path = path.resolve()
+    if path in seen:
+        raise PromptError(f"Include cycle on {path.name}")
+    if not path.exists():
+        raise PromptError(f"Prompt file not found: {path}")
+    sources.append(str(path.relative_to(USE_CASES_DIR)) if path.is_relative_to(USE_CASES_DIR) else str(path))
+
+    lines = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        match = INCLUDE.match(line)
+        if not match:
+            lines.append(line)
+            continue
+        name = match.group(1)
+        candidates = (path.parent / name, SHARED_FRAGMENTS / name)
+        fragment = next((c for c in candidates if c.exists()), None)
+        if fragment is None:
+            raise PromptError(f"{path.name}: fragment {name!r} not found")
+        lines.extend(_expand(fragment, seen | {path}, sources))
+    return lines
+
+
+def resolve_entry(prompts_path: Path, variant: Optional[str] = None) -> tuple[Path, int]:
+    """Return (entry file, token budget) for a use case's Prompt/ folder."""
+    manifest = {}
+    if (prompts_path / MANIFEST).exists():
+        try:
+            manifest = json.loads((prompts_path / MANIFEST).read_text(encoding="utf-8"))
+        except ValueError as e:
+            raise PromptError(f"{MANIFEST}: {e}")
+    budget = int(manifest.get("budget_tokens", DEFAULT_BUDGET_TOKENS))
+
+    if variant or manifest.get("entry"):
+        return prompts_path / (variant or manifest["entry"]), budget
+    candidates = sorted(prompts_path.glob("*.txt"))
+    if len(candidates) != 1:
+        names = ", ".join(c.name for c in candidates) or "none"
+        raise PromptError(
+            f"{prompts_path}: expected one .txt prompt, found {names}. "
+            f"Pick one in {MANIFEST} (\"entry\") or with --prompt."
+        )
+    return candidates[0], budget
+
+
+# === Dedup ===
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def _dedup(lines: List[str], result: CompiledPrompt) -> str:
+    # Split into sections: a header line and everything until the next header
+    sections: List[List[str]] = [[]]
+    for line in lines:
+        if HEADER.match(line.strip()) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line.rstrip())
+
+    seen_sections: Set[str] = set()
+    seen_paragraphs: Set[str] = set()
+    output: List[str] = []
+    for section in sections:
+        key = _normalize("\n".join(section))
+        has_body = any(line.strip() for line in section[1:])
+        if has_body and key in seen_sections:
+            result.dropped_sections.append(section[0].strip())
+            continue
+        seen_sections.add(key)
+
+        paragraph: List[str] = []
+        for line in section + [""]:
+            if line.strip():
+                paragraph.append(line)
+                continue
+            if paragraph:
+                norm = _normalize("\n".join(paragraph))
+                if len(norm) >= MIN_DEDUP_CHARS and norm in seen_paragraphs and not HEADER.match(paragraph[0].strip()):
+                    result.dropped_paragraphs += 1
+                else:
+                    seen_paragraphs.add(norm)
+                    output.extend(paragraph)
+                    output.append("")
+                paragraph = []
+    return "\n".join(output).strip() + "\n"
+
+
+def compile_prompt(prompts_path: Path, variant: Optional[str] = None) -> CompiledPrompt:
+    entry, budget = resolve_entry(prompts_path, variant)
+    sources: List[str] = []
+    lines = _expand(entry, set(), sources)
+    result = CompiledPrompt(text="", entry=entry.name, sources=sources, budget=budget)
+    result.raw_tokens = count_tokens("\n".join(lines))
+    result.text = _dedup(lines, result)
+    result.tokens = count_tokens(result.text)
+    return result
+
+
+def log_report(result: CompiledPrompt) -> None:
+    method = "tiktoken" if tiktoken is not None else "≈4 chars/token"
+    logger.info(f"Prompt {result.entry}: {len(result.sources)} file(s), {len(result.text) / 1024:.1f} KB")
+    if len(result.sources) > 1:
+        logger.info(f"    fragments: {', '.join(result.sources[1:])}")
+    if result.dropped_sections or result.dropped_paragraphs:
+        logger.info(
+            f"    dedup: {len(result.dropped_sections)} section(s), {result.dropped_paragraphs} paragraph(s) removed"
+        )
+    line = f"    tokens: {result.raw_tokens} → {result.tokens} / budget {result.budget} ({method})"
+    if result.over_budget:
+        logger.warning(line + " ⚠️ over budget")
+    else:
+        logger.info(line)
+
+
+def main():
+    import coloredlogs
+
+    coloredlogs.install(level="INFO", fmt="[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Compile a use case's prompt without deploying it.")
+    parser.add_argument("--use-case", required=True, help="Name of the use case.")
+    parser.add_argument("--prompt", help="Prompt file to use instead of the default entry.")
+    parser.add_argument("--out", type=Path, help="Write the compiled prompt to this file.")
+    args = parser.parse_args()
+
+    try:
+        result = compile_prompt(USE_CASES_DIR / args.use_case / "Prompt", args.prompt)
+    except PromptError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    log_report(result)
+    if args.out:
+        args.out.write_text(result.text, encoding="utf-8")
+        logger.info(f"Written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
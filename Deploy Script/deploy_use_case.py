@@ -3,21 +3,54 @@
 """
 Deploy a full Use Case (Prompts + Custom Skills) on the Mirokai robot.
 
+Only skills and prompts whose content changed since the last deploy to the same
+robot are sent (hashes kept in .deploy_state/). Use --force for a full redeploy.
+REST calls run concurrently (--concurrency) and are retried with backoff (--retries).
+
+Skills are deployed in stages (upload → verify → enable → remove stale), so a failed
+upload never leaves the robot without skills. Each successful deploy is snapshotted;
+--rollback redeploys the previous snapshot.
+
+Binary assets (audio clips…) in the use case's Assets/ folder are uploaded next to the
+skills, tracked by content hash like the skills, and never base64-embedded in code.
+
+Skills are validated (see validate_skills.py) before any network traffic; an invalid
+skill aborts the deploy. --skip-validation bypasses this step.
+
+The prompt is compiled (see compile_prompt.py: fragments, dedup, token budget) and
+exactly one prompt is pushed. --prompt picks another entry file of the use case.
+
+With --fleet, every robot of an inventory file (ip, api key, use case) is deployed
+concurrently and the robots that diverge from their target skill set are reported.
+
 Usage:
     python deploy_use_case.py --ip localhost --api-key admin --use-case "Base Demo"
     python deploy_use_case.py --simulate --use-case "Base Demo"
+    python deploy_use_case.py --ip localhost --api-key admin --use-case "Base Demo" --force
+    python deploy_use_case.py --ip localhost --api-key admin --rollback
+    python deploy_use_case.py --fleet fleet.json
+    python deploy_use_case.py --ip http://127.0.0.1:8765 --api-key admin --use-case "Base Demo"   (sim_robot_server.py)
 """
 
 import asyncio
 import argparse
+import hashlib
+import json
 import logging
+import shutil
 import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import coloredlogs
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from aiohttp import ClientSession, FormData
 
-from aiohttp import FormData
+from compile_prompt import CompiledPrompt, PromptError, compile_prompt, log_report
+from validate_skills import is_helper, validate_skills
 
 try:
     from pymirokai.robot import connect, Robot
@@ -27,26 +60,48 @@ except ImportError:
 
 
 # === Logging Setup ===
+# Robot being deployed by the current task, shown in every log line in --fleet mode
+current_robot: ContextVar[str] = ContextVar("current_robot", default="")
+
+
+class RobotTagFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        robot = current_robot.get()
+        record.robot = f"[{robot}] " if robot else ""
+        return True
+
+
 coloredlogs.install(
     level="INFO",
-    fmt="[%(asctime)s] [%(levelname)s] (%(threadName)s) %(message)s",
+    fmt="[%(asctime)s] [%(levelname)s] (%(threadName)s) %(robot)s%(message)s",
     datefmt="%H:%M:%S",
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(RobotTagFilter())
 logger = logging.getLogger("deploy")
 
 
+class DeployError(Exception):
+    """Raised when a deploy stage fails and the following stages must not run."""
+
+
 # === Simulated Robot (for --simulate mode) ===
 class SimulatedRobot:
     class FakeAPI:
+        def __init__(self):
+            self.files = {"demo_skill.py"}
+
         async def list_skill_files(self):
-            return {"skills": [{"name": "demo_skill"}]}
+            return {"skills": [{"name": name} for name in sorted(self.files)]}
 
         async def remove_skill_file(self, name):
             await asyncio.sleep(0.2)
+            self.files = {f for f in self.files if skill_key(f) != skill_key(name)}
             return {"status": "removed", "name": name}
 
         async def upload_skill_file(self, path):
             await asyncio.sleep(0.5)
+            self.files.add(Path(path).name)
             return {"message": f"Skill uploaded successfully ({path})"}
 
         async def enable_skill_file(self, name, enable):
@@ -64,6 +119,159 @@ class SimulatedRobot:
         logger.info("[SIMULATION] Disconnected from fake robot.")
 
 
+# === Simulated Robot Server (for --ip http://..., see sim_robot_server.py) ===
+class SimServerRobot:
+    """Talks to sim_robot_server.py over HTTP, with the same routes as pymirokai's RestAPI."""
+
+    class RestAPI:
+        def __init__(self, url: str, session: ClientSession, token: str):
+            self.api = f"{url}/api/v1"
+            self.session = session
+            self.headers = {"Authorization": f"Bearer {token}"}
+
+        async def list_skill_files(self):
+            async with self.session.get(f"{self.api}/skill/list/", headers=self.headers) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        async def remove_skill_file(self, name):
+            url = f"{self.api}/skill/remove/"
+            async with self.session.delete(url, params={"skill_name": name}, headers=self.headers) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        async def upload_skill_file(self, path):
+            data = FormData()
+            data.add_field("skill", Path(path).read_bytes(), filename=Path(path).name)
+            async with self.session.post(f"{self.api}/skill/upload/", data=data, headers=self.headers) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        async def enable_skill_file(self, name, enable):
+            payload = {"command": name, "value": enable}
+            async with self.session.patch(f"{self.api}/skill/enable/", json=payload, headers=self.headers) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    class PromptUpdate:
+        """Stands for the update_prompt mission of the real robot."""
+
+        def __init__(self, request: Awaitable):
+            self.request = asyncio.ensure_future(request)
+
+        async def completed(self):
+            return await self.request
+
+    def __init__(self, url: str, api_key: str, executor: Optional["DeployExecutor"] = None):
+        self.url = url.rstrip("/")
+        self.api_key = api_key
+        self.executor = executor or DeployExecutor()
+        self.session: Optional[ClientSession] = None
+        self.rest_api: Optional[SimServerRobot.RestAPI] = None
+
+    async def __aenter__(self):
+        self.session = ClientSession()
+        headers = {"X-API-Key": self.api_key}
+
+        async def auth() -> str:
+            async with self.session.get(f"{self.url}/api/v1/auth/", headers=headers) as response:
+                response.raise_for_status()
+                return (await response.json())["token"]
+
+        # Same retries and backoff as the other REST calls: the server may still be starting
+        try:
+            token = await self.executor.fetch("auth", self.url, auth)
+        except BaseException:
+            await self.session.close()
+            raise
+        self.rest_api = self.RestAPI(self.url, self.session, token)
+        logger.info(f"[SIM SERVER] Connected to {self.url} 🤖")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    def update_prompt(self, text: str) -> "SimServerRobot.PromptUpdate":
+        async def send():
+            url = f"{self.rest_api.api}/prompt/"
+            async with self.session.post(url, json={"prompt": text}, headers=self.rest_api.headers) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        return self.PromptUpdate(send())
+
+
+# === Deployment State (content hashes per robot) ===
+STATE_DIR = Path(__file__).resolve().parent / ".deploy_state"
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def skill_key(name: str) -> str:
+    """Normalize a skill name from the robot ("disabled.foo.py", "foo.py", "foo") to "foo"."""
+    name = Path(name).name
+    if name.startswith("disabled."):
+        name = name[len("disabled."):]
+    return name[:-3] if name.endswith(".py") else name
+
+
+def state_path(target: str) -> Path:
+    return STATE_DIR / f"{target.replace(':', '_').replace('/', '_')}.json"
+
+
+def load_state(target: str) -> Dict[str, Any]:
+    path = state_path(target)
+    if not path.exists():
+        return {"skills": {}, "prompt": None}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Ignoring unreadable deploy state {path.name}: {e}")
+        return {"skills": {}, "prompt": None}
+
+
+def save_state(target: str, state: Dict[str, Any]) -> None:
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    state_path(target).write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+
+
+# === Snapshots (last two successful deploys per robot, for --rollback) ===
+def snapshot_dir(target: str, which: str) -> Path:
+    """`which` is "current" (what the robot runs) or "previous" (rollback target)."""
+    return state_path(target).with_suffix(f".{which}")
+
+
+def save_snapshot(target: str, base_path: Path, use_case_name: str, prompt: Optional[CompiledPrompt]) -> None:
+    """Record a successful deploy: current → previous, deployed files → current."""
+    current, previous = snapshot_dir(target, "current"), snapshot_dir(target, "previous")
+    staging = state_path(target).with_suffix(".staging")
+    shutil.rmtree(staging, ignore_errors=True)
+    for folder, pattern in (("Skills", "*.py"), ("Assets", "*")):
+        (staging / folder).mkdir(parents=True)
+        for f in sorted((base_path / folder).glob(pattern)):
+            shutil.copy2(f, staging / folder / f.name)
+    (staging / "Prompt").mkdir()
+    if prompt is not None:
+        # The compiled prompt, so a rollback does not depend on fragments that may have changed since
+        (staging / "Prompt" / "prompt.txt").write_text(prompt.text, encoding="utf-8")
+    (staging / "use_case.txt").write_text(use_case_name, encoding="utf-8")
+
+    if current.exists():
+        shutil.rmtree(previous, ignore_errors=True)
+        current.rename(previous)
+    staging.rename(current)
+
+
+def load_snapshot(target: str) -> tuple[Path, str]:
+    """Return (folder, use case name) of the previous deploy, for --rollback."""
+    previous = snapshot_dir(target, "previous")
+    if not (previous / "use_case.txt").exists():
+        raise DeployError(f"No previous deploy recorded for {target}, nothing to roll back to.")
+    return previous, (previous / "use_case.txt").read_text(encoding="utf-8").strip()
+
+
 # === Response Validator ===
 def validate_robot_response(response: Dict[str, Any], action: str, file_name: str) -> bool:
     if not response:
@@ -82,113 +290,476 @@ def validate_robot_response(response: Dict[str, Any], action: str, file_name: st
     return True
 
 
-# === Core Steps ===
-async def remove_all_skills(robot) -> None:
-    """Remove all existing skills from the robot safely."""
-    logger.info("Fetching existing skills on the robot...")
-    skills = await robot.rest_api.list_skill_files()
-    skill_list = skills.get("skills", [])
+# === Deploy Executor (bounded concurrency + retries) ===
+@dataclass
+class CallResult:
+    action: str
+    target: str
+    ok: bool
+    attempts: int
+    elapsed: float
+    error: str = ""
+
+
+class DeployExecutor:
+    """Run robot REST calls concurrently, at most `concurrency` at a time.
+
+    Each call is retried `retries` times with exponential backoff when it raises
+    or returns False. Every call is recorded for the final result table.
+    """
+
+    def __init__(self, concurrency: int = 4, retries: int = 2, backoff: float = 0.5):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.retries = retries
+        self.backoff = backoff
+        self.results: List[CallResult] = []
+
+    async def run(self, action: str, target: str, call: Callable[[], Awaitable[bool]]) -> bool:
+        start = time.perf_counter()
+        error = ""
+        attempt = 0
+        for attempt in range(1, self.retries + 2):
+            async with self.semaphore:
+                try:
+                    if await call():
+                        self.results.append(CallResult(action, target, True, attempt, time.perf_counter() - start))
+                        return True
+                    error = "rejected by robot"
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+            if attempt <= self.retries:
+                delay = self.backoff * 2 ** (attempt - 1)
+                logger.warning(f"⚠️ {action} {target} failed ({error}), retry {attempt}/{self.retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        logger.error(f"❌ {action} {target} failed after {attempt} attempt(s): {error}")
+        self.results.append(CallResult(action, target, False, attempt, time.perf_counter() - start, error))
+        return False
 
-    if not skill_list:
-        logger.warning("No skills currently found on the robot.")
-        return
+    async def fetch(self, action: str, target: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Like run() for calls returning data; raises DeployError once retries are exhausted."""
+        result = None
+
+        async def wrapped() -> bool:
+            nonlocal result
+            result = await call()
+            return True
+
+        if not await self.run(action, target, wrapped):
+            raise DeployError(f"{action} {target} failed after {self.retries + 1} attempt(s)")
+        return result
 
-    logger.info(f"Found {len(skill_list)} skill(s) to remove.")
-    for skill in skill_list:
+    def log_summary(self) -> None:
+        if not self.results:
+            return
+        width = max(len(r.target) for r in self.results)
+        logger.info(f"{'Action':<8} {'Target':<{width}}  Result  Tries  Time")
+        for r in self.results:
+            mark = "✓" if r.ok else "✗"
+            logger.info(f"{r.action:<8} {r.target:<{width}}  {mark:<6}  {r.attempts:<5}  {r.elapsed:.2f}s"
+                        + (f"  {r.error}" if r.error else ""))
+        failed = sum(not r.ok for r in self.results)
+        logger.info(f"{len(self.results) - failed} call(s) succeeded, {failed} failed.")
+
+
+# === Core Steps ===
+async def list_robot_skills(robot, executor: DeployExecutor) -> Dict[str, str]:
+    """Return {normalized name: name as listed by the robot}."""
+    skills = await executor.fetch("list", "skills", robot.rest_api.list_skill_files)
+    names = {}
+    for skill in (skills or {}).get("skills", []):
         # Handle both formats: dict or string
         skill_name = skill["name"] if isinstance(skill, dict) and "name" in skill else str(skill)
-        if not skill_name:
-            continue
+        if skill_name:
+            names[skill_key(skill_name)] = skill_name
+    return names
 
-        logger.info(f"→ Removing skill: {skill_name}")
-        try:
-            await robot.rest_api.remove_skill_file(skill_name)
-        except Exception as e:
-            logger.error(f"Failed to remove skill {skill_name}: {e}")
 
-async def upload_and_enable_skills(robot, skills_path: Path):
+async def remove_skill(robot, executor: DeployExecutor, skill_name: str) -> bool:
+    async def call() -> bool:
+        logger.info(f"→ Removing skill: {skill_name}")
+        res = await robot.rest_api.remove_skill_file(skill_name)
+        return not (isinstance(res, dict) and res.get("status") == "error")
+
+    return await executor.run("remove", skill_name, call)
+
+
+async def upload_skill(robot, executor: DeployExecutor, skill_file: Path) -> bool:
+    async def call() -> bool:
+        res = await robot.rest_api.upload_skill_file(str(skill_file))
+        return validate_robot_response(res, "upload", skill_file.name)
+
+    return await executor.run("upload", skill_file.name, call)
+
+
+async def enable_skill(robot, executor: DeployExecutor, skill_name: str) -> bool:
+    async def call() -> bool:
+        res = await robot.rest_api.enable_skill_file(skill_name, True)
+        return not (isinstance(res, dict) and res.get("status") == "error")
+
+    return await executor.run("enable", skill_name, call)
+
+
+async def sync_assets(
+    robot, assets_path: Path, state: Dict[str, Any], executor: DeployExecutor, force: bool = False
+) -> List[str]:
+    """Upload the binary assets (audio clips…) whose hash changed since the last deploy.
+
+    Assets go through the skill upload endpoint and land next to the skills, where
+    skills find them by name. Returns the assets of the previous deploy that are no
+    longer in the use case; they are removed once the new skills are live.
+    Raises DeployError when an upload fails.
+    """
+    local = {f.name: f for f in sorted(assets_path.glob("*")) if f.is_file()} if assets_path.exists() else {}
+    deployed: Dict[str, str] = state.setdefault("assets", {})
+    hashes = {name: file_hash(path) for name, path in local.items()}
+    changed = [name for name in local if force or deployed.get(name) != hashes[name]]
+    stale = [name for name in deployed if name not in local]
+    if local or stale:
+        total = sum(local[name].stat().st_size for name in changed)
+        logger.info(f"Assets: {len(changed)} to upload ({total / 1024:.0f} KB), {len(stale)} to remove.")
+
+    for name in changed:
+        deployed.pop(name, None)
+    uploaded = await asyncio.gather(*(upload_skill(robot, executor, local[name]) for name in changed))
+    for name, ok in zip(changed, uploaded):
+        if ok:
+            deployed[name] = hashes[name]
+    failed = [name for name, ok in zip(changed, uploaded) if not ok]
+    if failed:
+        raise DeployError(f"Asset upload failed for {', '.join(failed)}; previous skills left in place.")
+    return stale
+
+
+async def remove_assets(robot, names: List[str], state: Dict[str, Any], executor: DeployExecutor) -> None:
+    deployed: Dict[str, str] = state.setdefault("assets", {})
+    removed = await asyncio.gather(*(remove_skill(robot, executor, name) for name in names))
+    for name, ok in zip(names, removed):
+        if ok:
+            deployed.pop(name, None)
+
+
+async def sync_skills(
+    robot, skills_path: Path, state: Dict[str, Any], executor: DeployExecutor, force: bool = False
+) -> None:
+    """Make the robot's skills match `skills_path`, touching only what changed.
+
+    Helper modules (no @skill(), e.g. audio_player.py) are uploaded and verified like
+    skills but never enabled. A skill is uploaded when it is missing on the robot or its hash differs from
+    the last deploy recorded in `state`. The new set is uploaded and verified before
+    anything is enabled, and stale skills are only removed once the new set is live,
+    so a failure at any stage leaves the previous skills in place.
+    Raises DeployError when staging, verification or enabling fails.
+    """
     if not skills_path.exists():
         logger.warning(f"Custom Skills folder not found: {skills_path}")
+        local = {}
+    else:
+        local = {f.stem: f for f in sorted(skills_path.glob("*.py"))}
+        if not local:
+            logger.warning("No custom skill files found.")
+
+    logger.info("Fetching existing skills on the robot...")
+    remote = await list_robot_skills(robot, executor)
+    deployed: Dict[str, str] = state.setdefault("skills", {})
+    hashes = {stem: file_hash(path) for stem, path in local.items()}
+
+    # Assets share the skills folder on the robot: they are never stale skills
+    stale = [key for key in remote if key not in local and key not in state.get("assets", {})]
+    changed = [stem for stem in local if force or stem not in remote or deployed.get(stem) != hashes[stem]]
+    logger.info(
+        f"Skills: {len(changed)} to upload, {len(stale)} to remove, "
+        f"{len(local) - len(changed)} unchanged."
+    )
+
+    # 1. Stage: upload the new/changed files, nothing is removed yet
+    for stem in changed:
+        deployed.pop(stem, None)
+    uploaded = await asyncio.gather(*(upload_skill(robot, executor, local[stem]) for stem in changed))
+    failed = [stem for stem, ok in zip(changed, uploaded) if not ok]
+    if failed:
+        raise DeployError(f"Upload failed for {', '.join(failed)}; previous skills left in place.")
+
+    # 2. Verify: the whole target set must be listed by the robot
+    if changed:
+        listed = await list_robot_skills(robot, executor)
+        missing = [stem for stem in local if stem not in listed]
+        if missing:
+            raise DeployError(f"Robot does not list {', '.join(missing)} after upload; nothing enabled.")
+
+    # 3. Enable the new set (helpers are only imported by the skills)
+    helpers = [stem for stem in changed if is_helper(local[stem])]
+    for stem in helpers:
+        deployed[stem] = hashes[stem]
+    to_enable = [stem for stem in changed if stem not in helpers]
+    enabled = await asyncio.gather(*(enable_skill(robot, executor, stem) for stem in to_enable))
+    failed = [stem for stem, ok in zip(to_enable, enabled) if not ok]
+    for stem, ok in zip(to_enable, enabled):
+        if ok:
+            deployed[stem] = hashes[stem]
+    if failed:
+        raise DeployError(f"Enable failed for {', '.join(failed)}; stale skills left in place.")
+
+    # 4. Cleanup: only now remove what the use case no longer contains
+    removed = await asyncio.gather(*(remove_skill(robot, executor, remote[key]) for key in stale))
+    for key, ok in zip(stale, removed):
+        if ok:
+            deployed.pop(key, None)
+        else:
+            logger.warning(f"⚠️ Stale skill {remote[key]} is still on the robot.")
+
+
+async def check_divergence(
+    robot, skills_path: Path, assets_path: Path, executor: DeployExecutor
+) -> tuple[List[str], List[str]]:
+    """Compare the robot's skills with the use case: return (missing, extra)."""
+    expected = {f.stem for f in skills_path.glob("*.py")} if skills_path.exists() else set()
+    assets = {f.name for f in assets_path.glob("*")} if assets_path.exists() else set()
+    listed = set(await list_robot_skills(robot, executor))
+    return sorted(expected - listed), sorted(listed - expected - assets)
+
+
+async def push_prompt(
+    robot, prompt: Optional[CompiledPrompt], state: Dict[str, Any], executor: DeployExecutor, force: bool = False
+) -> None:
+    """Update the robot's current prompt with the compiled prompt (SystemAdmin.update_prompt())."""
+    if prompt is None:
+        return
+    if not force and state.get("prompt") == prompt.sha256:
+        logger.info("Prompt unchanged since last deploy, skipping.")
         return
 
-    skill_files = list(skills_path.glob("*.py"))
-    if not skill_files:
-        logger.warning("No custom skill files found.")
+    state["prompt"] = None
+    if not hasattr(robot, "update_prompt"):
+        logger.error("❌ The robot does not expose SystemAdmin.update_prompt(). Check firmware or permissions.")
         return
+    logger.info(f"→ Updating prompt from {prompt.entry} ({prompt.tokens} tokens)")
 
-    logger.info(f"Uploading {len(skill_files)} custom skill(s)...")
-    for skill_file in skill_files:
-        try:
-            res = await robot.rest_api.upload_skill_file(str(skill_file))
-            validate_robot_response(res, "upload", skill_file.name)
-            await robot.rest_api.enable_skill_file(skill_file.stem, True)
-        except Exception as e:
-            logger.error(f"Failed to upload {skill_file.name}: {e}")
+    async def call() -> bool:
+        # Appel à la méthode officielle SystemAdmin.update_prompt()
+        mission = robot.update_prompt(prompt.text.strip())
+        await mission.completed()
+        return True
+
+    if await executor.run("prompt", prompt.entry, call):
+        logger.info(f"✓ Updated robot prompt with {prompt.entry}")
+        state["prompt"] = prompt.sha256
 
 
-async def upload_and_enable_prompts(robot, prompts_path: Path) -> None:
-    """Update the robot's current prompt using SystemAdmin.update_prompt()."""
+# === Build Step ===
+def build_prompt(prompts_path: Path, variant: Optional[str] = None) -> Optional[CompiledPrompt]:
+    """Compile the use case's prompt; None when the use case has no prompt."""
     if not prompts_path.exists():
         logger.warning(f"Prompts folder not found: {prompts_path}")
-        return
-
-    prompt_files = list(prompts_path.glob("*.txt"))
-    if not prompt_files:
+        return None
+    if not variant and not any(prompts_path.glob("*.txt")):
         logger.warning("No prompt files found.")
-        return
-
-    logger.info(f"Uploading {len(prompt_files)} prompt(s)...")
-
-    for prompt_file in prompt_files:
-        logger.info(f"→ Updating prompt from file: {prompt_file.name}")
-        try:
-            # Lire le contenu du prompt
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-
-            # Appel à la méthode officielle SystemAdmin.update_prompt()
-            mission = robot.update_prompt(content)
-            await mission.completed()
+        return None
+    try:
+        prompt = compile_prompt(prompts_path, variant)
+    except PromptError as e:
+        raise DeployError(f"Prompt: {e}")
+    log_report(prompt)
+    return prompt
 
-            logger.info(f"✓ Updated robot prompt with {prompt_file.name}")
 
-        except AttributeError:
-            logger.error("❌ The robot does not expose SystemAdmin.update_prompt(). Check firmware or permissions.")
-            return
-        except Exception as e:
-            logger.error(f"Failed to update prompt {prompt_file.name}: {e}")
+def check_skills(skills_path: Path) -> None:
+    """Validate the skills locally; raise DeployError before anything is sent."""
+    if not skills_path.exists():
+        return
+    logger.info("Validating skills...")
+    failed = [r.file.name for r in validate_skills(skills_path) if not r.ok]
+    if failed:
+        raise DeployError(f"Invalid skill(s): {', '.join(failed)}. Nothing was sent to the robot.")
 
 
 # === Main Deployment ===
-async def deploy_use_case(ip: str, api_key: str, use_case_name: str, simulate: bool = False):
-    base_path = Path(__file__).resolve().parents[1] / "Use cases" / use_case_name
+@dataclass
+class DeployResult:
+    robot: str
+    use_case: str
+    ok: bool = False
+    elapsed: float = 0.0
+    missing: Optional[List[str]] = field(default_factory=list)  # None: not checked
+    extra: Optional[List[str]] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def diverges(self) -> bool:
+        return not self.ok or bool(self.missing or self.extra)
+
+
+def deploy_target(ip: Optional[str], simulate: bool) -> str:
+    """Key used for the deploy state and snapshots of a robot ("local" for a UDS deploy)."""
+    if simulate:
+        return f"simulated-{ip}" if ip else "simulated"
+    return ip or "local"
+
+
+async def deploy_use_case(
+    ip: Optional[str],
+    api_key: str,
+    use_case_name: Optional[str],
+    simulate: bool = False,
+    force: bool = False,
+    concurrency: int = 4,
+    retries: int = 2,
+    rollback: bool = False,
+    validate: bool = True,
+    prompt_variant: Optional[str] = None,
+) -> DeployResult:
+    target = deploy_target(ip, simulate)
+    if rollback:
+        base_path, use_case_name = load_snapshot(target)
+        logger.info(f"=== ⏪ Rolling back to previous deploy: {use_case_name} ===")
+    else:
+        base_path = Path(__file__).resolve().parents[1] / "Use cases" / use_case_name
+        logger.info(f"=== 🚀 Deploying Use Case: {use_case_name} ===")
     prompts_path = base_path / "Prompt"
     skills_path = base_path / "Skills"
+    assets_path = base_path / "Assets"
+    if validate and not rollback:
+        # Un snapshot a déjà été validé lors de son déploiement
+        check_skills(skills_path)
+    prompt = build_prompt(prompts_path, None if rollback else prompt_variant)
+
+    executor = DeployExecutor(concurrency=concurrency, retries=retries)
+    if simulate:
+        robot_context = SimulatedRobot()
+    elif ip and ip.startswith(("http://", "https://")):
+        robot_context = SimServerRobot(ip, api_key, executor)
+    else:
+        # Sans --ip, pymirokai se connecte en local (UDS) : déploiement depuis le robot
+        robot_context = connect(api_key, ip)
+
+    async with robot_context as robot:
+        logger.info("Connected to robot ✅" if not simulate else "Running in SIMULATION mode ⚙️")
 
-    logger.info(f"=== 🚀 Deploying Use Case: {use_case_name} ===")
+        state = load_state(target)
+        state["use_case"] = use_case_name
+        try:
+            stale_assets = await sync_assets(robot, assets_path, state, executor, force=force)
+            await sync_skills(robot, skills_path, state, executor, force=force)
+            await remove_assets(robot, stale_assets, state, executor)
+            await push_prompt(robot, prompt, state, executor, force=force)
+        finally:
+            save_state(target, state)
+            executor.log_summary()
+
+        save_snapshot(target, base_path, use_case_name, prompt)
+        try:
+            missing, extra = await check_divergence(robot, skills_path, assets_path, executor)
+        except Exception as e:
+            # The deploy itself succeeded: only the comparison is unknown
+            logger.warning(f"⚠️ Could not compare the robot's skills with the use case: {e}")
+            missing = extra = None
+        logger.info(f"🎉 Deployment of '{use_case_name}' completed successfully!")
+        return DeployResult(target, use_case_name, ok=True, missing=missing, extra=extra)
 
-    robot_class = SimulatedRobot if simulate else connect
 
-    async with (robot_class() if simulate else connect(api_key, ip)) as robot:
-        logger.info("Connected to robot ✅" if not simulate else "Running in SIMULATION mode ⚙️")
+# === Fleet Deployment ===
+def load_inventory(path: Path) -> List[Dict[str, str]]:
+    """Read a fleet inventory: a JSON list of {"ip", "api_key", "use_case"} (+ optional "name", "prompt")."""
+    robots = json.loads(path.read_text(encoding="utf-8"))
+    for i, entry in enumerate(robots):
+        missing = [k for k in ("ip", "api_key", "use_case") if not entry.get(k)]
+        if missing:
+            raise ValueError(f"{path.name}: robot #{i + 1} is missing {', '.join(missing)}")
+    return robots
 
-        await remove_all_skills(robot)
-        await upload_and_enable_skills(robot, skills_path)
-        await upload_and_enable_prompts(robot, prompts_path)
 
-        logger.info(f"🎉 Deployment of '{use_case_name}' completed successfully!")
+async def deploy_fleet(inventory: List[Dict[str, str]], **options) -> List[DeployResult]:
+    """Deploy every robot of the inventory concurrently; one failure does not stop the others."""
+
+    invalid: Dict[str, str] = {}
+
+    async def deploy_one(entry: Dict[str, str]) -> DeployResult:
+        label = entry.get("name") or entry["ip"]
+        current_robot.set(label)
+        start = time.perf_counter()
+        try:
+            if entry["use_case"] in invalid:
+                raise DeployError(invalid[entry["use_case"]])
+            result = await deploy_use_case(
+                entry["ip"], entry["api_key"], entry["use_case"], prompt_variant=entry.get("prompt"), **options
+            )
+        except Exception as e:
+            logger.error(f"❌ Deployment failed: {e}")
+            result = DeployResult(deploy_target(entry["ip"], options.get("simulate", False)), entry["use_case"], error=str(e))
+        result.robot = label
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    if options.get("validate", True) and not options.get("rollback"):
+        # Validate each use case once, before connecting to any robot; only the robots of an
+        # invalid use case are skipped
+        for use_case_name in sorted({entry["use_case"] for entry in inventory}):
+            logger.info(f"=== 🔎 {use_case_name} ===")
+            try:
+                check_skills(Path(__file__).resolve().parents[1] / "Use cases" / use_case_name / "Skills")
+            except DeployError as e:
+                logger.error(f"❌ {use_case_name}: {e}")
+                invalid[use_case_name] = str(e)
+        options = {**options, "validate": False}
+
+    logger.info(f"=== 🚀 Deploying fleet of {len(inventory)} robot(s) ===")
+    return list(await asyncio.gather(*(deploy_one(entry) for entry in inventory)))
+
+
+def log_fleet_report(results: List[DeployResult]) -> None:
+    width = max([len(r.robot) for r in results] + [5])
+    logger.info(f"{'Robot':<{width}}  {'Use case':<30} Result     Time")
+    for r in results:
+        status = "✓ ok" if not r.diverges else ("✗ failed" if not r.ok else "⚠ diverges")
+        if r.ok and (r.missing is None or r.extra is None):
+            status = "? unknown"
+        logger.info(f"{r.robot:<{width}}  {r.use_case:<30} {status:<10} {r.elapsed:.1f}s")
+        if r.error:
+            logger.info(f"    error: {r.error}")
+        if r.missing:
+            logger.info(f"    missing: {', '.join(r.missing)}")
+        if r.extra:
+            logger.info(f"    extra: {', '.join(r.extra)}")
+    diverging = sum(r.diverges for r in results)
+    if diverging:
+        logger.warning(f"⚠️ {diverging}/{len(results)} robot(s) diverge from their target use case.")
+    else:
+        logger.info(f"🎉 All {len(results)} robot(s) match their target use case.")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Deploy a full use case to the robot.")
     parser.add_argument("--ip", help="IP address of the robot.")
     parser.add_argument("--api-key", help="API key for the robot.")
-    parser.add_argument("--use-case", required=True, help="Name of the use case to deploy.")
+    parser.add_argument("--use-case", help="Name of the use case to deploy.")
     parser.add_argument("--simulate", action="store_true", help="Run in simulation mode (no robot connection).")
+    parser.add_argument("--force", action="store_true", help="Re-upload every skill and prompt, ignoring the deploy state.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum number of simultaneous REST calls.")
+    parser.add_argument("--retries", type=int, default=2, help="Retries per REST call, with exponential backoff.")
+    parser.add_argument("--rollback", action="store_true", help="Redeploy the snapshot taken before the last deploy.")
+    parser.add_argument("--prompt", help="Prompt entry file of the use case (default: Prompt/prompt.json or the only .txt).")
+    parser.add_argument("--skip-validation", action="store_true", help="Do not validate the skills before deploying.")
+    parser.add_argument("--fleet", type=Path, help="JSON inventory of robots (ip, api_key, use_case) to deploy concurrently.")
     args = parser.parse_args()
-
+    if not args.use_case and not args.rollback and not args.fleet:
+        parser.error("--use-case is required unless --rollback or --fleet is given.")
+
+    options = dict(
+        simulate=args.simulate,
+        force=args.force,
+        concurrency=args.concurrency,
+        retries=args.retries,
+        rollback=args.rollback,
+        validate=not args.skip_validation,
+    )
     try:
-        asyncio.run(deploy_use_case(args.ip, args.api_key, args.use_case, simulate=args.simulate))
+        if args.fleet:
+            results = asyncio.run(deploy_fleet(load_inventory(args.fleet), **options))
+            log_fleet_report(results)
+            if any(r.diverges for r in results):
+                sys.exit(2)
+        else:
+            asyncio.run(deploy_use_case(args.ip, args.api_key, args.use_case, prompt_variant=args.prompt, **options))
     except KeyboardInterrupt:
         logger.warning("Deployment interrupted by user.")
         sys.exit(1)
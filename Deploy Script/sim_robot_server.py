@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for the robot's skill-file REST API, to run and benchmark deploys
+without a robot.
+
+Serves the same routes as the robot (those used by pymirokai's RestAPI):
+    GET    /status
+    GET    /api/<version>/auth/              (X-API-Key header)
+    POST   /api/<version>/skill/upload/      (multipart field "skill")
+    GET    /api/<version>/skill/list/
+    PATCH  /api/<version>/skill/enable/      ({"command": name, "value": bool})
+    DELETE /api/<version>/skill/remove/?skill_name=<name>
+plus, for the deploy script only:
+    POST   /api/<version>/prompt/            ({"prompt": text}; a mission on the real robot)
+    GET    /sim/stats                        (request counts, bytes, injected errors)
+
+Latency, upload bandwidth and error rate are configurable. Files are stored on disk
+(--storage), so the "robot" keeps its skills between runs like a real one.
+
+Usage:
+    python sim_robot_server.py --port 8765 --latency 80 --bandwidth 500 --error-rate 0.05
+    python sim_robot_server.py --robots 3            # ports 8765, 8766, 8767 for --fleet tests
+    python deploy_use_case.py --ip http://127.0.0.1:8765 --api-key admin --use-case "Base Demo"
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import secrets
+import shutil
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import unquote
+
+from aiohttp import web
+
+API_VERSION = "v1"
+DISABLED_PREFIX = "disabled."
+
+logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+logger = logging.getLogger("sim_robot")
+
+
+class SimRobotServer:
+    def __init__(
+        self,
+        storage: Path,
+        api_key: str = "admin",
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        bandwidth: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = None,
+    ):
+        """`latency`/`jitter` in seconds, `bandwidth` in bytes/s (0 = unlimited)."""
+        self.skills_dir = storage / "skills"
+        self.prompt_file = storage / "prompt.txt"
+        self.skills_dir.mkdir(parents=True, exist_ok=True)
+        self.api_key = api_key
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.tokens = set()
+        self.stats = Counter()
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._simulate], client_max_size=64 * 1024 * 1024)
+        base = f"/api/{API_VERSION}"
+        app.router.add_get("/status", self.status)
+        app.router.add_get(f"{base}/auth/", self.auth)
+        app.router.add_post(f"{base}/skill/upload/", self.upload)
+        app.router.add_get(f"{base}/skill/list/", self.list_skills)
+        app.router.add_patch(f"{base}/skill/enable/", self.enable)
+        app.router.add_delete(f"{base}/skill/remove/", self.remove)
+        app.router.add_post(f"{base}/prompt/", self.update_prompt)
+        app.router.add_get("/sim/stats", self.get_stats)
+        return app
+
+    # === Network conditions ===
+    @web.middleware
+    async def _simulate(self, request: web.Request, handler):
+        if request.path in ("/status", "/sim/stats"):
+            return await handler(request)
+        self.stats[f"{request.method} {request.path}"] += 1
+        await asyncio.sleep(max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter)))
+
+        if request.path != f"/api/{API_VERSION}/auth/":
+            token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+            if token not in self.tokens:
+                return web.json_response({"status": "error", "msg": "invalid token"}, status=401)
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats["injected_errors"] += 1
+            # Drain the body first, as a real server that fails after receiving it
+            await request.read()
+            return web.json_response({"status": "error", "msg": "simulated failure"}, status=503)
+        return await handler(request)
+
+    async def _throttle(self, size: int) -> None:
+        self.stats["bytes_in"] += size
+        if self.bandwidth:
+            await asyncio.sleep(size / self.bandwidth)
+
+    # === Routes ===
+    async def status(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    async def auth(self, request: web.Request) -> web.Response:
+        if request.headers.get("X-API-Key") != self.api_key:
+            return web.json_response({"status": "error", "msg": "invalid API key"}, status=401)
+        token = secrets.token_hex(16)
+        self.tokens.add(token)
+        return web.json_response({"client_id": f"sim-{len(self.tokens)}", "access_level": "ADMIN", "token": token})
+
+    def _find(self, name: str) -> Path:
+        """Skill file for a name given with or without ".py" / "disabled." prefix."""
+        name = Path(name).name.removeprefix(DISABLED_PREFIX)
+        for candidate in (name, f"{name}.py", DISABLED_PREFIX + name, f"{DISABLED_PREFIX}{name}.py"):
+            if (self.skills_dir / candidate).is_file():
+                return self.skills_dir / candidate
+        raise web.HTTPNotFound(text=f"skill {name} not found")
+
+    async def upload(self, request: web.Request) -> web.Response:
+        reader = await request.multipart()
+        field = await reader.next()
+        if field is None or field.name != "skill" or not field.filename:
+            return web.json_response({"status": "error", "msg": "missing 'skill' file"}, status=400)
+        data = await field.read()
+        await self._throttle(len(data))
+        # aiohttp's FormData percent-encodes the filename ("shake (1).py" → "shake%20%281%29.py")
+        name = Path(unquote(field.filename)).name
+        # Replacing a skill: drop a disabled copy of the same file
+        (self.skills_dir / (DISABLED_PREFIX + name)).unlink(missing_ok=True)
+        (self.skills_dir / name).write_bytes(data)
+        return web.json_response({"message": f"Skill uploaded successfully ({name})"})
+
+    async def list_skills(self, request: web.Request) -> web.Response:
+        return web.json_response({"skills": sorted(p.name for p in self.skills_dir.iterdir() if p.is_file())})
+
+    async def enable(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        path = self._find(body["command"])
+        name = path.name.removeprefix(DISABLED_PREFIX)
+        target = self.skills_dir / (name if body.get("value") else DISABLED_PREFIX + name)
+        path.rename(target)
+        return web.json_response({"message": f"Skill {name} {'enabled' if body.get('value') else 'disabled'}"})
+
+    async def remove(self, request: web.Request) -> web.Response:
+        path = self._find(request.query.get("skill_name", ""))
+        path.unlink()
+        return web.json_response({"status": "removed", "name": path.name})
+
+    async def update_prompt(self, request: web.Request) -> web.Response:
+        raw = await request.read()
+        await self._throttle(len(raw))
+        self.prompt_file.write_text((await request.json())["prompt"], encoding="utf-8")
+        return web.json_response({"message": "Prompt updated"})
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+
+async def serve(args) -> None:
+    runners = []
+    for i in range(args.robots):
+        port = args.port + i
+        storage = args.storage / str(port)
+        if args.reset:
+            shutil.rmtree(storage, ignore_errors=True)
+        server = SimRobotServer(
+            storage,
+            api_key=args.api_key,
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            bandwidth=args.bandwidth * 1024,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        runner = web.AppRunner(server.app(), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, args.host, port).start()
+        runners.append(runner)
+        logger.info(f"🤖 Simulated robot on http://{args.host}:{port} (storage: {storage})")
+
+    start = time.monotonic()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        logger.info(f"Stopped after {time.monotonic() - start:.0f}s.")
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated robot REST server for deploy tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--robots", type=int, default=1, help="Number of robots (consecutive ports).")
+    parser.add_argument("--api-key", default="admin")
+    parser.add_argument("--latency", type=float, default=50, help="Per-request latency (ms).")
+    parser.add_argument("--jitter", type=float, default=20, help="Latency jitter (± ms).")
+    parser.add_argument("--bandwidth", type=float, default=0, help="Upload bandwidth (KB/s, 0 = unlimited).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 503.")
+    parser.add_argument("--seed", type=int, help="Random seed, for reproducible error patterns.")
+    parser.add_argument(
+        "--storage", type=Path, default=Path(__file__).resolve().parent / ".sim_robot", help="Where skills are kept."
+    )
+    parser.add_argument("--reset", action="store_true", help="Start with an empty robot.")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
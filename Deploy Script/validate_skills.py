@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Validate the Custom Skills of a Use Case before deploying them.
+
+For every skill file:
+- compile it (syntax errors),
+- check each @skill() function: async, verbal_descriptions, parameters vs signature,
+- report local variables that can be read before being assigned (e.g. only set in an except),
+- measure module size and import time (when pymirokai is installed locally).
+
+No network access: deploy_use_case.py runs this before connecting to any robot.
+
+Usage:
+    python validate_skills.py --use-case "Base Demo"
+"""
+
+import argparse
+import ast
+import importlib.util
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger("deploy")
+
+MAX_MODULE_KB = 256
+MAX_IMPORT_SECONDS = 1.0
+
+
+@dataclass
+class SkillReport:
+    file: Path
+    skills: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    size: int = 0
+    import_time: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def helper(self) -> bool:
+        """A module without @skill() (shared code): uploaded next to the skills, never enabled."""
+        return self.ok and not self.skills
+
+
+# === Decorator Metadata ===
+def _skill_decorator(func: ast.AST) -> Optional[ast.Call]:
+    for deco in getattr(func, "decorator_list", []):
+        target = deco.func if isinstance(deco, ast.Call) else deco
+        name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", None)
+        if name == "skill":
+            return deco if isinstance(deco, ast.Call) else ast.Call(func=deco, args=[], keywords=[])
+    return None
+
+
+def _check_verbal_descriptions(node: Optional[ast.expr], skill: str, report: SkillReport) -> None:
+    if node is None:
+        report.errors.append(f"{skill}: @skill() has no verbal_descriptions")
+        return
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        report.warnings.append(f"{skill}: verbal_descriptions is not a literal, not checked")
+        return
+    if not isinstance(value, dict) or not value:
+        report.errors.append(f"{skill}: verbal_descriptions must be a non-empty {{locale: [sentences]}} dict")
+        return
+    for locale, sentences in value.items():
+        sentences = [sentences] if isinstance(sentences, str) else sentences
+        if not isinstance(sentences, (list, tuple)) or not sentences:
+            report.errors.append(f"{skill}: verbal_descriptions[{locale!r}] is empty")
+        elif not all(isinstance(s, str) and s.strip() for s in sentences):
+            report.errors.append(f"{skill}: verbal_descriptions[{locale!r}] contains an empty or non-text entry")
+
+
+def _check_parameters(node: Optional[ast.expr], func: ast.AsyncFunctionDef, skill: str, report: SkillReport) -> None:
+    args = [a.arg for a in func.args.args + func.args.kwonlyargs][1:]  # first one is the robot
+    if node is None:
+        described: Set[str] = set()
+    elif not isinstance(node, (ast.List, ast.Tuple)):
+        report.warnings.append(f"{skill}: parameters is not a literal list, not checked")
+        return
+    else:
+        described = set()
+        for item in node.elts:
+            if not (isinstance(item, ast.Call) and getattr(item.func, "id", None) == "ParameterDescription"):
+                report.errors.append(f"{skill}: parameters must only contain ParameterDescription(...)")
+                continue
+            name = next((kw.value for kw in item.keywords if kw.arg == "name"), item.args[0] if item.args else None)
+            if not isinstance(name, ast.Constant) or not isinstance(name.value, str):
+                report.warnings.append(f"{skill}: ParameterDescription name is not a literal, not checked")
+                continue
+            if name.value not in args:
+                report.errors.append(f"{skill}: parameter {name.value!r} is described but not in the signature")
+            described.add(name.value)
+    for arg in args:
+        if arg not in described:
+            report.warnings.append(f"{skill}: argument {arg!r} has no ParameterDescription")
+
+
+# === Read-before-assignment ===
+def _stored(node: ast.AST) -> Set[str]:
+    """Names bound by a statement, without entering nested scopes."""
+    names = set()
+    for child in _walk_scope(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            names.add(child.id)
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and child is not node:
+            names.add(child.name)
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            names.update((a.asname or a.name).split(".")[0] for a in child.names)
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            names.add(child.name)
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        names.add(node.name)
+    return names
+
+
+def _walk_scope(node: ast.AST):
+    """ast.walk() that does not descend into nested functions, classes, lambdas or comprehensions."""
+    todo = [node]
+    while todo:
+        current = todo.pop()
+        yield current
+        for child in ast.iter_child_nodes(current):
+            if isinstance(child, (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)):
+                continue
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                yield child
+                continue
+            todo.append(child)
+
+
+class _UnboundReads:
+    """Minimal definite-assignment analysis over one function body.
+
+    `None` stands for "this path never gets here" (return/raise/break/continue),
+    which is neutral when paths are merged. The state at each `break` is kept for
+    the code after its loop.
+    """
+
+    def __init__(self, func: ast.AsyncFunctionDef):
+        self.local = _stored(func) - {func.name}
+        self.found: Dict[str, int] = {}
+        self.breaks: List[List[Set[str]]] = []  # one list per enclosing loop
+        args = func.args
+        params = {a.arg for a in args.posonlyargs + args.args + args.kwonlyargs}
+        params |= {a.arg for a in (args.vararg, args.kwarg) if a}
+        self.block(func.body, params)
+
+    def reads(self, node: Optional[ast.AST], assigned: Set[str]) -> None:
+        if node is None:
+            return
+        for child in _walk_scope(node):
+            if (
+                isinstance(child, ast.Name)
+                and isinstance(child.ctx, ast.Load)
+                and child.id in self.local
+                and child.id not in assigned
+            ):
+                self.found.setdefault(child.id, child.lineno)
+
+    @staticmethod
+    def merge(*paths: Optional[Set[str]]) -> Optional[Set[str]]:
+        live = [p for p in paths if p is not None]
+        return set.intersection(*live) if live else None
+
+    def block(self, body: List[ast.stmt], assigned: Optional[Set[str]]) -> Optional[Set[str]]:
+        for stmt in body:
+            if assigned is None:
+                return None
+            assigned = self.stmt(stmt, set(assigned))
+        return assigned
+
+    def stmt(self, stmt: ast.stmt, assigned: Set[str]) -> Optional[Set[str]]:
+        if isinstance(stmt, (ast.Return, ast.Raise)):
+            self.reads(stmt, assigned)
+            return None
+        if isinstance(stmt, ast.Break):
+            if self.breaks:
+                self.breaks[-1].append(assigned)
+            return None
+        if isinstance(stmt, ast.Continue):
+            return None
+        if isinstance(stmt, ast.If):
+            self.reads(stmt.test, assigned)
+            return self.merge(self.block(stmt.body, assigned), self.block(stmt.orelse, assigned))
+        if isinstance(stmt, (ast.For, ast.AsyncFor, ast.While)):
+            head = stmt.iter if isinstance(stmt, (ast.For, ast.AsyncFor)) else stmt.test
+            self.reads(head, assigned)
+            loop = assigned | (_stored(stmt.target) if isinstance(stmt, (ast.For, ast.AsyncFor)) else set())
+            self.breaks.append([])
+            self.block(stmt.body, loop)
+            breaks = self.breaks.pop()
+            if isinstance(stmt, ast.While) and isinstance(stmt.test, ast.Constant) and stmt.test.value:
+                # `while True`: only left through a break, after what the body assigned before it
+                return self.merge(*breaks)
+            # Otherwise the body may run zero times: the else branch or a break
+            return self.merge(self.block(stmt.orelse, assigned), *breaks)
+        if isinstance(stmt, (ast.With, ast.AsyncWith)):
+            for item in stmt.items:
+                self.reads(item.context_expr, assigned)
+                if item.optional_vars is not None:
+                    assigned |= _stored(item.optional_vars)
+            return self.block(stmt.body, assigned)
+        if isinstance(stmt, ast.Try) or type(stmt).__name__ == "TryStar":
+            success = self.block(stmt.body, assigned)
+            success = self.block(stmt.orelse, success) if success is not None else None
+            # A handler may start anywhere in the body: only what was assigned before is certain
+            handlers = [self.block(h.body, assigned | ({h.name} if h.name else set())) for h in stmt.handlers]
+            after = self.merge(success, *handlers)
+            if stmt.finalbody:
+                self.block(stmt.finalbody, assigned)
+                if after is not None:
+                    after |= _stored(ast.Module(body=stmt.finalbody, type_ignores=[]))
+            return after
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            for deco in stmt.decorator_list:
+                self.reads(deco, assigned)
+            return assigned | {stmt.name}
+        if isinstance(stmt, ast.Match):
+            self.reads(stmt.subject, assigned)
+            return self.merge(*(self.block(case.body, assigned | _stored(case.pattern)) for case in stmt.cases))
+        self.reads(stmt, assigned)
+        return assigned | _stored(stmt)
+
+
+# === File Checks ===
+def _measure_import(path: Path, report: SkillReport) -> None:
+    spec = importlib.util.spec_from_file_location(f"_skill_check_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    start = time.perf_counter()
+    try:
+        spec.loader.exec_module(module)
+    except ModuleNotFoundError as e:
+        report.warnings.append(f"import time not measured: {e}")
+        return
+    except Exception as e:
+        report.errors.append(f"import failed: {type(e).__name__}: {e}")
+        return
+    report.import_time = time.perf_counter() - start
+    if report.import_time > MAX_IMPORT_SECONDS:
+        report.warnings.append(f"slow import ({report.import_time:.2f}s > {MAX_IMPORT_SECONDS}s)")
+
+
+def validate_skill_file(path: Path, measure_import: bool = True) -> SkillReport:
+    report = SkillReport(path, size=path.stat().st_size)
+    if report.size > MAX_MODULE_KB * 1024:
+        report.warnings.append(f"large module ({report.size / 1024:.0f} KB > {MAX_MODULE_KB} KB)")
+
+    source = path.read_text(encoding="utf-8")
+    try:
+        tree = ast.parse(source, filename=path.name)
+        compile(tree, path.name, "exec")
+    except SyntaxError as e:
+        report.errors.append(f"line {e.lineno}: {e.msg}")
+        return report
+
+    for func in ast.walk(tree):
+        deco = _skill_decorator(func)
+        if deco is None:
+            continue
+        name = func.name
+        report.skills.append(name)
+        if not isinstance(func, ast.AsyncFunctionDef):
+            report.errors.append(f"{name}: a skill must be an async function")
+            continue
+        kwargs = {kw.arg: kw.value for kw in deco.keywords}
+        _check_verbal_descriptions(kwargs.get("verbal_descriptions", deco.args[0] if deco.args else None), name, report)
+        _check_parameters(kwargs.get("parameters", deco.args[1] if len(deco.args) > 1 else None), func, name, report)
+        for var, line in _UnboundReads(func).found.items():
+            report.errors.append(f"{name}: line {line}: {var!r} may be used before assignment")
+
+    if measure_import and report.ok:
+        _measure_import(path, report)
+    return report
+
+
+def is_helper(path: Path) -> bool:
+    """True for a module of Skills/ that defines no @skill() function (see SkillReport.helper)."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=path.name)
+    except SyntaxError:
+        return False
+    return not any(_skill_decorator(node) for node in ast.walk(tree))
+
+
+def validate_skills(skills_path: Path, measure_import: bool = True) -> List[SkillReport]:
+    """Validate every skill of a folder, log the results and return the reports."""
+    if measure_import and importlib.util.find_spec("pymirokai") is None:
+        # Every skill imports the SDK: say it once instead of once per skill
+        logger.warning("pymirokai is not installed: import times are not measured.")
+        measure_import = False
+    reports = [validate_skill_file(f, measure_import) for f in sorted(skills_path.glob("*.py"))]
+
+    owners: Dict[str, str] = {}
+    for report in reports:
+        for name in report.skills:
+            # The robot registers skills by function name: a duplicate silently replaces the other one
+            if name in owners:
+                report.errors.append(f"{name}: skill name already defined in {owners[name]}")
+            owners.setdefault(name, report.file.name)
+
+    for report in reports:
+        timing = f", import {report.import_time * 1000:.0f} ms" if report.import_time is not None else ""
+        summary = f"{report.file.name} ({report.size / 1024:.1f} KB{timing})"
+        if report.ok:
+            logger.info(f"✓ {summary}: {', '.join(report.skills) or 'helper (uploaded, not enabled)'}")
+        else:
+            logger.error(f"❌ {summary}")
+        for error in report.errors:
+            logger.error(f"    {error}")
+        for warning in report.warnings:
+            logger.warning(f"    {warning}")
+    return reports
+
+
+def main():
+    import coloredlogs
+
+    coloredlogs.install(level="INFO", fmt="[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Validate the Custom Skills of a use case without deploying them.")
+    parser.add_argument("--use-case", required=True, help="Name of the use case to check.")
+    parser.add_argument("--no-import", action="store_true", help="Skip the import-time measurement.")
+    args = parser.parse_args()
+
+    skills_path = Path(__file__).resolve().parents[1] / "Use cases" / args.use_case / "Skills"
+    reports = validate_skills(skills_path, measure_import=not args.no_import)
+    failed = [r for r in reports if not r.ok]
+    logger.info(f"{len(reports) - len(failed)}/{len(reports)} skill file(s) valid.")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
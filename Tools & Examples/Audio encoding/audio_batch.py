@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch audio preparation for Mirokai skills.
+
+Processes every clip of a folder in parallel:
+- downmix to mono and resample to the robot's playback rate,
+- loudness normalization to a target LUFS, with a peak ceiling instead of clipping,
+- encode to FLAC (default), Opus or WAV,
+- write manifest.json (duration, loudness, gain, size, SHA-256 per clip).
+
+The output folder is meant to be a use case's Assets/ folder: deploy_use_case.py
+uploads it next to the skills, which load clips by name and hash.
+
+Usage:
+    python audio_batch.py raw_clips/ "../../Use cases/Base Demo/Assets"
+    python audio_batch.py raw_clips/ out/ --codec opus --lufs -14
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import soundfile as sf
+
+try:
+    import pyloudnorm as pyln
+except ImportError:
+    pyln = None
+
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
+
+# === Configuration ===
+ROBOT_SAMPLE_RATE = 44100
+TARGET_LUFS = -16.0
+PEAK_CEILING_DB = -1.0
+INPUT_SUFFIXES = {".wav", ".flac", ".ogg", ".opus", ".aif", ".aiff", ".mp3"}
+CODECS = {
+    # name: (soundfile format, subtype, extension)
+    "flac": ("FLAC", "PCM_16", ".flac"),
+    "opus": ("OGG", "OPUS", ".opus"),
+    "wav": ("WAV", "PCM_16", ".wav"),
+}
+OPUS_RATES = (8000, 12000, 16000, 24000, 48000)
+MANIFEST = "manifest.json"
+
+logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+logger = logging.getLogger("audio_batch")
+
+
+# === DSP ===
+def resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    if src_rate == dst_rate:
+        return audio
+    if resample_poly is not None:
+        g = math.gcd(src_rate, dst_rate)
+        return resample_poly(audio, dst_rate // g, src_rate // g).astype(np.float32)
+    # Fallback without scipy: linear interpolation
+    n_out = int(round(len(audio) * dst_rate / src_rate))
+    t_out = np.arange(n_out, dtype=np.float64) * (src_rate / dst_rate)
+    return np.interp(t_out, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def measure_loudness(audio: np.ndarray, rate: int) -> float:
+    """Integrated loudness in LUFS (BS.1770 with pyloudnorm, gated RMS approximation otherwise)."""
+    if pyln is not None and len(audio) >= int(0.4 * rate):
+        return float(pyln.Meter(rate).integrated_loudness(audio))
+
+    # 400 ms blocks, 75% overlap, absolute gate -70 LUFS then relative gate -10 LU
+    block, hop = int(0.4 * rate), int(0.1 * rate)
+    if len(audio) < block:
+        powers = np.array([np.mean(audio.astype(np.float64) ** 2)])
+    else:
+        frames = np.lib.stride_tricks.sliding_window_view(audio, block)[::hop]
+        powers = np.mean(frames.astype(np.float64) ** 2, axis=1)
+    with np.errstate(divide="ignore"):
+        levels = -0.691 + 10 * np.log10(powers)
+    gated = powers[levels > -70.0]
+    if not gated.size:
+        return -math.inf
+    relative = -0.691 + 10 * np.log10(gated.mean()) - 10.0
+    with np.errstate(divide="ignore"):
+        gated = gated[-0.691 + 10 * np.log10(gated) > relative]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+# === Per-clip Job (runs in a worker process) ===
+def process_clip(src: Path, out_dir: Path, codec: str, rate: int, target_lufs: float) -> Dict[str, Any]:
+    start = time.perf_counter()
+    data, src_rate = sf.read(str(src), dtype="float32", always_2d=True)
+    audio = resample(data.mean(axis=1), src_rate, rate)
+
+    loudness = measure_loudness(audio, rate)
+    gain_db = target_lufs - loudness if math.isfinite(loudness) else 0.0
+    peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+    ceiling = 10 ** (PEAK_CEILING_DB / 20)
+    limited = peak > 0 and peak * 10 ** (gain_db / 20) > ceiling
+    if limited:
+        # Stay under the ceiling rather than clipping: the clip ends up a bit quieter than the target
+        gain_db = 20 * math.log10(ceiling / peak)
+    audio = audio * np.float32(10 ** (gain_db / 20))
+
+    fmt, subtype, suffix = CODECS[codec]
+    dest = out_dir / f"{src.stem}{suffix}"
+    sf.write(str(dest), audio, rate, format=fmt, subtype=subtype)
+
+    return {
+        "file": dest.name,
+        "source": src.name,
+        "source_sha256": file_hash(src),
+        "sha256": file_hash(dest),
+        "bytes": dest.stat().st_size,
+        "duration": round(len(audio) / rate, 3),
+        "sample_rate": rate,
+        "channels": 1,
+        "codec": codec,
+        "loudness_in": round(loudness, 2) if math.isfinite(loudness) else None,
+        "gain_db": round(gain_db, 2),
+        "peak_limited": limited,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+# === Batch ===
+def load_manifest(out_dir: Path) -> Dict[str, Any]:
+    path = out_dir / MANIFEST
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        logger.warning(f"Ignoring unreadable {path}")
+        return {}
+
+
+def run_batch(
+    in_dir: Path,
+    out_dir: Path,
+    codec: str = "flac",
+    rate: int = ROBOT_SAMPLE_RATE,
+    target_lufs: float = TARGET_LUFS,
+    workers: int = 0,
+    force: bool = False,
+) -> Dict[str, Any]:
+    if codec == "opus" and rate not in OPUS_RATES:
+        logger.warning(f"Opus does not support {rate} Hz, using 48000 Hz.")
+        rate = 48000
+    if in_dir.resolve() == out_dir.resolve():
+        raise OSError("Input and output folders must differ (sources would be overwritten)")
+    sources = sorted(f for f in in_dir.iterdir() if f.suffix.lower() in INPUT_SUFFIXES)
+    if not sources:
+        raise FileNotFoundError(f"No audio file found in {in_dir}")
+    # Outputs and manifest entries are named after the stem: hello.wav and hello.mp3 would collide
+    stems: Dict[str, List[str]] = {}
+    for src in sources:
+        stems.setdefault(src.stem.casefold(), []).append(src.name)
+    duplicates = [" / ".join(names) for names in stems.values() if len(names) > 1]
+    if duplicates:
+        raise OSError(f"Clips with the same name would overwrite each other: {', '.join(duplicates)}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    settings = {"codec": codec, "sample_rate": rate, "channels": 1, "target_lufs": target_lufs}
+    previous = load_manifest(out_dir)
+    reuse = previous.get("settings") == settings and not force
+    old_clips = {c["source"]: c for c in previous.get("clips", {}).values()} if reuse else {}
+
+    clips: Dict[str, Dict[str, Any]] = {}
+    todo = []
+    for src in sources:
+        old = old_clips.get(src.name)
+        if old and (out_dir / old["file"]).exists() and old["source_sha256"] == file_hash(src):
+            clips[Path(old["file"]).stem] = old
+        else:
+            todo.append(src)
+    logger.info(f"{len(todo)} clip(s) to process, {len(clips)} unchanged.")
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        jobs = {pool.submit(process_clip, src, out_dir, codec, rate, target_lufs): src for src in todo}
+        for job in as_completed(jobs):
+            src = jobs[job]
+            try:
+                clip = job.result()
+            except Exception as e:
+                logger.error(f"❌ {src.name}: {e}")
+                failed.append(src.name)
+                continue
+            clips[Path(clip["file"]).stem] = clip
+            logger.info(
+                f"✓ {src.name} → {clip['file']} ({clip['duration']:.2f}s, {clip['bytes'] / 1024:.0f} KB, "
+                f"{clip['gain_db']:+.1f} dB{', peak limited' if clip['peak_limited'] else ''})"
+            )
+
+    manifest = {"settings": settings, "clips": dict(sorted(clips.items()))}
+    (out_dir / MANIFEST).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    # A codec change leaves the previous encoding of a clip behind (hello.flac next to hello.opus)
+    for stem, old in previous.get("clips", {}).items():
+        if stem in clips and clips[stem]["file"] != old["file"]:
+            (out_dir / old["file"]).unlink(missing_ok=True)
+            logger.info(f"Removed {old['file']} (superseded by {clips[stem]['file']})")
+    if failed:
+        raise RuntimeError(f"{len(failed)} clip(s) failed: {', '.join(failed)}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalize, resample and encode a folder of audio clips.")
+    parser.add_argument("input", type=Path, help="Folder of source clips.")
+    parser.add_argument("output", type=Path, help="Output folder (e.g. a use case's Assets/).")
+    parser.add_argument("--codec", choices=sorted(CODECS), default="flac", help="Output codec.")
+    parser.add_argument("--rate", type=int, default=ROBOT_SAMPLE_RATE, help="Output sample rate (Hz).")
+    parser.add_argument("--lufs", type=float, default=TARGET_LUFS, help="Target integrated loudness.")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: one per CPU).")
+    parser.add_argument("--force", action="store_true", help="Re-encode every clip, even unchanged ones.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        manifest = run_batch(args.input, args.output, args.codec, args.rate, args.lufs, args.workers, args.force)
+    except (OSError, RuntimeError) as e:
+        logger.error(str(e))
+        sys.exit(1)
+    total = sum(c["duration"] for c in manifest["clips"].values())
+    size = sum(c["bytes"] for c in manifest["clips"].values())
+    logger.info(
+        f"✅ {len(manifest['clips'])} clip(s), {total:.1f}s of audio, {size / 1024:.0f} KB "
+        f"written to {args.output / MANIFEST} in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Non-blocking audio playback for skills.
+
+    player = AudioPlayer()
+    clip = player.play("arabic_hello.flac")       # returns immediately, like robot.say()
+    say = robot.say("Listen to this!")             # runs at the same time
+    await clip.started()                           # clip.latency = seconds until sound starts
+    await clip.completed()                         # or clip.cancel()
+
+Backends:
+- "sounddevice": decoded PCM is streamed in-process (PortAudio). Decoding happens once
+  per file (cached), starting a clip costs a few ms and cancel is immediate.
+- "subprocess": fallback when sounddevice/soundfile are missing; runs SoX `play` (or
+  `aplay` for WAV) asynchronously, so the event loop is never blocked.
+
+Copy this file next to the skills that use it (Skills/ folder of the use case) so
+deploy_use_case.py uploads it with them.
+"""
+
+import asyncio
+import functools
+import logging
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Set, Union
+
+try:
+    import sounddevice as sd
+    import soundfile as sf
+except (ImportError, OSError):  # OSError: PortAudio library missing
+    sd = None
+
+logger = logging.getLogger("audio_player")
+
+
+@functools.lru_cache(maxsize=16)
+def load_pcm(path: str):
+    """Decode a file once into a read-only float32 array (frames × channels)."""
+    data, samplerate = sf.read(path, dtype="float32", always_2d=True)
+    data.flags.writeable = False
+    return data, samplerate
+
+
+class Playback:
+    """A clip being played. Mirrors the Mission API: started(), completed(), cancel()."""
+
+    def __init__(self, player: "AudioPlayer", path: Path):
+        self.player = player
+        self.path = path
+        self.requested = time.perf_counter()
+        self.latency: Optional[float] = None
+        loop = asyncio.get_running_loop()
+        self._started = loop.create_future()
+        self._done = loop.create_future()
+        self._cancel = None
+        self.cancelled = False  # also seen by a backend that has not started the clip yet
+
+    async def started(self, ignore_exceptions: bool = False) -> float:
+        """Wait until sound starts (or the clip fails); return the latency in seconds.
+
+        `ignore_exceptions` is accepted for Mission compatibility: playback never raises.
+        """
+        return await asyncio.shield(self._started)
+
+    async def completed(self, ignore_exceptions: bool = False) -> bool:
+        """Wait until the clip ends; return False if it was cancelled or failed."""
+        return await asyncio.shield(self._done)
+
+    def cancel(self, ignore_exceptions: bool = False) -> None:
+        if self._done.done():
+            return
+        self.cancelled = True
+        if self._cancel is not None:
+            self._cancel()
+
+    def done(self) -> bool:
+        return self._done.done()
+
+    # --- Called by the backends, possibly from another thread ---
+    def _mark_started(self) -> None:
+        if not self._started.done():
+            self.latency = time.perf_counter() - self.requested
+            self._started.set_result(self.latency)
+            logger.debug(f"{self.path.name}: started after {self.latency * 1000:.1f} ms")
+
+    def _finish(self, ok: bool, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            logger.error(f"{self.path.name}: {error}")
+        self._mark_started()
+        if not self._done.done():
+            self._done.set_result(ok)
+        self.player._playing.discard(self)
+
+
+class AudioPlayer:
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = backend or ("sounddevice" if sd is not None else "subprocess")
+        self._playing: Set[Playback] = set()
+
+    def play(self, path: Union[str, Path]) -> Playback:
+        """Start playing a file and return at once. Must be called from the event loop."""
+        playback = Playback(self, Path(path))
+        self._playing.add(playback)
+        if self.backend == "sounddevice":
+            self._play_stream(playback)
+        else:
+            asyncio.ensure_future(self._play_process(playback))
+        return playback
+
+    def cancel_all(self) -> None:
+        for playback in list(self._playing):
+            playback.cancel()
+
+    def preload(self, path: Union[str, Path]) -> None:
+        """Decode a clip ahead of time (sounddevice backend) so its first play starts fast."""
+        if self.backend == "sounddevice":
+            load_pcm(str(path))
+
+    # === Backends ===
+    def _play_stream(self, playback: Playback) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            data, samplerate = load_pcm(str(playback.path))
+        except Exception as e:
+            playback._finish(False, e)
+            return
+        position = 0
+        cancelled = threading.Event()
+
+        def callback(outdata, frames, time_info, status):
+            nonlocal position
+            if position == 0:
+                loop.call_soon_threadsafe(playback._mark_started)
+            chunk = data[position:position + frames]
+            outdata[:len(chunk)] = chunk
+            outdata[len(chunk):] = 0
+            position += len(chunk)
+            if position >= len(data):
+                raise sd.CallbackStop
+
+        def finalize():
+            stream.close()
+            playback._finish(not cancelled.is_set())
+
+        def finished():
+            # PortAudio thread: the stream is closed from the event loop
+            loop.call_soon_threadsafe(finalize)
+
+        def cancel():
+            cancelled.set()
+            stream.abort()
+
+        stream = None
+        try:
+            stream = sd.OutputStream(
+                samplerate=samplerate,
+                channels=data.shape[1],
+                dtype="float32",
+                callback=callback,
+                finished_callback=finished,
+            )
+            playback._cancel = cancel
+            stream.start()
+        except Exception as e:  # no output device, PortAudioError…
+            playback._cancel = None
+            if stream is not None:
+                stream.close()
+            playback._finish(False, e)
+            return
+
+    async def _play_process(self, playback: Playback) -> None:
+        path = playback.path
+        if not path.exists():
+            playback._finish(False, FileNotFoundError(f"{path} not found"))
+            return
+        if shutil.which("play"):
+            cmd = ["play", "-q", str(path)]
+        elif path.suffix == ".wav" and shutil.which("aplay"):
+            cmd = ["aplay", "-q", str(path)]
+        else:
+            playback._finish(False, FileNotFoundError("No audio player found (install sox or sounddevice)"))
+            return
+
+        # Cancelled (cancel_all() on a new ASR…) before the task got to run
+        if playback.cancelled:
+            playback._finish(False)
+            return
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            playback._finish(False, e)
+            return
+
+        def cancel():
+            if proc.returncode is None:
+                proc.terminate()
+
+        playback._cancel = cancel
+        # Cancelled while the process was being spawned
+        if playback.cancelled:
+            cancel()
+        else:
+            # The process start is the best "sound started" signal available here
+            playback._mark_started()
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0 and not playback.cancelled:
+            logger.error(f"{cmd[0]} failed ({proc.returncode}): {stderr.decode(errors='replace').strip()}")
+        playback._finish(proc.returncode == 0 and not playback.cancelled)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pre-rendered stock phrases (fillers, greetings, jokes…) played without a TTS round-trip.
+
+    PHRASES = PhraseCache(voice="en-us")
+    await PHRASES.follow_robot(robot)         # drop clips if the robot's character/language changed
+    await PHRASES.prerender(FILLERS)          # at startup (or ahead of time with the CLI)
+    speech = PHRASES.say(robot, "Hmm…")       # cached clip → AudioPlayer, otherwise robot.say()
+    await speech.started()
+    await speech.completed()
+
+Rendering uses a local TTS engine, found on PATH: piper (voice = .onnx model) or espeak-ng
+(voice = language code). Pick a voice close to the robot's: the cache only removes the
+TTS round-trip, it cannot reproduce the robot's own voice. A phrase that is not cached
+yet is said with robot.say() and rendered in the background for the next time.
+
+Cache: one WAV per (engine, voice, text) in cache_dir, listed in index.json in LRU order
+and bounded to max_entries. Changing the engine voice (set_voice) or the robot's
+character/language (follow_robot) empties it.
+
+Copy this file and audio_player.py next to the skills that use it.
+
+Usage (warm the cache on the robot, e.g. after a deploy):
+    python phrase_cache.py --voice en-us --phrases fillers.txt
+    python phrase_cache.py --voice en-us --from-skill "../../Use cases/KACST AI & Robotics Institute/Skills/joke.py"
+"""
+
+import argparse
+import ast
+import asyncio
+import hashlib
+import json
+import logging
+import shutil
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from audio_player import AudioPlayer
+
+# === Configuration ===
+DEFAULT_CACHE_DIR = Path("/tmp/mirokai_phrase_cache")
+MAX_ENTRIES = 128
+ENGINES = ("piper", "espeak-ng")
+INDEX = "index.json"
+RENDER_CONCURRENCY = 2
+
+logger = logging.getLogger("phrase_cache")
+
+
+def detect_engine() -> Optional[str]:
+    return next((engine for engine in ENGINES if shutil.which(engine)), None)
+
+
+async def render(engine: str, voice: str, text: str, dest: Path) -> None:
+    """Synthesize `text` to a WAV file with a local TTS engine."""
+    if engine == "piper":
+        cmd, stdin = ["piper", "--model", voice, "--output_file", str(dest)], text.encode("utf-8")
+    elif engine == "espeak-ng":
+        cmd, stdin = ["espeak-ng", "-v", voice, "-w", str(dest), text], None
+    else:
+        raise ValueError(f"Unknown TTS engine: {engine}")
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if stdin else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate(stdin)
+    if proc.returncode != 0 or not dest.exists():
+        raise RuntimeError(f"{engine} failed ({proc.returncode}): {stderr.decode(errors='replace').strip()}")
+
+
+class PhraseCache:
+    def __init__(
+        self,
+        voice: str,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        engine: Optional[str] = None,
+        max_entries: int = MAX_ENTRIES,
+        player: Optional[AudioPlayer] = None,
+    ):
+        self.engine = engine or detect_engine()
+        self.voice = voice
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.player = player or AudioPlayer()
+        self.robot_voice: Optional[str] = None  # robot character/language the clips were made for
+        self.entries: "OrderedDict[str, str]" = OrderedDict()  # key → text, least recently used first
+        self.hits = 0
+        self.misses = 0
+        self._rendering: Dict[str, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(RENDER_CONCURRENCY)
+        if self.engine is None:
+            logger.warning("No TTS engine found (piper, espeak-ng): phrases go through robot.say().")
+        self._load_index()
+
+    # === Lookup ===
+    def key(self, text: str) -> str:
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{self.engine}|{self.voice}|{normalized}".encode("utf-8")).hexdigest()[:24]
+
+    def path(self, text: str) -> Optional[Path]:
+        """Cached clip for `text`, or None."""
+        key = self.key(text)
+        path = self.cache_dir / f"{key}.wav"
+        if key not in self.entries or not path.exists():
+            return None
+        self.entries.move_to_end(key)
+        return path
+
+    def say(self, robot, text: str):
+        """Play the cached clip of `text`, or say it with the robot (and cache it).
+
+        Returns a Playback or a Mission: both have started(), completed() and cancel().
+        """
+        path = self.path(text)
+        if path is not None:
+            self.hits += 1
+            return self.player.play(path)
+        self.misses += 1
+        if self.engine is not None:
+            asyncio.ensure_future(self.render(text))
+        return robot.say(text)
+
+    # === Rendering ===
+    async def render(self, text: str) -> Optional[Path]:
+        """Render `text` once (concurrent calls share the same job); None on failure."""
+        if self.engine is None:
+            return None
+        key = self.key(text)
+        if self.path(text) is not None:
+            return self.cache_dir / f"{key}.wav"
+        if key not in self._rendering:
+            self._rendering[key] = asyncio.ensure_future(self._render(key, text))
+        try:
+            return await asyncio.shield(self._rendering[key])
+        except Exception as e:
+            logger.error(f"Could not render {text!r}: {e}")
+            return None
+
+    async def _render(self, key: str, text: str) -> Path:
+        try:
+            async with self._semaphore:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                dest = self.cache_dir / f"{key}.wav"
+                tmp = dest.with_suffix(".part.wav")
+                await render(self.engine, self.voice, text, tmp)
+                tmp.replace(dest)
+            self.entries[key] = text
+            self._evict()
+            self._save_index()
+            return dest
+        finally:
+            self._rendering.pop(key, None)
+
+    async def prerender(self, phrases: Iterable[str]) -> int:
+        """Render every phrase not cached yet; returns how many were rendered."""
+        todo = list(dict.fromkeys(p for p in phrases if p.strip() and self.path(p) is None))
+        results = await asyncio.gather(*(self.render(p) for p in todo))
+        rendered = sum(r is not None for r in results)
+        if todo:
+            logger.info(f"Rendered {rendered}/{len(todo)} phrase(s) with {self.engine} ({self.voice}).")
+        for path in results:
+            if path is not None:
+                self.player.preload(path)
+        return rendered
+
+    # === Invalidation ===
+    def set_voice(self, voice: str) -> None:
+        if voice != self.voice:
+            logger.info(f"Voice changed ({self.voice} → {voice}): phrase cache cleared.")
+            self.voice = voice
+            self.clear()
+
+    async def follow_robot(self, robot) -> None:
+        """Clear the cache if the robot's character or language changed since the clips were made."""
+        robot_voice = json.dumps([await robot.get_character_name(), await robot.get_language()], sort_keys=True)
+        if self.robot_voice is not None and robot_voice != self.robot_voice:
+            logger.info("Robot character/language changed: phrase cache cleared.")
+            self.clear()
+        self.robot_voice = robot_voice
+        self._save_index()
+
+    def clear(self) -> None:
+        for key in self.entries:
+            (self.cache_dir / f"{key}.wav").unlink(missing_ok=True)
+        self.entries.clear()
+        self._save_index()
+
+    def _evict(self) -> None:
+        while len(self.entries) > self.max_entries:
+            key, _ = self.entries.popitem(last=False)
+            (self.cache_dir / f"{key}.wav").unlink(missing_ok=True)
+
+    # === Index ===
+    def _load_index(self) -> None:
+        try:
+            index = json.loads((self.cache_dir / INDEX).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if index.get("engine") != self.engine or index.get("voice") != self.voice:
+            # Made with another voice: the files are unusable, remove them
+            for key in index.get("entries", {}):
+                (self.cache_dir / f"{key}.wav").unlink(missing_ok=True)
+            return
+        self.robot_voice = index.get("robot_voice")
+        self.entries.update(
+            (key, text) for key, text in index.get("entries", {}).items() if (self.cache_dir / f"{key}.wav").exists()
+        )
+
+    def _save_index(self) -> None:
+        if not self.cache_dir.exists():
+            return
+        index = {"engine": self.engine, "voice": self.voice, "robot_voice": self.robot_voice, "entries": self.entries}
+        (self.cache_dir / INDEX).write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+# === Phrase sources for the CLI ===
+def skill_phrases(path: Path) -> List[str]:
+    """Literal phrases of a skill file: robot.say("…") arguments and lists of strings
+    (including lists of dicts such as jokes). @skill() trigger phrases are ignored."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            node.decorator_list = []
+
+    def text(node) -> Optional[str]:
+        return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+    phrases = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "attr", None) == "say" and node.args:
+            phrases.append(text(node.args[0]))
+        elif isinstance(node, (ast.List, ast.Tuple)):
+            for element in node.elts:
+                values = element.values if isinstance(element, ast.Dict) else [element]
+                phrases.extend(text(v) for v in values)
+    return list(dict.fromkeys(p for p in phrases if p and not p.isidentifier()))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Pre-render stock phrases into the phrase cache.")
+    parser.add_argument("--voice", required=True, help="piper model (.onnx) or espeak-ng voice.")
+    parser.add_argument("--engine", choices=ENGINES, help="TTS engine (default: first one installed).")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--max-entries", type=int, default=MAX_ENTRIES)
+    parser.add_argument("--phrases", type=Path, action="append", default=[], help="Text file, one phrase per line.")
+    parser.add_argument("--from-skill", type=Path, action="append", default=[], help="Skill file to take phrases from.")
+    args = parser.parse_args()
+
+    phrases = []
+    for path in args.phrases:
+        phrases += [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    for path in args.from_skill:
+        found = skill_phrases(path)
+        logger.info(f"{path.name}: {len(found)} phrase(s)")
+        phrases += found
+    if not phrases:
+        parser.error("no phrase given (--phrases / --from-skill)")
+
+    async def run() -> int:
+        cache = PhraseCache(args.voice, args.cache_dir, args.engine, args.max_entries)
+        if cache.engine is None:
+            return 1
+        rendered = await cache.prerender(phrases)
+        logger.info(f"✅ {len(cache.entries)} phrase(s) cached in {args.cache_dir} ({rendered} new).")
+        return 0
+
+    sys.exit(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
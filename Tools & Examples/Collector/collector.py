@@ -21,6 +21,12 @@ ENABLED_TOPICS = [
 # Gestion des images
 ENABLE_IMAGES = False               # Active ou désactive la capture d'images
 IMAGE_CAPTURE_INTERVAL = 5.0       # Intervalle en secondes entre les captures automatiques
+IMAGE_STREAM = "head_color"         # Flux vidéo décodé pour les captures (voir frame_source.py)
+
+# Vidéo simulée (--mode sim)
+SIM_VIDEO = None                    # Vidéo, dossier ou glob d'images rejoué ; None = images synthétiques
+SIM_VIDEO_FPS = None                # None = fps du fichier (30 sinon)
+SIM_VIDEO_SIZE = None               # (largeur, hauteur) ; None = résolution d'origine (1280x720 si synthétique)
 
 # =========================
 # ======== CODE ===========
@@ -116,13 +122,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from frame_source import FrameSource, parse_size
+
 
 class Screenshotter:
-    def __init__(self, robot: Any, out_dir: Path, state) -> None:
-        """Handle screenshots using OpenCV."""
+    def __init__(self, robot: Any, out_dir: Path, state, frames: Optional[FrameSource] = None) -> None:
+        """Handle screenshots using OpenCV (from `frames` when given, else video_stream_manager)."""
         self.robot = robot
         self.out_dir = out_dir
         self.state = state
+        self.frames = frames
         self.out_dir.mkdir(parents=True, exist_ok=True)
 
     async def take(self, reason: str) -> Optional[Path]:
@@ -130,6 +139,9 @@ class Screenshotter:
         filename = f"{datetime.now().strftime('%H%M%S')}_{reason}.jpg"
         path = self.out_dir / filename
         try:
+            if self.frames is not None and await self._save_from_source(path):
+                return path
+
             vsm = getattr(self.robot, "video_stream_manager", None)
             if vsm is None:
                 raise RuntimeError("video_stream_manager unavailable")
@@ -156,6 +168,17 @@ class Screenshotter:
                 await self._write_placeholder(path)
             return None
 
+    async def _save_from_source(self, path: Path) -> bool:
+        """Save the newest decoded frame, without copying it out of the ring buffer."""
+        frame = self.frames.latest()
+        if frame is None or not await self._save_frame_cv2(frame.image, path):
+            return False
+        if self.frames.valid(frame):
+            return True
+        # Overwritten by the decoder while encoding: save a copy of the newest frame
+        frame = self.frames.latest()
+        return await self._save_frame_cv2(frame.image.copy(), path)
+
     async def _save_frame_cv2(self, frame: Any, path: Path) -> bool:
         """Save a frame using OpenCV (cv2.imwrite)."""
         try:
@@ -189,8 +212,9 @@ class Screenshotter:
 
 
 class Dashboard:
-    def __init__(self, state):
+    def __init__(self, state, frames: Optional[FrameSource] = None):
         self.state = state
+        self.frames = frames
         self.console = Console()
 
     async def run(self):
@@ -214,6 +238,8 @@ class Dashboard:
             val = data.get("value", {})
             snippet = json.dumps(val, ensure_ascii=False)[:120]
             table.add_row(topic, ts, snippet)
+        if self.frames is not None:
+            table.add_row("video", datetime.now().isoformat(timespec="seconds"), json.dumps(self.frames.stats()))
 
         errors = "\n".join(self.state.errors[-5:]) or "Aucune erreur"
         panel = Panel(errors, title="Erreurs", style="red", box=box.MINIMAL)
@@ -233,23 +259,38 @@ async def run_real(args: argparse.Namespace, out_dir: Path) -> None:
         # robot.video_stream_manager.set_display("head_color", True)
         # robot.video_stream_manager.set_display("head_debug", True)
 
+        # Un seul décodage du flux, partagé par les captures (ring buffer, sans copie)
+        frames = FrameSource.from_robot(robot, IMAGE_STREAM) if ENABLE_IMAGES else None
+        if frames is not None:
+            frames.start()
+
         # Now continue with your collector logic
-        await run_common(robot, out_dir, args)
+        try:
+            await run_common(robot, out_dir, args, frames)
+        finally:
+            if frames is not None:
+                frames.stop()
 
 
 async def run_sim(args: argparse.Namespace, out_dir: Path) -> None:
-    robot = SimulatedRobot()
+    from simulator import SimulatedRobot
+
+    robot = SimulatedRobot(args.sim_video, args.sim_fps, args.sim_size)
     async with robot:
-        await run_common(robot, out_dir, args)
+        frames = None
+        if ENABLE_IMAGES:
+            robot.video_stream_manager.add_stream(stream_name=IMAGE_STREAM, stream_url=IMAGE_STREAM)
+            frames = robot.video_stream_manager.streams[IMAGE_STREAM]
+        await run_common(robot, out_dir, args, frames)
 
 
-async def run_common(robot: Any, out_dir: Path, args: argparse.Namespace) -> None:
+async def run_common(robot: Any, out_dir: Path, args: argparse.Namespace, frames: Optional[FrameSource] = None) -> None:
     state = SharedState()
     writers: dict[str, JsonlWriter] = {t: JsonlWriter(out_dir / f"{t}.jsonl") for t in ENABLED_TOPICS if t != "llm_enabled"}
     for w in writers.values():
         await w.start()
 
-    screenshotter = Screenshotter(robot, out_dir / "screenshots", state)
+    screenshotter = Screenshotter(robot, out_dir / "screenshots", state, frames)
 
     def safe_callback(topic: str, fn: Callable[[dict], None]) -> Callable[[dict], None]:
         def wrapper(message: dict) -> None:
@@ -283,7 +324,7 @@ async def run_common(robot: Any, out_dir: Path, args: argparse.Namespace) -> Non
     if ENABLE_IMAGES:
         asyncio.create_task(_periodic_capture(screenshotter))
 
-    dash = Dashboard(state)
+    dash = Dashboard(state, frames)
     dash_task = asyncio.create_task(dash.run(), name="dashboard")
 
 
@@ -330,6 +371,9 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--ip", type=str, default=ROBOT_IP)
     p.add_argument("--api-key", type=str, default=ROBOT_API_KEY)
     p.add_argument("--out", type=Path, default=Path(OUTPUT_BASE_DIR))
+    p.add_argument("--sim-video", type=str, default=SIM_VIDEO, help="Vidéo, dossier ou glob d'images rejoué en simulation")
+    p.add_argument("--sim-fps", type=float, default=SIM_VIDEO_FPS)
+    p.add_argument("--sim-size", type=parse_size, default=SIM_VIDEO_SIZE, help="ex. 1920x1080")
     return p.parse_args()
 
 
@@ -0,0 +1,449 @@
+# frame_source.py
+"""
+Decodes a robot video stream once and keeps its last N frames in a preallocated ring
+buffer shared by every consumer (screenshots, image dedup, analytics…).
+
+- Frames are decoded straight into the ring slots (VideoCapture.read into the slot):
+  no allocation nor copy per frame.
+- Consumers get Frame(seq, time, image) where `image` is a read-only view of a slot.
+  A view stays valid until the decoder comes back to its slot, `capacity` frames
+  later: check `source.valid(frame)` after using it, or copy what must be kept.
+- stats(): decode fps, frames decoded, dropped (gaps in the stream timestamps) and
+  read failures.
+
+    frames = FrameSource.from_robot(robot, "head_color")
+    frames.start()
+    frame = frames.latest()                       # newest frame, or None
+    frame = await frames.next_frame(frame.seq)    # every frame, in order (skips overwritten ones)
+    frames.stop()
+
+It has the get_frame() / capture_frame() methods the Screenshotter looks for. Do not
+also add the same stream to robot.video_stream_manager: it would be decoded twice.
+
+ReplaySource stands in for a robot stream on a dev machine (see simulator.py): it plays
+a video file, an image sequence (directory or glob) or synthetic frames at a given fps
+and resolution, in real time, dropping frames when decoding cannot keep up.
+
+Benchmark (decode fps, dropped frames, JPEG encode cost of a consumer):
+    python frame_source.py --replay video.mp4 --fps 30 --size 1920x1080 --seconds 10
+    python frame_source.py --url rtsp://<robot ip>:8554/head_color
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import glob
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+CAPACITY = 8  # frames kept (~0.25 s at 30 fps)
+FPS_WINDOW = 60  # decode times kept for the fps estimate
+RECONNECT_DELAY = 2.0
+REPLAY_FPS = 30.0  # image sequences and synthetic frames
+REPLAY_SIZE = (1280, 720)  # synthetic frames
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+logger = logging.getLogger("frame_source")
+
+
+class Frame(NamedTuple):
+    seq: int  # frame number since start()
+    time: float  # time.monotonic() when decoded
+    image: np.ndarray  # read-only view of a ring slot (BGR)
+
+
+class FrameSource:
+    def __init__(self, url: str, capacity: int = CAPACITY) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2 (one slot is being written)")
+        self.url = url
+        self.capacity = capacity
+        self.dropped = 0
+        self.failures = 0
+        self._ring: Optional[np.ndarray] = None  # (capacity, height, width, channels), allocated on the first frame
+        self._seqs = np.full(capacity, -1, dtype=np.int64)  # frame held by each slot, -1 while written
+        self._times = np.zeros(capacity)
+        self._next_seq = 0  # = frames decoded
+        self._cond = threading.Condition()
+        self._decode_times: deque[float] = deque(maxlen=FPS_WINDOW)
+        self._capture: Any = None
+        self._frame_ms: Optional[float] = None  # nominal frame interval of the stream
+        self._last_ms: Optional[float] = None  # stream timestamp of the previous frame
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_robot(cls, robot: Any, stream: str = "head_color", capacity: int = CAPACITY) -> "FrameSource":
+        base = robot.video_stream_manager.stream_base_url
+        return cls(f"{base}/{stream}", capacity)
+
+    # === Decoding ===
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._decode_loop, name=f"frames:{self.url}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join()
+        self._close()
+
+    def open(self) -> Any:
+        """Open the stream; returns an object with read(image) like cv2.VideoCapture."""
+        capture = cv2.VideoCapture(self.url)
+        if not capture.isOpened():
+            raise RuntimeError(f"Cannot open video stream {self.url}")
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        self._frame_ms = 1000.0 / fps if 0 < fps < 1000 else None
+        self._last_ms = None
+        logger.info(f"Connected to video stream at {self.url}")
+        return capture
+
+    def read(self, capture: Any, slot: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        """Decode the next frame, into `slot` when given."""
+        ok, image = capture.read(slot) if slot is not None else capture.read()
+        if ok:
+            self._count_dropped(capture.get(cv2.CAP_PROP_POS_MSEC))
+        return ok, image
+
+    def _count_dropped(self, position_ms: float) -> None:
+        # Frames lost upstream (network, decoder behind) show as gaps in the stream time
+        if self._frame_ms and self._last_ms is not None and position_ms > self._last_ms:
+            missing = round((position_ms - self._last_ms) / self._frame_ms) - 1
+            if missing > 0:
+                self.dropped += missing
+        self._last_ms = position_ms
+
+    def _close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+    def _decode_loop(self) -> None:
+        while self._running:
+            if self._capture is None:
+                try:
+                    self._capture = self.open()
+                except Exception as e:  # noqa: BLE001
+                    logger.warning(f"{e}, retrying in {RECONNECT_DELAY:.0f}s")
+                    time.sleep(RECONNECT_DELAY)
+                    continue
+            if not self._decode_one():
+                self.failures += 1
+                logger.warning(f"Failed to read a frame from {self.url}, reconnecting")
+                self._close()
+                time.sleep(RECONNECT_DELAY)
+
+    def _decode_one(self) -> bool:
+        index = self._next_seq % self.capacity
+        with self._cond:
+            self._seqs[index] = -1  # views of the oldest frame are no longer valid
+            slot = self._ring[index] if self._ring is not None else None
+        ok, image = self.read(self._capture, slot)
+        if not ok or image is None:
+            return False
+
+        with self._cond:
+            if self._ring is None or self._ring.shape[1:] != image.shape or self._ring.dtype != image.dtype:
+                # First frame or new resolution: views of the old ring keep their data
+                if self._ring is not None:
+                    logger.info(f"Stream {self.url} changed to {image.shape}")
+                self._ring = np.empty((self.capacity, *image.shape), dtype=image.dtype)
+                self._seqs[:] = -1
+                slot = None
+            if slot is None or image.ctypes.data != slot.ctypes.data:
+                self._ring[index] = image  # the decoder could not write in place
+            now = time.monotonic()
+            self._seqs[index] = self._next_seq
+            self._times[index] = now
+            self._next_seq += 1
+            self._decode_times.append(now)
+            self._cond.notify_all()
+        return True
+
+    # === Consumers ===
+    def _frame(self, seq: int) -> Frame:
+        index = seq % self.capacity
+        view = self._ring[index]
+        view.flags.writeable = False
+        return Frame(seq, float(self._times[index]), view)
+
+    def latest(self) -> Optional[Frame]:
+        with self._cond:
+            if self._next_seq == 0:
+                return None
+            return self._frame(self._next_seq - 1)
+
+    def recent(self, count: Optional[int] = None) -> List[Frame]:
+        """Frames still in the ring, oldest first (at most `count`, the newest ones)."""
+        with self._cond:
+            first = max(0, self._next_seq - self.capacity + 1)
+            if count is not None:
+                first = max(first, self._next_seq - count)
+            return [self._frame(seq) for seq in range(first, self._next_seq)]
+
+    def wait_next(self, after_seq: int = -1, timeout: Optional[float] = None) -> Optional[Frame]:
+        """First frame after `after_seq` still in the ring, waiting for it if needed.
+
+        A consumer slower than the decoder gets the oldest frame not overwritten yet:
+        `frame.seq - after_seq - 1` frames were skipped.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._next_seq - 1 > after_seq or not self._running, timeout):
+                return None
+            if self._next_seq - 1 <= after_seq:
+                return None  # stopped
+            return self._frame(max(after_seq + 1, self._next_seq - self.capacity + 1))
+
+    async def next_frame(self, after_seq: int = -1, timeout: Optional[float] = None) -> Optional[Frame]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.wait_next, after_seq, timeout)
+
+    def valid(self, frame: Frame) -> bool:
+        """True while the view of `frame` has not been overwritten."""
+        with self._cond:
+            if frame.image.base is not self._ring:
+                return True  # from a ring replaced after a resolution change, never reused
+            return int(self._seqs[frame.seq % self.capacity]) == frame.seq
+
+    # Same interface as the one Screenshotter probes on video_stream_manager
+    def get_frame(self) -> Optional[np.ndarray]:
+        frame = self.latest()
+        return frame.image if frame is not None else None
+
+    async def capture_frame(self) -> Optional[np.ndarray]:
+        return self.get_frame()
+
+    # === Stats ===
+    @property
+    def fps(self) -> float:
+        with self._cond:
+            times = list(self._decode_times)
+        if len(times) < 2 or times[-1] <= times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "decoded": self._next_seq,
+            "fps": round(self.fps, 1),
+            "dropped": self.dropped,
+            "failures": self.failures,
+            "shape": None if self._ring is None else self._ring.shape[1:],
+        }
+
+
+# === Offline replay ===
+class _VideoFile:
+    def __init__(self, path: str) -> None:
+        self.capture = cv2.VideoCapture(path)
+        if not self.capture.isOpened():
+            raise RuntimeError(f"Cannot open video file {path}")
+        fps = self.capture.get(cv2.CAP_PROP_FPS)
+        self.fps = fps if 0 < fps < 1000 else None
+
+    def read(self, into: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.capture.read(into) if into is not None else self.capture.read()
+
+    def skip(self, count: int) -> None:
+        for _ in range(count):
+            self.capture.grab()  # no decode
+
+    def rewind(self) -> None:
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self) -> None:
+        self.capture.release()
+
+
+class _ImageSequence:
+    fps = None
+
+    def __init__(self, paths: List[str]) -> None:
+        if not paths:
+            raise RuntimeError("No image found for the replay")
+        self.paths = paths
+        self.index = 0
+
+    def read(self, into: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.index >= len(self.paths):
+            return False, None
+        image = cv2.imread(self.paths[self.index])
+        self.index += 1
+        return image is not None, image
+
+    def skip(self, count: int) -> None:
+        self.index += count
+
+    def rewind(self) -> None:
+        self.index = 0
+
+    def release(self) -> None:
+        pass
+
+
+class _Synthetic:
+    """Gray frames with a moving bar and the frame number."""
+
+    fps = None
+
+    def __init__(self, size: Tuple[int, int]) -> None:
+        self.size = size
+        self.index = 0
+
+    def read(self, into: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        width, height = self.size
+        if into is None or into.shape != (height, width, 3):
+            into = np.empty((height, width, 3), dtype=np.uint8)
+        into[...] = 160
+        x = (self.index * 8) % width
+        into[:, x : x + width // 20] = 60
+        cv2.putText(into, f"SIM {self.index}", (20, height // 6), cv2.FONT_HERSHEY_SIMPLEX, height / 240, (0, 0, 0), 2)
+        self.index += 1
+        return True, into
+
+    def skip(self, count: int) -> None:
+        self.index += count
+
+    def rewind(self) -> None:
+        self.index = 0
+
+    def release(self) -> None:
+        pass
+
+
+class ReplaySource(FrameSource):
+    """FrameSource playing a local video file, image sequence or synthetic frames in real time.
+
+    media: video file, directory of images, glob ("frames/*.png") or None for synthetic frames.
+    fps:   playback rate (default: the file's, else REPLAY_FPS).
+    size:  (width, height) frames are resized to (default: the media's, REPLAY_SIZE if synthetic).
+    """
+
+    def __init__(
+        self,
+        media: Optional[str] = None,
+        fps: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        loop: bool = True,
+        capacity: int = CAPACITY,
+    ) -> None:
+        super().__init__(media or "synthetic", capacity)
+        self.media = media
+        self.target_fps = fps
+        self.size = size
+        self.loop = loop
+        self._started_at = 0.0
+        self._position = 0  # frames of the media played or skipped since open()
+        self._scratch: Optional[np.ndarray] = None  # decode buffer when resizing
+        self._native: Optional[Tuple[int, int]] = None  # (width, height) of the media
+
+    def open(self) -> Any:
+        media = self.media
+        if not media:
+            reader: Any = _Synthetic(self.size or REPLAY_SIZE)
+        elif Path(media).is_dir():
+            reader = _ImageSequence(sorted(str(p) for p in Path(media).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS))
+        elif glob.has_magic(media):
+            reader = _ImageSequence(sorted(glob.glob(media)))
+        else:
+            reader = _VideoFile(media)
+        self.target_fps = self.target_fps or reader.fps or REPLAY_FPS
+        self._started_at = time.monotonic()
+        self._position = 0
+        logger.info(f"Replaying {self.url} at {self.target_fps:g} fps")
+        return reader
+
+    def read(self, reader: Any, slot: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        # Real time: wait for the frame's due time, or skip the frames it is late by
+        due = self._started_at + self._position / self.target_fps
+        now = time.monotonic()
+        if now < due:
+            time.sleep(due - now)
+        else:
+            late = int((now - due) * self.target_fps)
+            if late:
+                reader.skip(late)
+                self._position += late
+                self.dropped += late
+
+        # Decoded straight into the ring slot, unless the frame must be resized into it
+        direct = self._native is None or self._native == self.size
+        into = slot if direct else self._scratch
+        ok, image = reader.read(into)
+        if not ok and self.loop:
+            reader.rewind()
+            ok, image = reader.read(into)
+        if not ok:
+            return False, None
+        self._position += 1
+
+        self._native = (image.shape[1], image.shape[0])
+        if self.size is None:
+            self.size = self._native  # fixed from the first frame
+        if self._native == self.size:
+            return True, image
+        self._scratch = image
+        if slot is not None:
+            return True, cv2.resize(image, self.size, dst=slot)
+        return True, cv2.resize(image, self.size)
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    parser = argparse.ArgumentParser(description="Measure a frame source: decode fps, drops, JPEG encode cost.")
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument("--url", help="Stream to decode (rtsp://<robot ip>:8554/head_color).")
+    source_group.add_argument("--replay", help="Video file, image directory or glob to replay.")
+    parser.add_argument("--fps", type=float, help="Replay rate.")
+    parser.add_argument("--size", type=parse_size, help="Replay resolution, e.g. 1920x1080.")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--capacity", type=int, default=CAPACITY)
+    args = parser.parse_args()
+
+    if args.url:
+        source = FrameSource(args.url, args.capacity)
+    else:
+        source = ReplaySource(args.replay, args.fps, args.size, capacity=args.capacity)
+    source.start()
+
+    # One consumer taking every frame it can and encoding it, as the Screenshotter does
+    seen, skipped, encode_seconds, seq = 0, 0, 0.0, -1
+    end = time.monotonic() + args.seconds
+    try:
+        while time.monotonic() < end:
+            frame = source.wait_next(seq, timeout=1.0)
+            if frame is None:
+                continue
+            skipped += frame.seq - seq - 1 if seq >= 0 else 0
+            seq = frame.seq
+            started = time.perf_counter()
+            cv2.imencode(".jpg", frame.image)
+            encode_seconds += time.perf_counter() - started
+            seen += 1
+    finally:
+        source.stop()
+
+    print(f"source:   {source.stats()}")
+    if seen:
+        print(f"consumer: {seen} frame(s), {skipped} skipped, JPEG encode {encode_seconds / seen * 1000:.1f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ import asyncio
 import contextlib
 import random
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from frame_source import ReplaySource
 
 
 # --- Mission simulée ---
@@ -22,26 +24,73 @@ class _Mission:
 
 
 class _VideoManager:
-    """Fournit une interface compatible avec Screenshotter."""
+    """Interface compatible avec video_stream_manager (et Screenshotter).
+
+    Chaque flux ajouté rejoue `media` (vidéo, dossier ou glob d'images, ou images
+    synthétiques si None) à `fps` et `size`, via un ReplaySource (frame_source.py).
+    """
+
+    def __init__(
+        self,
+        media: Optional[str] = None,
+        fps: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+        default_stream: str = "head_color",
+    ) -> None:
+        self.media = media
+        self.fps = fps
+        self.size = size
+        self.default_stream = default_stream
+        self.stream_base_url = "sim://"
+        self.streams: Dict[str, ReplaySource] = {}
+        self.display: Dict[str, bool] = {}
+
+    def add_stream(self, stream_name: str, stream_url: str) -> None:
+        if stream_name in self.streams:
+            raise ValueError(f"Stream with name {stream_name} already exists.")
+        source = ReplaySource(self.media, self.fps, self.size)
+        source.url = f"{self.stream_base_url}{stream_url}"
+        self.streams[stream_name] = source
+        source.start()
+
+    def set_display(self, stream_name: str, value: bool) -> None:
+        # pas de fenêtre en simulation, on garde seulement l'état
+        self.display[stream_name] = value
+
+    def remove_stream(self, stream_name: str) -> None:
+        source = self.streams.pop(stream_name, None)
+        if source is not None:
+            source.stop()
+
+    def close_all_streams(self) -> None:
+        for name in list(self.streams):
+            self.remove_stream(name)
+
+    def get_frame(self) -> Any:
+        # le premier appel démarre le flux par défaut : None tant qu'aucune image n'est décodée
+        if self.default_stream not in self.streams:
+            self.add_stream(self.default_stream, self.default_stream)
+        return self.streams[self.default_stream].get_frame()
 
     async def capture_frame(self) -> Any:
-        # retourne un placeholder PIL.Image si PIL dispo, sinon bytes
-        try:
-            from PIL import Image, ImageDraw  # type: ignore
-
-            img = Image.new("RGB", (320, 240), color=(200, 200, 200))
-            d = ImageDraw.Draw(img)
-            d.text((10, 10), "Simulated Frame", fill=(0, 0, 0))
-            return img
-        except Exception:
-            return b"SIM_FRAME"
+        frame = self.get_frame()
+        if frame is None:
+            source = self.streams[self.default_stream]
+            next_frame = await source.next_frame(timeout=1.0)
+            frame = next_frame.image if next_frame is not None else None
+        return frame
 
 
 class SimulatedRobot:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        video: Optional[str] = None,
+        video_fps: Optional[float] = None,
+        video_size: Optional[Tuple[int, int]] = None,
+    ) -> None:
         self._callbacks: Dict[str, list[Callable[[dict], None]]] = {}
         self._tasks: list[asyncio.Task] = []
-        self.video_stream_manager = _VideoManager()
+        self.video_stream_manager = _VideoManager(video, video_fps, video_size)
 
     async def __aenter__(self) -> "SimulatedRobot":
         # démarrer les producteurs
@@ -57,6 +106,7 @@ class SimulatedRobot:
             t.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await t
+        self.video_stream_manager.close_all_streams()
 
     # --- API compat ---
     def register_callback(self, topic: str, cb: Callable[[dict], None]) -> None:
@@ -1,9 +1,26 @@
 import asyncio
-import random
+import logging
+import sys
+from pathlib import Path
 from pymirokai.robot import connect
 
-LAST_HASH = None
-ROBOT = None
+from filler_scheduler import FillerScheduler
+from semantic_tail import SemanticTail
+
+# Pre-rendered fillers (phrase_cache.py, in Tools & Examples/Audio encoding)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "Audio encoding"))
+try:
+    from phrase_cache import PhraseCache
+except ImportError:  # audio_player dependencies missing: fillers go through robot.say()
+    PhraseCache = None
+
+# Opt-in: a local voice (piper model or espeak-ng voice) differs from the robot's own.
+# None: fillers are said by the robot.
+FILLER_VOICE = None
+
+# Only new events are handled; the memory at subscription time is skipped
+TAIL = SemanticTail()
+SCHEDULER = None
 
 FILLERS = [
     "Hmm, let me think…",
@@ -27,22 +44,6 @@ FILLERS = [
 ]
 
 
-async def on_ASR(robot, value: str) -> None:
-    """Called only when an ASR message (user speech) is detected."""
-    try:
-        filler = random.choice(FILLERS)
-        mission = robot.say(filler)
-
-        # try starting the mission, but don't crash if voice is busy
-        try:
-            await mission.started(ignore_exceptions=True)
-        except Exception as e:
-            print(f"[WARN] Could not start filler voice: {e}")
-
-    except Exception as e:
-        print(f"[ERROR in on_ASR]: {e}")
-
-
 async def pretty_print_event(event: dict) -> None:
     try:
         etype = event.get("type")
@@ -51,14 +52,13 @@ async def pretty_print_event(event: dict) -> None:
             text = event.get("value")
             print(f'[ASR] : "{text}"')
 
-            if LAST_HASH is not None:
-                # run ASR handler safely
-                asyncio.create_task(on_ASR(ROBOT, text))
-
+            # filler said only if the reply is late (see filler_scheduler.py)
+            SCHEDULER.on_asr(event)
             return
 
         if etype == "TTSEvent":
             print(f'[TTS] : "{event.get("value")}"')
+            SCHEDULER.on_tts(event)
             return
 
         if etype == "MissionEvent":
@@ -72,33 +72,31 @@ async def pretty_print_event(event: dict) -> None:
 
 
 async def on_semantic_memory(message: dict) -> None:
-    global LAST_HASH
     try:
-        data = message.get("data", [])
-        if not data:
-            return
-
-        last = data[-1]
-
-        new_hash = (last.get("type"), last.get("timestamp"))
-        if new_hash == LAST_HASH:
-            return
-
-        await pretty_print_event(last)
-        LAST_HASH = new_hash
+        # Every update carries the whole memory: handle each new event once, in order,
+        # even when several arrived between two updates
+        for event in TAIL.feed(message.get("data", [])):
+            await pretty_print_event(event)
 
     except Exception as e:
         print(f"[ERROR in on_semantic_memory]: {e}")
 
 
 async def main() -> None:
-    global ROBOT
+    global SCHEDULER
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     ip = "localhost"
     api_key = "admin"
 
     async with connect(api_key, ip) as robot:
-        ROBOT = robot
+        phrases = None
+        if PhraseCache is not None and FILLER_VOICE:
+            phrases = PhraseCache(FILLER_VOICE)
+            await phrases.follow_robot(robot)
+            # Fillers not rendered yet are said by the robot meanwhile
+            asyncio.create_task(phrases.prerender(FILLERS))
+        SCHEDULER = FillerScheduler(robot, FILLERS, phrases)
 
         # Register callback safely into asyncio tasks
         robot.register_callback(
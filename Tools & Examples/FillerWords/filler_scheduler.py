@@ -0,0 +1,213 @@
+"""
+Adaptive timing for filler words ("Hmm, let me think…").
+
+Saying a filler on every ASR event talks over visitors who only paused, and over the
+reply whenever it comes fast (in the recorded Collector runs the reply starts ~2.5 s
+after the ASR, median, but 18 % of the immediate fillers still overlapped it). The
+scheduler instead:
+
+- learns the ASR → reply latency from semantic_memory (rolling window of the last
+  replies, robot timestamps),
+- says a filler at the earliest moment it is unlikely to overlap the reply: a reply
+  that has not started yet must have at most `max_overlap` chance of starting while
+  the filler is spoken (filler duration measured on the robot). With the recorded
+  latencies this is shortly after the visitor stops; when the LLM answers fast, it
+  moves after the bulk of the replies, i.e. only late replies get a filler,
+- cancels the pending filler when the reply's TTSEvent arrives first, and cuts a filler
+  still being spoken when the reply starts,
+- counts the outcomes: "skipped" (reply came first, no filler needed), "covered"
+  (filler said, reply came after it) and "cut" (talk-over, filler interrupted).
+
+Feed it every new semantic_memory event (see SemanticTail):
+
+    scheduler = FillerScheduler(robot, FILLERS)
+    for event in TAIL.feed(message.get("data", [])):
+        scheduler.on_event(event)
+"""
+
+import asyncio
+import bisect
+import logging
+import random
+import re
+import time
+from collections import Counter, deque
+from typing import Any, Dict, Optional, Sequence
+
+# === Configuration ===
+MAX_OVERLAP = 0.2  # accepted chance that the reply starts while the filler is spoken
+DEFAULT_DELAY = 1.5  # seconds, until MIN_SAMPLES replies have been measured
+MIN_DELAY = 0.6  # lets a visitor's next ASR (still talking) cancel the filler
+MAX_DELAY = 4.0  # never leave a longer silence
+FILLER_SECONDS = 1.0  # until a filler has been timed on the robot
+MIN_SAMPLES = 5
+WINDOW = 50  # replies kept in the latency distribution
+MAX_LATENCY = 20.0  # longer gaps are not replies to the ASR (or the LLM was off)
+
+logger = logging.getLogger("filler")
+
+
+def normalize(text: str) -> str:
+    """Words only, casefolded: "Hmm, let me think…" and "hmm let me think" compare equal."""
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+
+class LatencyModel:
+    """Rolling distribution of ASR → reply latencies, in seconds."""
+
+    def __init__(self, window: int = WINDOW):
+        self.samples = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        # ≤ 0: the ASR was appended after the reply had started (memory is not time-sorted)
+        if 0 < seconds < MAX_LATENCY:
+            self.samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def safe_start(self, earliest: float, duration: float, max_overlap: float) -> float:
+        """Earliest t ≥ `earliest` where a reply not started at t starts during
+        [t, t + duration] in at most `max_overlap` of past cases."""
+        ordered = sorted(self.samples)
+        candidates = [earliest] + [s for s in ordered if s > earliest]
+        for t in candidates:
+            waiting = len(ordered) - bisect.bisect_right(ordered, t)
+            if not waiting:
+                return t
+            overlapping = bisect.bisect_right(ordered, t + duration) - bisect.bisect_right(ordered, t)
+            if overlapping / waiting <= max_overlap:
+                return t
+        return candidates[-1]
+
+
+class FillerScheduler:
+    def __init__(
+        self,
+        robot,
+        fillers: Sequence[str],
+        phrases=None,
+        max_overlap: float = MAX_OVERLAP,
+        default_delay: float = DEFAULT_DELAY,
+        min_delay: float = MIN_DELAY,
+        max_delay: float = MAX_DELAY,
+    ):
+        self.robot = robot
+        self.fillers = list(fillers)
+        self.phrases = phrases  # optional PhraseCache: pre-rendered fillers start instantly
+        self.max_overlap = max_overlap
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.latency = LatencyModel()
+        self.filler_seconds = deque([FILLER_SECONDS], maxlen=WINDOW)
+        self.stats = Counter()
+        self.perceived = deque(maxlen=WINDOW)  # seconds from ASR to the first sound (filler or reply)
+
+        self._asr: Optional[Dict[str, Any]] = None  # last ASR still waiting for its reply
+        self._asr_received = 0.0  # local reception time of that ASR
+        self._pending: Optional[asyncio.Task] = None  # filler waiting for its delay
+        self._mission = None  # filler being spoken
+        self._filler_text: Optional[str] = None  # normalized, to recognize its TTSEvent
+        self._filler_said_at: Optional[float] = None
+
+    @property
+    def delay(self) -> float:
+        """Current wait between an ASR event and its filler."""
+        if len(self.latency.samples) < MIN_SAMPLES:
+            return self.default_delay
+        duration = sum(self.filler_seconds) / len(self.filler_seconds)
+        return min(self.max_delay, self.latency.safe_start(self.min_delay, duration, self.max_overlap))
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        if event.get("type") == "PerceptionEvent" and event.get("perception_type") == "ASR":
+            self.on_asr(event)
+        elif event.get("type") == "TTSEvent":
+            self.on_tts(event)
+
+    def on_asr(self, event: Dict[str, Any]) -> None:
+        # The visitor kept talking: the filler is timed from the latest ASR, and one
+        # already being said is stopped
+        self._cancel_pending()
+        self._cancel_mission()
+        self._asr = event
+        self._asr_received = time.monotonic()
+        self._filler_said_at = None
+        # Delay counted from reception: robot and client clocks may differ
+        self._pending = asyncio.create_task(self._say_filler(self.delay))
+
+    def on_tts(self, event: Dict[str, Any]) -> None:
+        if self._filler_text and normalize(str(event.get("value", ""))) == self._filler_text:
+            return  # our own filler (a reply that merely contains it is still a reply)
+        if self._asr is None:
+            return  # rest of a reply already counted, or speech not triggered by an ASR
+
+        self.latency.add(event.get("timestamp", 0) - self._asr.get("timestamp", 0))
+        self._asr = None
+        if self._pending is not None and not self._pending.done() and self._filler_said_at is None:
+            self._cancel_pending()
+            outcome = "skipped"
+            self.perceived.append(time.monotonic() - self._asr_received)
+        elif self._mission is not None:
+            outcome = "cut"
+            self._cancel_mission()
+        else:
+            outcome = "covered"
+        self.stats[outcome] += 1
+        logger.info(f"[FILLER] {outcome} — {self.summary()}")
+
+    def summary(self) -> str:
+        hits = self.stats["skipped"] + self.stats["covered"]
+        total = hits + self.stats["cut"]
+        median = self.latency.quantile(0.5)
+        parts = [
+            f"hits {hits}/{total}",
+            f"skipped {self.stats['skipped']}, covered {self.stats['covered']}, cut {self.stats['cut']}",
+            f"delay {self.delay:.2f}s",
+        ]
+        if median is not None:
+            parts.append(f"reply p50 {median:.2f}s")
+        if self.perceived:
+            parts.append(f"first sound avg {sum(self.perceived) / len(self.perceived):.2f}s")
+        return ", ".join(parts)
+
+    # === Internals ===
+    def _cancel_pending(self) -> None:
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+        self._pending = None
+
+    def _cancel_mission(self) -> None:
+        if self._mission is None:
+            return
+        mission, self._mission = self._mission, None
+        cancelled = mission.cancel(ignore_exceptions=True)
+        if asyncio.iscoroutine(cancelled):  # Mission; a cached clip (Playback) stops at once
+            asyncio.create_task(cancelled)
+
+    async def _say_filler(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        filler = random.choice(self.fillers)
+        self._filler_text = normalize(filler)
+        self._filler_said_at = time.monotonic()
+        self.perceived.append(self._filler_said_at - self._asr_received)
+        if self.phrases is not None:
+            mission = self.phrases.say(self.robot, filler)
+        else:
+            mission = self.robot.say(filler)
+        self._mission = mission
+        try:
+            # don't crash if voice is busy
+            await mission.started(ignore_exceptions=True)
+            started = time.monotonic()
+            await mission.completed(ignore_exceptions=True)
+            if self._mission is mission:  # not cut by the reply
+                self.filler_seconds.append(time.monotonic() - started)
+        except Exception as e:
+            logger.warning(f"[WARN] Could not play filler voice: {e}")
+        finally:
+            if self._mission is mission:
+                self._mission = None
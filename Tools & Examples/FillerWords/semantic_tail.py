@@ -0,0 +1,73 @@
+"""
+Tail-follower for the robot's "semantic_memory" topic.
+
+Each semantic_memory update carries the whole memory window (the last 50 events on the
+robot), not just what changed. SemanticTail remembers the events it already returned
+and gives back only the ones appended since, each exactly once and in order:
+
+    TAIL = SemanticTail()
+
+    async def on_semantic_memory(message):
+        for event in TAIL.feed(message.get("data", [])):
+            ...
+
+Events are identified by (timestamp, type). The robot appends events in arrival order,
+which is not always timestamp order (an ASR result can land after the reply it
+triggered started), and it sometimes drops an event from the window, so the cursor is
+not a single timestamp: the window is scanned from the end until the first event
+already seen. The cost is O(new events), whatever the window size.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Sequence, Tuple
+
+Event = Dict[str, Any]
+EventKey = Tuple[Any, Any]
+
+
+def event_key(event: Event) -> EventKey:
+    return (event.get("timestamp"), event.get("type"))
+
+
+class SemanticTail:
+    def __init__(self, skip_existing: bool = True, history: int = 256):
+        """
+        skip_existing: the first update (the memory as it was at subscription) is only
+                       remembered, so old ASR do not trigger anything. An empty first
+                       update (robot just booted) counts as that memory.
+        history:       number of recent keys kept; must be larger than the robot's
+                       memory window.
+        """
+        self.skip_existing = skip_existing
+        self.history = history
+        self.primed = False
+        self._recent: "OrderedDict[EventKey, None]" = OrderedDict()
+
+    def feed(self, data: Sequence[Event]) -> List[Event]:
+        """Return the events of `data` not returned before, oldest first."""
+        if not self.primed:
+            # The memory at subscription, possibly empty (robot just booted): nothing after it is skipped
+            self.primed = True
+            for event in data:
+                self._remember(event_key(event))
+            return list(data) if not self.skip_existing else []
+
+        start = len(data)
+        while start > 0 and event_key(data[start - 1]) not in self._recent:
+            start -= 1
+        new = list(data[start:])
+
+        for event in new:
+            self._remember(event_key(event))
+        return new
+
+    def reset(self) -> None:
+        """Forget the events seen; the next update is treated as the first one."""
+        self.primed = False
+        self._recent.clear()
+
+    def _remember(self, key: EventKey) -> None:
+        self._recent[key] = None
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.history:
+            self._recent.popitem(last=False)
@@ -0,0 +1,29 @@
+"""Shared orchestration runtime for the use-case demo scripts.
+
+A use case only provides a scene file (a Python module defining `ACTIONS`)
+and a small launcher calling `main(scene_file)`.
+"""
+
+from .app import Orchestrator, main
+from .config import DEMO_MODE, ROBOT_VOLUME
+from .logs import log
+from .profiler import ProfiledRobot, SceneProfiler
+from .remote import ControlServer
+from .robot import RobotManager
+from .scenes import SceneBook, handle_error
+from .telemetry import TelemetryBus
+
+__all__ = [
+    "ControlServer",
+    "DEMO_MODE",
+    "Orchestrator",
+    "ProfiledRobot",
+    "ROBOT_VOLUME",
+    "RobotManager",
+    "SceneBook",
+    "SceneProfiler",
+    "TelemetryBus",
+    "handle_error",
+    "log",
+    "main",
+]
@@ -0,0 +1,15 @@
+"""python -m orchestrator path/to/scenes.py [--ip IP] [--api-key KEY]"""
+
+import argparse
+from pathlib import Path
+
+from .app import main
+from .config import API_KEY, ROBOT_IP
+
+parser = argparse.ArgumentParser(description="Run the orchestrator with a use case scene file.")
+parser.add_argument("scenes", type=Path, help="Scene file defining ACTIONS.")
+parser.add_argument("--ip", default=ROBOT_IP, help="IP address of the robot.")
+parser.add_argument("--api-key", default=API_KEY, help="API key for the robot.")
+args = parser.parse_args()
+
+main(args.scenes, robot_ip=args.ip, api_key=args.api_key)
@@ -0,0 +1,421 @@
+"""Orchestrator: operator UI, command dispatch and scene execution."""
+
+import asyncio
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import keyboard  # pip install keyboard
+except Exception:  # needs root on Linux, absent on headless hosts
+    keyboard = None
+
+# --- Rich UI ---
+from rich.live import Live
+from rich.layout import Layout
+from rich.table import Table
+from rich.panel import Panel
+from rich.align import Align
+from rich.text import Text
+
+from .config import API_KEY, CONTROL_HOST, CONTROL_PORT, CONTROL_TOKEN, KEYBOARD_ENABLED, PROFILING_ENABLED, \
+    ROBOT_IP, SCENE_WATCH_SECONDS, TELEMETRY_TOPICS
+from .logs import log, setup_logging
+from .profiler import ProfiledRobot, SceneProfiler
+from .remote import ControlServer
+from .robot import RobotManager
+from .scenes import SceneBook
+
+
+# =========================
+#  Orchestrateur + UI
+# =========================
+class Orchestrator:
+    def __init__(self, loop: asyncio.AbstractEventLoop, live: Live, robot_mgr: RobotManager, scenes: SceneBook,
+                 profile_dir: Optional[Path] = None):
+        self.loop = loop
+        self.live = live
+        self.robot = robot_mgr
+        self.scenes = scenes
+
+        self.current_task: Optional[asyncio.Task] = None
+        self.current_name: Optional[str] = None
+        self.pending: deque[str] = deque()
+        self.commands: asyncio.Queue[tuple[str, Optional[str]]] = asyncio.Queue()
+        self.last_message: str = "Prêt."
+        self._state_listeners: list[Callable[[], None]] = []
+        self._ui_heartbeat_task: Optional[asyncio.Task] = None
+        self._scene_watch_task: Optional[asyncio.Task] = None
+        # R key, remote control and file watcher may ask for a reload at the same time
+        self._reload_lock = asyncio.Lock()
+        self.profiler: Optional[SceneProfiler] = (
+            SceneProfiler(profile_dir) if PROFILING_ENABLED and profile_dir is not None else None
+        )
+
+        # One redraw per coalesced telemetry batch, always on the loop thread
+        self.robot.telemetry.subscribe(lambda changes: self._refresh())
+
+    # -------- UI building --------
+    def _build_header(self) -> Panel:
+        # Pense-bête 1..8
+        ordered = [(key, self.scenes.actions[key].__name__) for key in self.scenes.primary_keys()]
+        if not ordered:
+            ordered = [("…", self.scenes.error or "Chargement des scènes…")]
+
+        table = Table(expand=True, show_header=True, header_style="bold")
+        table.add_column("Touche", justify="center")
+        table.add_column("Fonction")
+        for num, fname in ordered:
+            table.add_row(num, fname)
+
+        return Panel(table, title="Raccourcis", border_style="cyan")
+
+    def _build_robot_panel(self) -> Panel:
+        """Display connection state, battery level, and SIM warning if active."""
+        # Connection status
+        status = Text("Connecté", style="bold green") if self.robot.connected else Text("Déconnecté", style="bold red")
+
+        # Battery
+        if self.robot.battery is None:
+            battery_text = Text("Batterie: N/A", style="yellow")
+        else:
+            voltage = self.robot.battery
+            style = "bold green" if voltage >= 26.0 else ("bold yellow" if voltage >= 23.5 else "bold red")
+            battery_text = Text(f"Batterie: {voltage:.2f} V", style=style)
+
+        # Combine texts
+        lines = Text.assemble(
+            Text("Robot\n", style="bold cyan"),
+            status, Text("\n"),
+            battery_text
+        )
+
+        # Other telemetry topics (navigation_state, grasping_state, ...)
+        for topic in TELEMETRY_TOPICS:
+            if topic == "battery_voltage":
+                continue
+            value = self.robot.telemetry.get(topic)
+            label = topic.replace("_state", "").capitalize()
+            shown = "N/A" if value is None else str(value)[:18]
+            lines.append_text(Text(f"\n{label}: {shown}", style="white" if value is not None else "yellow"))
+
+        # ⚠️ Add simulation warning
+        if getattr(self.robot, "_use_sim", False):
+            sim_text = Text("\n\n⚠ SIMULATION MODE ⚠", style="bold yellow on red")
+            lines.append_text(sim_text)
+
+        return Panel(
+            Align.left(lines),
+            border_style="cyan",
+            title="Robot",
+            title_align="left"
+        )
+
+
+    def _build_status(self) -> Panel:
+        if self.current_task and not self.current_task.done():
+            text = Text(f"En cours : {self.current_name}", style="bold red")
+        else:
+            text = Text("IDLE", style="bold green")
+        if self.pending:
+            queued = ", ".join(self.scenes.actions[k].__name__ for k in self.pending)
+            text.append_text(Text(f"\nFile : {queued}", style="yellow"))
+        return Panel(Align.center(text), title="ÉTAT", border_style="white")
+
+    def _build_footer(self) -> Panel:
+        help_text = Text.from_markup(
+            "[b]Contrôles :[/b] 1–8 = lancer | [b]Espace[/b] = annuler | [b]S[/b] = état | [b]R[/b] = recharger"
+            " | [b]Esc[/b] = quitter"
+            f" | [b]Remote :[/b] {CONTROL_HOST}:{CONTROL_PORT}\n"
+            f"[dim]{self.last_message}[/dim]"
+        )
+        return Panel(help_text, border_style="magenta")
+
+    def render(self):
+        root = Layout(name="root")
+        top = Layout(name="top")
+        body = Layout(name="body")
+        bottom = Layout(name="bottom")
+
+        root.split_column(
+            top,
+            body,
+            bottom
+        )
+
+        left_top = Layout(name="left_top")
+        right_top = Layout(name="right_top", size=32)  # colonne droite étroite
+        top.split_row(left_top, right_top)
+
+        left_top.update(self._build_header())
+        right_top.update(self._build_robot_panel())
+        body.update(self._build_status())
+        bottom.update(self._build_footer())
+        return root
+
+    # -------- State --------
+    def snapshot(self) -> Dict[str, Any]:
+        """Serializable view of the orchestrator, pushed to remote clients."""
+        return {
+            "running": self.current_name,
+            "queue": [self.scenes.actions[k].__name__ for k in self.pending],
+            "message": self.last_message,
+            "connected": self.robot.connected,
+            "telemetry": dict(self.robot.telemetry.latest),
+            "actions": {k: self.scenes.actions[k].__name__ for k in self.scenes.primary_keys()},
+        }
+
+    def add_state_listener(self, callback: Callable[[], None]) -> None:
+        self._state_listeners.append(callback)
+
+    def _refresh(self):
+        self.live.update(self.render(), refresh=True)
+        for callback in self._state_listeners:
+            try:
+                callback()
+            except Exception as e:
+                log(f"[STATE] Listener error: {e}")
+
+    # -------- Input adapters --------
+    def submit(self, command: str, arg: Optional[str] = None):
+        """Thread-safe entry point for every input adapter (keyboard, remote)."""
+        try:
+            self.loop.call_soon_threadsafe(self.commands.put_nowait, (command, arg))
+        except RuntimeError:
+            pass
+
+    def _keyboard_thread(self):
+        def on_press(event):
+            if event.event_type != keyboard.KEY_DOWN or not event.name:
+                return
+            key = event.name
+            if key == "esc":
+                self.submit("quit")
+            elif key == "space":
+                self.submit("cancel")
+            elif key.lower() == "s":
+                self.submit("status")
+            elif key.lower() == "r":
+                self.submit("reload")
+            elif key in self.scenes.actions:
+                self.submit("launch", key)
+            # touches non gérées ignorées
+
+        try:
+            keyboard.hook(on_press)
+            keyboard.wait()
+        except Exception as e:
+            # e.g. not root on Linux: the remote control stays available
+            log(f"[KEYBOARD] Disabled: {e}")
+
+    # -------- Orchestration logic --------
+    def _set_msg(self, msg: str):
+        self.last_message = msg
+        self._refresh()
+
+    async def _ui_heartbeat(self, interval: float = 1.0):
+        """Rafraîchit périodiquement l'interface toutes les X secondes."""
+        while True:
+            try:
+                self.live.update(self.render(), refresh=True)
+                await asyncio.sleep(interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Si jamais une erreur survient, on logge et continue
+                from datetime import datetime
+                print(f"[{datetime.now():%H:%M:%S}] [HEARTBEAT ERROR] {e}")
+                await asyncio.sleep(interval)
+
+    async def run(self):
+        # Lancer thread clavier
+        if KEYBOARD_ENABLED and keyboard is not None:
+            t = threading.Thread(target=self._keyboard_thread, daemon=True)
+            t.start()
+
+        server = ControlServer(self, CONTROL_HOST, CONTROL_PORT, CONTROL_TOKEN)
+        await server.start()
+
+        # Connexion robot au démarrage, pendant le chargement des scènes
+        scenes_task = asyncio.create_task(self.scenes.load_async())
+        self._set_msg(f"Connexion au robot {self.robot.robot_ip}…")
+        try:
+            await self.robot.connect()
+            if self.robot.connected:
+                self._set_msg("Robot connecté.")
+            else:
+                self._set_msg("Robot non connecté.")
+        except Exception as e:
+            self._set_msg(f"Échec connexion: {e}")
+
+        try:
+            await scenes_task
+        except Exception:
+            self._set_msg(f"Scènes invalides: {self.scenes.error}")
+        self._refresh()
+
+        self._ui_heartbeat_task = asyncio.create_task(self._ui_heartbeat(1))
+        if SCENE_WATCH_SECONDS > 0:
+            self._scene_watch_task = asyncio.create_task(self._watch_scenes(SCENE_WATCH_SECONDS))
+
+        # Boucle principale
+        try:
+            while True:
+                command, arg = await self.commands.get()
+                if command == "quit":
+                    await self.cancel_current()
+                    self._set_msg("Arrêt demandé.")
+                    break
+                await self.dispatch(command, arg)
+        finally:
+            background = [t for t in (self._ui_heartbeat_task, self._scene_watch_task) if t is not None]
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            await server.stop()
+
+    async def dispatch(self, command: str, arg: Optional[str] = None) -> bool:
+        """Execute one command. Returns False if it is unknown or invalid."""
+        actions = self.scenes.actions
+        if command == "launch" and arg in actions:
+            await self.launch(arg)
+        elif command == "queue" and arg in actions:
+            self.enqueue(arg)
+        elif command == "cancel":
+            await self.cancel_current()
+        elif command == "status":
+            self._set_msg("État rafraîchi.")
+        elif command == "reload":
+            await self.reload_scenes()
+        else:
+            return False
+        return True
+
+    # -------- Scene hot reload --------
+    async def _watch_scenes(self, interval: float):
+        """Reload the scene file when it changes; the robot connection is untouched."""
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                if self.scenes.changed():
+                    await self.reload_scenes()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log(f"[SCENES] Watch error: {e}")
+
+    async def reload_scenes(self):
+        async with self._reload_lock:
+            try:
+                await self.scenes.load_async()
+            except Exception:
+                self._set_msg(f"Rechargement échoué, scènes précédentes conservées: {self.scenes.error}")
+                return
+            # A running scene finishes with its old code; queued keys must still exist
+            self.pending = deque(k for k in self.pending if k in self.scenes.actions)
+            self._set_msg(f"Scènes rechargées (v{self.scenes.generation}).")
+
+    def enqueue(self, key: str):
+        """Run `key` after the current action (and the ones already queued)."""
+        if self.current_task and not self.current_task.done():
+            self.pending.append(key)
+            self._set_msg(f"{self.scenes.actions[key].__name__} ajouté à la file.")
+        else:
+            self._start(key)
+
+    async def launch(self, key: str):
+        if self.current_task and not self.current_task.done():
+            self._set_msg(f"Déjà en cours: {self.current_name}. (Espace pour annuler)")
+            return
+        self._start(key)
+
+    def _start(self, key: str):
+        func = self.scenes.actions[key]
+        name = func.__name__
+
+        async def wrapper():
+            cancelled = False
+            robot = self.robot.robot
+            run = None
+            if self.profiler is not None and robot is not None:
+                run = self.profiler.begin(name)
+                robot = ProfiledRobot(robot, run)
+            try:
+                await func(robot)
+                self._set_msg(f"{name} terminé.")
+            except asyncio.CancelledError:
+                cancelled = True
+                self._set_msg(f"{name} annulé.")
+                raise
+            finally:
+                if run is not None:
+                    self.profiler.end(run, "cancelled" if cancelled else "done")
+                    self._save_trace()
+                self.current_task = None
+                self.current_name = None
+                if self.pending and not cancelled:
+                    self._start(self.pending.popleft())
+                else:
+                    self._refresh()
+
+        self.current_name = name
+        self._set_msg(f"Démarrage de {name}…")
+        self.current_task = asyncio.create_task(wrapper())
+        self._refresh()
+
+    def _save_trace(self):
+        def save():
+            try:
+                self.profiler.save()
+            except OSError as e:
+                log(f"[PROFILER] Cannot write trace: {e}")
+        self.loop.run_in_executor(None, save)
+
+    async def cancel_current(self):
+        self.pending.clear()
+        if self.current_task and not self.current_task.done():
+            self._set_msg(f"Annulation de {self.current_name}…")
+            self.current_task.cancel()
+            try:
+                await self.current_task
+            except asyncio.CancelledError:
+                pass
+        else:
+            self._set_msg("Aucune action en cours.")
+        self._refresh()
+
+
+# =========================
+#  Entrée du programme
+# =========================
+def main(scenes_path: Path, robot_ip: str = ROBOT_IP, api_key: str = API_KEY):
+    """Run the orchestrator for the scene file of a use case.
+
+    The log file and the `traces/` folder are written next to the scene file.
+    """
+    # NOTE Windows: `keyboard` peut nécessiter de lancer le script en administrateur.
+    scenes_path = Path(scenes_path).resolve()
+    setup_logging(scenes_path.with_name("ilmi_orchestration.log"))
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    robot_mgr = RobotManager(robot_ip, api_key)
+    scenes = SceneBook(scenes_path)
+
+    with Live(refresh_per_second=10, screen=True) as live:
+        orch = Orchestrator(loop, live, robot_mgr, scenes, profile_dir=scenes_path.with_name("traces"))
+        live.update(orch.render(), refresh=True)
+        try:
+            loop.run_until_complete(orch.run())
+        finally:
+            loop.stop()
+            loop.close()
+
+    if orch.profiler is not None and orch.profiler.runs:
+        orch.profiler.save()
+        summary = orch.profiler.summary()
+        log(f"[PROFILER] Trace written to {orch.profiler.path}\n{summary}")
+        print(summary)
+        print(f"\nTrace: {orch.profiler.path}")
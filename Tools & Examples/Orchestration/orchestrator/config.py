@@ -0,0 +1,29 @@
+"""Runtime configuration, overridable through environment variables."""
+
+import os
+
+# =========================
+#  Config robot
+# =========================
+ROBOT_IP = os.getenv("ROBOT_IP", "192.168.1.203")
+API_KEY = os.getenv("ROBOT_API_KEY", "dichogamous-nonmonarchical-syndicate-Polystomidae")
+BATTERY_POLL_SECONDS = 5
+BATTERY_ALERT_VOLTS = 23.5
+ROBOT_VOLUME = 85
+DEMO_MODE = False
+
+# Remote control (phones/tablets on the LAN); keyboard is optional
+CONTROL_HOST = os.getenv("ORCH_CONTROL_HOST", "127.0.0.1")   # "0.0.0.0" to expose on the LAN
+CONTROL_PORT = int(os.getenv("ORCH_CONTROL_PORT", "8765"))
+CONTROL_TOKEN = os.getenv("ORCH_CONTROL_TOKEN", "")          # required as ?token= when set
+KEYBOARD_ENABLED = os.getenv("ORCH_KEYBOARD", "1") != "0"
+
+# Scene hot reload: poll the scene file every N seconds (0 disables)
+SCENE_WATCH_SECONDS = float(os.getenv("ORCH_SCENE_WATCH", "0.5"))
+
+# Scene profiling (Chrome trace per run, open in chrome://tracing or ui.perfetto.dev)
+PROFILING_ENABLED = os.getenv("ORCH_PROFILE", "1") != "0"
+
+# Topics forwarded from the SDK to the telemetry bus (shown in the Robot panel)
+TELEMETRY_TOPICS = ("battery_voltage", "navigation_state", "grasping_state")
+TELEMETRY_COALESCE_SECONDS = 0.1
@@ -0,0 +1,20 @@
+"""Shared file logger of the orchestrator."""
+
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+logger = logging.getLogger("ILMI")
+logger.setLevel(logging.INFO)
+
+
+def setup_logging(log_path: Path) -> None:
+    """Write the orchestrator log to `log_path` (rotated at 1 MB)."""
+    handler = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3, encoding="utf-8")
+    fmt = logging.Formatter("%(asctime)s.%(msecs)03d [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    handler.setFormatter(fmt)
+    logger.addHandler(handler)
+
+
+def log(msg: str):
+    logger.info(msg)
@@ -0,0 +1,214 @@
+"""Scene profiler: per-mission timestamps and Chrome trace export."""
+
+import asyncio
+import inspect
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class MissionSpan:
+    """Timestamps (perf_counter) of one robot call made by a scene."""
+    kind: str
+    issued: float
+    accepted: Optional[float] = None    # mission id received from the robot
+    started: Optional[float] = None     # `.started()` resolved
+    completed: Optional[float] = None
+    failed: bool = False
+
+    @property
+    def start_latency(self) -> Optional[float]:
+        first = self.started if self.started is not None else self.accepted
+        return None if first is None else first - self.issued
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.completed is None else self.completed - self.issued
+
+
+@dataclass
+class SceneRun:
+    name: str
+    begin: float
+    end: Optional[float] = None
+    status: str = "running"
+    missions: list[MissionSpan] = field(default_factory=list)
+
+    def idle_windows(self, min_gap: float = 0.001) -> list[tuple[float, float]]:
+        """Windows where no mission was in flight: sleep padding and local overhead."""
+        end = self.end if self.end is not None else time.perf_counter()
+        busy = sorted((m.issued, m.completed if m.completed is not None else end) for m in self.missions)
+        windows, cursor = [], self.begin
+        for start, stop in busy:
+            if start - cursor > min_gap:
+                windows.append((cursor, start))
+            cursor = max(cursor, stop)
+        if end - cursor > min_gap:
+            windows.append((cursor, end))
+        return windows
+
+
+class ProfiledMission:
+    """Wraps an SDK Mission and records when it is accepted, started and completed."""
+
+    def __init__(self, mission: Any, span: MissionSpan):
+        self._mission = mission
+        self._span = span
+        # SDK missions expose futures: timestamps are recorded even if nobody awaits them
+        for attr, mark in (("mission_id", "accepted"), ("result", "completed")):
+            fut = getattr(mission, attr, None)
+            if isinstance(fut, asyncio.Future):
+                fut.add_done_callback(lambda f, mark=mark: self._on_done(f, mark))
+
+    def _mark(self, attr: str) -> None:
+        if getattr(self._span, attr) is None:
+            setattr(self._span, attr, time.perf_counter())
+
+    def _on_done(self, fut: asyncio.Future, attr: str) -> None:
+        self._mark(attr)
+        if fut.cancelled() or fut.exception() is not None:
+            self._span.failed = True
+
+    async def started(self, *args, **kwargs):
+        try:
+            res = await self._mission.started(*args, **kwargs)
+        except BaseException:
+            self._span.failed = True
+            raise
+        self._mark("started")
+        return self if res is self._mission else res
+
+    async def completed(self, *args, **kwargs):
+        try:
+            return await self._mission.completed(*args, **kwargs)
+        except BaseException:
+            self._span.failed = True
+            raise
+        finally:
+            self._mark("completed")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._mission, name)
+
+
+class ProfiledRobot:
+    """Proxy handed to scenes: every call returning a mission/awaitable becomes a span."""
+
+    def __init__(self, robot: Any, run: SceneRun):
+        self._robot = robot
+        self._run = run
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._robot, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            span = MissionSpan(name, time.perf_counter())
+            result = attr(*args, **kwargs)
+            if hasattr(result, "started") and hasattr(result, "completed"):
+                self._run.missions.append(span)
+                return ProfiledMission(result, span)
+            if inspect.isawaitable(result):
+                self._run.missions.append(span)
+                fut = asyncio.ensure_future(result)
+                fut.add_done_callback(lambda f: setattr(span, "completed", time.perf_counter()))
+                return fut
+            return result
+
+        return call
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+class SceneProfiler:
+    """Collects SceneRuns for the session and exports them as a Chrome trace."""
+
+    def __init__(self, out_dir: Path):
+        self.origin = time.perf_counter()
+        self.runs: list[SceneRun] = []
+        self.path = out_dir / f"{datetime.now():%Y%m%d_%H%M%S}.trace.json"
+
+    def begin(self, name: str) -> SceneRun:
+        run = SceneRun(name, time.perf_counter())
+        self.runs.append(run)
+        return run
+
+    def end(self, run: SceneRun, status: str) -> None:
+        run.end = time.perf_counter()
+        run.status = status
+
+    def _us(self, t: float) -> float:
+        return round((t - self.origin) * 1e6, 1)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        events: list[dict] = []
+        lanes: Dict[str, int] = {"scenes": 1, "idle": 2}
+
+        def span(name, cat, tid, start, stop, args=None):
+            events.append({"name": name, "cat": cat, "ph": "X", "pid": 1, "tid": tid,
+                           "ts": self._us(start), "dur": round((stop - start) * 1e6, 1), "args": args or {}})
+
+        for run in self.runs:
+            end = run.end if run.end is not None else time.perf_counter()
+            span(run.name, "scene", lanes["scenes"], run.begin, end, {"status": run.status})
+            for start, stop in run.idle_windows():
+                span("idle", "padding", lanes["idle"], start, stop, {"scene": run.name})
+            for m in run.missions:
+                tid = lanes.setdefault(m.kind, len(lanes) + 1)
+                first = m.started if m.started is not None else m.accepted
+                stop = m.completed if m.completed is not None else end
+                args = {"scene": run.name, "failed": m.failed}
+                if first is not None:
+                    span(f"{m.kind} (dispatch)", "latency", tid, m.issued, first, args)
+                    span(m.kind, "mission", tid, first, stop, args)
+                else:
+                    span(m.kind, "mission", tid, m.issued, stop, args)
+
+        for name, tid in lanes.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return self.path
+
+    def summary(self) -> str:
+        """Percentiles (ms) per mission type and per scene."""
+        lines = [f"{'type':<32}{'n':>5}{'start p50':>11}{'start p90':>11}{'dur p50':>10}{'dur p90':>10}{'dur max':>10}"]
+        by_kind: Dict[str, list[MissionSpan]] = {}
+        for run in self.runs:
+            for m in run.missions:
+                by_kind.setdefault(m.kind, []).append(m)
+
+        def ms(values, q):
+            return f"{_percentile(values, q) * 1000:.0f}" if values else "-"
+
+        for kind, spans in sorted(by_kind.items()):
+            lat = [m.start_latency for m in spans if m.start_latency is not None]
+            dur = [m.duration for m in spans if m.duration is not None]
+            lines.append(f"{kind:<32}{len(spans):>5}{ms(lat, 50):>11}{ms(lat, 90):>11}"
+                         f"{ms(dur, 50):>10}{ms(dur, 90):>10}{ms(dur, 100):>10}")
+
+        lines.append("")
+        lines.append(f"{'scene':<32}{'n':>5}{'total p50':>11}{'idle p50':>11}")
+        by_scene: Dict[str, list[SceneRun]] = {}
+        for run in self.runs:
+            if run.end is not None:
+                by_scene.setdefault(run.name, []).append(run)
+        for name, runs in sorted(by_scene.items()):
+            total = [r.end - r.begin for r in runs]
+            idle = [sum(b - a for a, b in r.idle_windows()) for r in runs]
+            lines.append(f"{name:<32}{len(runs):>5}{ms(total, 50):>11}{ms(idle, 50):>11}")
+        return "\n".join(lines)
+
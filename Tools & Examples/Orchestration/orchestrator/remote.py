@@ -0,0 +1,131 @@
+"""Remote control: HTTP + WebSocket commands and state push for operator clients."""
+
+import asyncio
+import json
+from typing import Any
+
+try:
+    from aiohttp import web, WSMsgType
+except ImportError:
+    web = None
+
+from .logs import log
+
+
+# =========================
+#  Remote control server
+# =========================
+class ControlServer:
+    """HTTP + WebSocket control of the orchestrator for operators away from the keyboard.
+
+    Routes:
+        GET  /status              -> state snapshot
+        POST /launch/{key}        -> start an action now
+        POST /queue/{key}         -> run an action after the current one
+        POST /cancel              -> cancel the current action and clear the queue
+        POST /reload              -> reload the scene file (robot stays connected)
+        GET  /ws                  -> WebSocket: receives {"cmd": ..., "key": ...},
+                                     pushes the state snapshot on every change
+    """
+
+    def __init__(self, orch: Any, host: str, port: int, token: str = ""):
+        self.orch = orch
+        self.host = host
+        self.port = port
+        self.token = token
+        self.clients: set = set()
+        self._runner = None
+        self._push_scheduled = False
+
+    async def start(self):
+        if web is None:
+            log("[REMOTE] aiohttp not installed, remote control disabled")
+            return
+
+        app = web.Application(middlewares=[self._auth()])
+        app.add_routes([
+            web.get("/status", self._status),
+            web.post("/launch/{key}", self._command("launch")),
+            web.post("/queue/{key}", self._command("queue")),
+            web.post("/cancel", self._command("cancel")),
+            web.post("/reload", self._command("reload")),
+            web.get("/ws", self._websocket),
+        ])
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        try:
+            await web.TCPSite(self._runner, self.host, self.port).start()
+            log(f"[REMOTE] Listening on http://{self.host}:{self.port}")
+        except OSError as e:
+            log(f"[REMOTE] Cannot bind {self.host}:{self.port}: {e}")
+            await self._runner.cleanup()
+            self._runner = None
+            return
+        self.orch.add_state_listener(self._schedule_push)
+
+    async def stop(self):
+        for ws in list(self.clients):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    # -------- HTTP --------
+    def _auth(self):
+        @web.middleware
+        async def middleware(request, handler):
+            if self.token and request.query.get("token") != self.token:
+                raise web.HTTPUnauthorized()
+            return await handler(request)
+        return middleware
+
+    async def _status(self, request):
+        return web.json_response(self.orch.snapshot(), dumps=_dumps)
+
+    def _command(self, command: str):
+        async def handler(request):
+            ok = await self.orch.dispatch(command, request.match_info.get("key"))
+            if not ok:
+                raise web.HTTPNotFound(text=f"Unknown action: {request.match_info.get('key')}")
+            return web.json_response(self.orch.snapshot(), dumps=_dumps)
+        return handler
+
+    # -------- WebSocket --------
+    async def _websocket(self, request):
+        ws = web.WebSocketResponse(heartbeat=10)
+        await ws.prepare(request)
+        self.clients.add(ws)
+        log(f"[REMOTE] Client connected ({len(self.clients)})")
+        try:
+            await ws.send_str(_dumps(self.orch.snapshot()))
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    data = json.loads(msg.data)
+                    ok = await self.orch.dispatch(data.get("cmd", ""), data.get("key"))
+                except (ValueError, AttributeError):
+                    ok = False
+                if not ok:
+                    await ws.send_str(_dumps({"error": f"Invalid command: {msg.data}"}))
+        finally:
+            self.clients.discard(ws)
+            log(f"[REMOTE] Client disconnected ({len(self.clients)})")
+        return ws
+
+    def _schedule_push(self):
+        # Several state changes in the same loop iteration -> one push
+        if self._push_scheduled or not self.clients:
+            return
+        self._push_scheduled = True
+        asyncio.get_running_loop().call_soon(self._push)
+
+    def _push(self):
+        self._push_scheduled = False
+        payload = _dumps(self.orch.snapshot())
+        for ws in list(self.clients):
+            if not ws.closed:
+                asyncio.create_task(ws.send_str(payload))
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
@@ -0,0 +1,102 @@
+"""Connection to the robot (or a simulator when pymirokai is missing)."""
+
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from .config import BATTERY_ALERT_VOLTS, ROBOT_VOLUME, TELEMETRY_TOPICS
+from .logs import log, logger
+from .telemetry import TelemetryBus, parse_battery_voltage
+
+
+# =========================
+#  Adapter Robot
+# =========================
+class RobotManager:
+    def __init__(self, robot_ip: str, api_key: str):
+        self.robot_ip = robot_ip
+        self.api_key = api_key
+        self.connected: bool = False
+        self.telemetry = TelemetryBus()
+        self._battery_alerted = False
+
+        try:
+            from pymirokai.robot import Robot
+            self.robot = Robot()  # ← this is the SDK robot instance
+            self._use_sim = False
+        except Exception as e:
+            print(f"[WARN] Using simulator: {e}")
+            self.robot = None
+            self._use_sim = True
+
+        # Simulated values
+        self._sim_battery = 42.69
+        self._sim_decay = -1
+        self._connection_obj = None
+
+        self.telemetry.subscribe(self._log_telemetry)
+
+    @property
+    def battery(self) -> Optional[float]:
+        return self.telemetry.get("battery")
+
+    async def connect(self):
+        log("---------------------------------------")
+        self.telemetry.attach(asyncio.get_running_loop())
+        if self._use_sim:
+            await asyncio.sleep(0.5)
+            self.connected = True
+            self.telemetry.publish("battery", self._sim_battery)
+            log("[ROBOT] SIM connected")
+            return
+
+        log(f"[ROBOT] Connecting to {self.robot_ip} …")
+        self._connection_obj = self.robot.connect(self.robot_ip, self.api_key)
+        await self._connection_obj.connected()
+        self.connected = True
+        log("[ROBOT] Connected successfully")
+
+        # Example boot beeps / volume
+        try:
+            await self.robot.play_animation_sound("meow").completed()
+            await self.robot.set_sound_level(ROBOT_VOLUME)
+            await self.robot.play_animation_sound("meow").completed()
+            log(f"[ROBOT] Volume set to {ROBOT_VOLUME}")
+        except Exception as e:
+            log(f"[ROBOT] Post-connect init error: {e}")
+
+        for topic in TELEMETRY_TOPICS:
+            self.robot.register_callback(topic, self._make_telemetry_callback(topic))
+            try:
+                await self.robot.subscribe(topic)
+                log(f"[ROBOT] {topic} callback registered")
+            except Exception as e:
+                log(f"[ROBOT] Subscribe {topic} error: {e}")
+
+    def _make_telemetry_callback(self, topic: str) -> Callable[[dict], None]:
+        """SDK callback (may run on the SDK thread): parse and hand over to the bus."""
+        def on_message(message: dict) -> None:
+            if topic == "battery_voltage":
+                try:
+                    voltage = parse_battery_voltage(message)
+                except Exception as e:
+                    voltage = None
+                    log(f"[BATTERY CALLBACK] Parse error: {e}")
+                if voltage is None:
+                    log("[BATTERY CALLBACK] No numeric voltage found in message")
+                self.telemetry.publish("battery", voltage)
+                return
+
+            value = message.get("data", message) if isinstance(message, dict) else message
+            self.telemetry.publish(topic, value)
+
+        return on_message
+
+    def _log_telemetry(self, changes: Dict[str, Any]) -> None:
+        for topic, value in changes.items():
+            if topic != "battery":
+                log(f"[TELEMETRY] {topic} = {value!r}")
+                continue
+            low = value is not None and value < BATTERY_ALERT_VOLTS
+            if low and not self._battery_alerted:
+                logger.warning(f"[BATTERY] Low voltage: {value:.2f} V")
+            self._battery_alerted = low
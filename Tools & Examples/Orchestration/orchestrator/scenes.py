@@ -0,0 +1,86 @@
+"""Scene files: per-use-case Python modules defining the `ACTIONS` key map."""
+
+import asyncio
+import importlib.util
+import inspect
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .config import DEMO_MODE
+from .logs import log
+
+SceneFunc = Callable[[Any], Awaitable[None]]
+
+
+async def handle_error(e, robot):
+    log(f"[ERROR] {str(e)}")
+    if(DEMO_MODE == False):
+        await robot.say(str(e)).completed()
+
+
+class SceneBook:
+    """Actions of one use case, loaded from its scene file.
+
+    The file is a Python module defining `ACTIONS = {key: async def scene(robot)}`.
+    Nothing is parsed at construction: `load_async()` compiles and runs the module
+    in a worker thread so it overlaps the robot connection. Until then `actions`
+    is empty and key presses are ignored.
+
+    Calling `load_async()` again hot-swaps the actions; if the new file is broken
+    the previous actions stay in place.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.actions: Dict[str, SceneFunc] = {}
+        self.module = None
+        self.error: Optional[str] = None
+        self.mtime: Optional[float] = None
+        self.generation = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self.module is not None
+
+    def primary_keys(self) -> list[str]:
+        """Keys shown to the operator ("num N" aliases are hidden)."""
+        return [k for k in self.actions if not k.startswith("num ")]
+
+    def changed(self) -> bool:
+        """True if the file was modified since the last load attempt."""
+        try:
+            return self.path.stat().st_mtime != self.mtime
+        except OSError:
+            return False
+
+    def load(self) -> Dict[str, SceneFunc]:
+        """Import the scene file and validate its `ACTIONS`. Raises on error."""
+        self.mtime = self.path.stat().st_mtime
+        spec = importlib.util.spec_from_file_location(f"scenes_{self.path.parent.parent.name}", self.path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load scene file {self.path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        actions = getattr(module, "ACTIONS", None)
+        if not isinstance(actions, dict):
+            raise ValueError(f"{self.path.name} must define an ACTIONS dict")
+        for key, func in actions.items():
+            if not inspect.iscoroutinefunction(func):
+                raise ValueError(f"ACTIONS[{key!r}] in {self.path.name} is not an async function")
+
+        self.module = module
+        self.actions = dict(actions)
+        self.error = None
+        self.generation += 1
+        return self.actions
+
+    async def load_async(self) -> Dict[str, SceneFunc]:
+        try:
+            actions = await asyncio.get_running_loop().run_in_executor(None, self.load)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            log(f"[SCENES] Load error in {self.path}: {self.error}")
+            raise
+        log(f"[SCENES] Loaded {len(self.primary_keys())} action(s) from {self.path} (v{self.generation})")
+        return actions
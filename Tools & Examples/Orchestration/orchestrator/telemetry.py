@@ -0,0 +1,99 @@
+"""Telemetry bus: SDK callbacks from any thread, delivered on the asyncio loop."""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .config import TELEMETRY_COALESCE_SECONDS
+from .logs import log
+
+
+class TelemetryBus:
+    """Fan-in of robot telemetry from any thread, fan-out to subscribers on the asyncio loop.
+
+    SDK callbacks call `publish()` from whatever thread they run on. Values are
+    coalesced per topic: subscribers receive only the latest value of each topic,
+    in one batch, at most once every `coalesce_interval` seconds.
+    """
+
+    def __init__(self, coalesce_interval: float = TELEMETRY_COALESCE_SECONDS):
+        self.coalesce_interval = coalesce_interval
+        self.latest: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: list[tuple[Optional[frozenset], Callable[[Dict[str, Any]], None]]] = []
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the bus to the loop that runs the subscribers."""
+        self._loop = loop
+        with self._lock:
+            if not self._pending or self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._schedule_flush()
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None], topics: Optional[Iterable[str]] = None) -> None:
+        """Register `callback(changes)`; `changes` maps topic -> latest value."""
+        self._subscribers.append((frozenset(topics) if topics else None, callback))
+
+    def get(self, topic: str, default: Any = None) -> Any:
+        return self.latest.get(topic, default)
+
+    def publish(self, topic: str, value: Any) -> None:
+        """Thread-safe: record the latest value of `topic` and schedule a flush."""
+        with self._lock:
+            self._pending[topic] = value
+            if self._flush_scheduled or self._loop is None:
+                return
+            self._flush_scheduled = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._loop.call_later, self.coalesce_interval, self._flush)
+        except RuntimeError:
+            # Loop closed (shutdown): drop the update
+            pass
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._flush_scheduled = False
+        if not batch:
+            return
+
+        self.latest.update(batch)
+        for topics, callback in list(self._subscribers):
+            changes = batch if topics is None else {t: v for t, v in batch.items() if t in topics}
+            if not changes:
+                continue
+            try:
+                callback(changes)
+            except Exception as e:
+                log(f"[TELEMETRY] Subscriber error: {e}")
+
+
+def parse_battery_voltage(message: Any) -> Optional[float]:
+    """Extract a voltage from the different payload shapes of `battery_voltage`."""
+    raw = None
+    if isinstance(message, dict):
+        if "data" in message:
+            raw = message["data"]            # <- your payload shape
+        else:
+            for k in ("voltage", "value", "battery", "battery_voltage", "v", "volt"):
+                if k in message:
+                    raw = message[k]
+                    break
+            if raw is None:
+                for v in message.values():
+                    if isinstance(v, (int, float)):
+                        raw = v
+                        break
+    else:
+        raw = message
+
+    if raw is None:
+        return None
+    return round(float(raw), 2)
@@ -2,14 +2,27 @@
     Example file show fake ASR functionality
     -> how to make the robot hear something typed
     /!\ Don't work in simulation
+
+    Each sentence is injected with the "fake_asr" mission, then the script waits for the
+    robot's reaction on the semantic_memory topic (first TTSEvent or MissionEvent, then
+    until the reply is quiet) instead of sleeping a fixed time, and reports the latency.
+
+    Interactive:   python fake_asr.py
+    Scripted:      python fake_asr.py --script utterances.txt --output results.jsonl
+                   (one sentence per line, empty lines and lines starting with # ignored)
 """
 
 import argparse
 import asyncio
+import json
 import logging
 import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
 from dotenv import load_dotenv
-from pprint import pprint
 from pymirokai.robot import Robot, connect
 from pymirokai.mission import Mission
 from pymirokai.utils.get_local_ip import get_local_ip
@@ -18,27 +31,212 @@ from pymirokai.utils.run_until_interruption import run_until_interruption
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("pymirokai_test")
 
+TOPIC = "semantic_memory"
+REPLY_TYPES = ("TTSEvent", "MissionEvent")
+TIMEOUT = 20.0  # seconds without any reaction: the utterance is counted as unanswered
+QUIET = 1.5  # seconds without a new reply event: the reply is over
+HISTORY = 256  # event keys remembered, more than the robot's memory window (50)
+
+
+@dataclass
+class Turn:
+    text: str
+    latency: Optional[float] = None  # s, mission sent → first reply event received
+    robot_latency: Optional[float] = None  # s, ASR event → first reply event, robot clock
+    duration: Optional[float] = None  # s, mission sent → last reply event received
+    replies: List[str] = field(default_factory=list)
+
+    @property
+    def answered(self) -> bool:
+        return self.latency is not None
+
+
+def _timestamp(event: Dict[str, Any]) -> Optional[float]:
+    try:
+        return float(event.get("timestamp"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _describe(event: Dict[str, Any]) -> str:
+    if event.get("type") == "MissionEvent":
+        return f"[{event.get('name')}] {event.get('arguments', '')}".strip()
+    return str(event.get("value", ""))
+
+
+class AsrDriver:
+    """Injects sentences with fake_asr and awaits the robot's reaction on semantic_memory."""
+
+    def __init__(self, robot: Robot, timeout: float = TIMEOUT, quiet: float = QUIET):
+        self.robot = robot
+        self.timeout = timeout
+        self.quiet = quiet
+        self._seen: "OrderedDict[Any, None]" = OrderedDict()
+        self._primed = asyncio.Event()
+        self._turn: Optional[Turn] = None
+        self._sent_at = 0.0
+        self._asr_timestamp: Optional[float] = None
+        self._event: Optional[asyncio.Future] = None  # resolved by the next reply event
+
+    async def start(self) -> None:
+        self.robot.register_callback(TOPIC, self._on_semantic_memory)
+        await self.robot.subscribe(TOPIC)
+        # Memory as it was before the first sentence: not part of any reply
+        try:
+            await asyncio.wait_for(self._primed.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"No {TOPIC} update received: is the topic published?")
+            self._primed.set()
+
+    async def stop(self) -> None:
+        await self.robot.unsubscribe(TOPIC)
+
+    def _on_semantic_memory(self, message: Dict[str, Any]) -> None:
+        # Every update carries the whole window: only the events not seen before are new
+        new = []
+        for event in message.get("data") or []:
+            key = (event.get("timestamp"), event.get("type"))
+            if key not in self._seen:
+                self._seen[key] = None
+                new.append(event)
+        while len(self._seen) > HISTORY:
+            self._seen.popitem(last=False)
+        if not self._primed.is_set():
+            self._primed.set()
+            return
+        for event in new:
+            self._on_event(event)
+
+    def _on_event(self, event: Dict[str, Any]) -> None:
+        turn = self._turn
+        if turn is None:
+            return
+        if event.get("type") == "PerceptionEvent" and event.get("perception_type") == "ASR":
+            if " ".join(str(event.get("value", "")).split()).lower() == " ".join(turn.text.split()).lower():
+                self._asr_timestamp = _timestamp(event)
+            return
+        if event.get("type") not in REPLY_TYPES or event.get("name") == "fake_asr":
+            return
+
+        elapsed = time.monotonic() - self._sent_at
+        if turn.latency is None:
+            turn.latency = elapsed
+            timestamp = _timestamp(event)
+            if timestamp is not None and self._asr_timestamp is not None:
+                turn.robot_latency = timestamp - self._asr_timestamp
+        turn.duration = elapsed
+        turn.replies.append(_describe(event))
+        if self._event is not None and not self._event.done():
+            self._event.set_result(event)
+
+    async def _next_event(self, timeout: float) -> bool:
+        self._event = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(self._event, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event = None
+
+    async def say(self, text: str) -> Turn:
+        """Make the robot hear `text`; returns once its reply is over (or timed out)."""
+        turn = self._turn = Turn(text)
+        self._asr_timestamp = None
+        self._sent_at = time.monotonic()
+        try:
+            if await Mission(self.robot, "fake_asr", text=text).completed(ignore_exceptions=True) is None:
+                logger.warning(f"fake_asr failed for {text!r}")
+                return turn
+            deadline = self._sent_at + self.timeout
+            if not turn.answered:
+                await self._next_event(max(0.0, deadline - time.monotonic()))
+            # The rest of the reply: sentences and missions until a quiet period
+            while turn.answered and time.monotonic() < deadline:
+                if not await self._next_event(min(self.quiet, deadline - time.monotonic())):
+                    break
+        finally:
+            self._turn = None
+        return turn
 
-async def run(ip: str, api_key: str) -> None:
+
+def quantile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summary(turns: List[Turn]) -> str:
+    answered = [t for t in turns if t.answered]
+    text = f"{len(answered)}/{len(turns)} answered"
+    if answered:
+        latencies = [t.latency for t in answered]
+        text += (
+            f", latency p50 {quantile(latencies, 0.5):.2f}s p90 {quantile(latencies, 0.9):.2f}s"
+            f" max {max(latencies):.2f}s"
+        )
+        robot = [t.robot_latency for t in answered if t.robot_latency is not None]
+        if robot:
+            text += f", on robot p50 {quantile(robot, 0.5):.2f}s"
+    return text
+
+
+def read_script(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+async def run(ip: str, api_key: str, script: Optional[str], output: Optional[str], timeout: float, quiet: float) -> None:
     """Run the robot and demonstrate fake ASR functionality."""
     async with connect(ip=ip, api_key=api_key) as robot:
-        await fake_asr(robot)
+        driver = AsrDriver(robot, timeout=timeout, quiet=quiet)
+        await driver.start()
+        try:
+            if script:
+                await run_script(driver, read_script(script), output)
+            else:
+                await fake_asr(driver)
+        finally:
+            await driver.stop()
+
+
+async def run_script(driver: AsrDriver, utterances: List[str], output: Optional[str]) -> None:
+    """Say every utterance in turn and report the latencies."""
+    turns = []
+    report = open(output, "w", encoding="utf-8") if output else None
+    try:
+        for i, text in enumerate(utterances, 1):
+            turn = await driver.say(text)
+            turns.append(turn)
+            latency = f"{turn.latency:.2f}s" if turn.answered else "no reply"
+            logger.info(f"[{i}/{len(utterances)}] {text!r}: {latency}")
+            if report:
+                report.write(json.dumps(asdict(turn), ensure_ascii=False) + "\n")
+                report.flush()
+    finally:
+        if report:
+            report.close()
+        if turns:
+            logger.info(summary(turns))
 
 
-async def fake_asr(robot: Robot) -> None:
+async def fake_asr(driver: AsrDriver) -> None:
     """Demonstrate fake ASR functionality."""
-    sub = "semantic_memory"
-    robot.subscribe(sub)
+    loop = asyncio.get_running_loop()
+    turns = []
     try:
         while True:
-            user_input = input("\n>>> ")
-            await Mission(robot, "fake_asr", text=user_input).completed()
-            await asyncio.sleep(2)
-            if sub in robot.websocket_api.data:
-                pprint(robot.websocket_api.data[sub])
-    except KeyboardInterrupt:
+            user_input = await loop.run_in_executor(None, input, "\n>>> ")
+            if not user_input.strip():
+                continue
+            turn = await driver.say(user_input)
+            turns.append(turn)
+            for reply in turn.replies:
+                print(f"  {reply}")
+            print(f"  ({turn.latency:.2f}s)" if turn.answered else f"  (no reply within {driver.timeout:.0f}s)")
+    except (KeyboardInterrupt, EOFError):
         pass
-    await robot.unsubscribe(sub)
+    if turns:
+        logger.info(summary(turns))
 
 
 async def main() -> None:
@@ -65,8 +263,32 @@ async def main() -> None:
         type=str,
         default=os.getenv("PYMIROKAI_API_KEY", ""),
     )
+    parser.add_argument(
+        "-s",
+        "--script",
+        help="Text file of sentences to say one after the other (one per line).",
+        type=str,
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write one JSON line per sentence (text, latencies, replies) to this file.",
+        type=str,
+    )
+    parser.add_argument(
+        "--timeout",
+        help="Seconds to wait for the robot's reaction to a sentence.",
+        type=float,
+        default=TIMEOUT,
+    )
+    parser.add_argument(
+        "--quiet",
+        help="Seconds without a new reply event after which the reply is over.",
+        type=float,
+        default=QUIET,
+    )
     args = parser.parse_args()
-    await run(ip=args.ip, api_key=args.api_key)
+    await run(args.ip, args.api_key, args.script, args.output, args.timeout, args.quiet)
 
 
 if __name__ == "__main__":
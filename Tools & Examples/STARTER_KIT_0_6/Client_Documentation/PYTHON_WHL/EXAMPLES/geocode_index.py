@@ -0,0 +1,225 @@
+"""
+On-disk geocoding index for the weather skill.
+
+Visitors at an event ask about the same few cities: looking them up locally removes the
+geocoding round-trip from most weather requests, and keeps the skill working when the
+venue network is down.
+
+- SQLite file (GEOCODE_DB, default ~/.cache/mirokai/geocode_index.sqlite3), created and
+  seeded with common cities on first use.
+- Every name is stored as normalized aliases (case, accents, punctuation and "-" ignored):
+  "Riyadh", "Ar Riyad", "riyad" and "الرياض" find the same place.
+- Places geocoded over the network are added with the query, their name and their
+  postcodes, so ZIP codes work offline the next time.
+- Near misses ("Riyahd") are matched with difflib against the known aliases; weather.py only
+  does this when the network cannot resolve the name, since "Lyons" is not a typo of "Lyon".
+
+Upload this file next to weather.py. Add a venue-specific alias from the command line:
+    python geocode_index.py --alias "KAFD" riyadh
+    python geocode_index.py "ar riyad"
+    python geocode_index.py --check            # known ambiguous names resolve as expected
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sqlite3
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+DEFAULT_PATH = Path(os.getenv("GEOCODE_DB", Path.home() / ".cache" / "mirokai" / "geocode_index.sqlite3"))
+FUZZY_CUTOFF = 0.85
+SCHEMA_VERSION = 2  # 2: Oman aliases, seeds override learned aliases
+
+# name, country code, latitude, longitude, aliases
+SEED = [
+    ("Riyadh", "SA", 24.6877, 46.7219, ["ar riyad", "riyad", "er riyadh", "الرياض"]),
+    ("Jeddah", "SA", 21.4858, 39.1925, ["jiddah", "jedda", "jidda", "جدة"]),
+    ("Mecca", "SA", 21.3891, 39.8579, ["makkah", "makka", "مكة"]),
+    ("Medina", "SA", 24.5247, 39.5692, ["madinah", "al madinah", "المدينة"]),
+    ("Dammam", "SA", 26.4207, 50.0888, ["ad dammam", "الدمام"]),
+    ("Khobar", "SA", 26.2172, 50.1971, ["al khobar", "al khubar", "الخبر"]),
+    ("Dubai", "AE", 25.2048, 55.2708, ["dubayy", "دبي"]),
+    ("Abu Dhabi", "AE", 24.4539, 54.3773, ["abudhabi", "أبوظبي"]),
+    ("Doha", "QA", 25.2854, 51.5310, ["ad dawhah", "الدوحة"]),
+    ("Kuwait City", "KW", 29.3759, 47.9774, ["kuwait", "al kuwayt"]),
+    ("Manama", "BH", 26.2285, 50.5860, ["al manamah", "bahrain"]),
+    ("Muscat", "OM", 23.5880, 58.3829, ["masqat", "oman", "سلطنة عمان", "مسقط"]),
+    ("Cairo", "EG", 30.0444, 31.2357, ["al qahirah", "القاهرة"]),
+    # Without diacritics عمّان (Amman) and عُمان (Oman) are both "عمان": the city wins,
+    # Oman is reached with "oman" or "سلطنة عمان"
+    ("Amman", "JO", 31.9454, 35.9284, ["عمان"]),
+    ("Istanbul", "TR", 41.0082, 28.9784, ["constantinople"]),
+    ("Paris", "FR", 48.8566, 2.3522, []),
+    ("Lyon", "FR", 45.7640, 4.8357, []),
+    ("Marseille", "FR", 43.2965, 5.3698, ["marseilles"]),
+    ("London", "GB", 51.5074, -0.1278, ["londres"]),
+    ("Berlin", "DE", 52.5200, 13.4050, []),
+    ("Madrid", "ES", 40.4168, -3.7038, []),
+    ("Rome", "IT", 41.9028, 12.4964, ["roma"]),
+    ("New York", "US", 40.7128, -74.0060, ["new york city", "nyc"]),
+    ("Los Angeles", "US", 34.0522, -118.2437, []),
+    ("Tokyo", "JP", 35.6762, 139.6503, []),
+    ("Beijing", "CN", 39.9042, 116.4074, ["peking", "pekin"]),
+    ("Seoul", "KR", 37.5665, 126.9780, ["seoul city"]),
+    ("Singapore", "SG", 1.3521, 103.8198, []),
+    ("Mumbai", "IN", 19.0760, 72.8777, ["bombay"]),
+    ("Sydney", "AU", -33.8688, 151.2093, []),
+]
+
+# query, expected place name: checked by --check
+CHECKS = [
+    ("ar riyad", "Riyadh"),
+    ("الرياض", "Riyadh"),
+    ("Riyahd", "Riyadh"),
+    ("عمان", "Amman"),
+    ("عمّان", "Amman"),
+    ("Oman", "Muscat"),
+    ("سلطنة عمان", "Muscat"),
+]
+
+
+class Place(NamedTuple):
+    name: str
+    country: str
+    latitude: float
+    longitude: float
+
+
+def normalize(text: str) -> str:
+    """Lowercase, no accents (Arabic letters kept), punctuation and dashes as spaces."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w]+", " ", text).split())
+
+
+class GeocodeIndex:
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self._aliases: Optional[List[str]] = None  # for fuzzy matching, loaded on first miss
+        if self.db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._create()
+
+    def _create(self) -> None:
+        with self.db:
+            self.db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS places (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    country TEXT NOT NULL DEFAULT '',
+                    latitude REAL NOT NULL,
+                    longitude REAL NOT NULL,
+                    UNIQUE (latitude, longitude)
+                );
+                CREATE TABLE IF NOT EXISTS aliases (
+                    alias TEXT PRIMARY KEY,
+                    place_id INTEGER NOT NULL REFERENCES places(id)
+                );
+                """
+            )
+            for name, country, latitude, longitude, aliases in SEED:
+                place_id = self._insert_place(name, country, latitude, longitude)
+                self._insert_aliases(place_id, [name, *aliases], replace=True)
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # === Lookup ===
+    def lookup(self, query: str, fuzzy: bool = True) -> Optional[Place]:
+        key = normalize(query)
+        if not key:
+            return None
+        place = self._get(key)
+        if place is None and fuzzy and not key.isdigit():  # no fuzzy ZIP codes
+            if self._aliases is None:
+                self._aliases = [row[0] for row in self.db.execute("SELECT alias FROM aliases")]
+            match = difflib.get_close_matches(key, self._aliases, n=1, cutoff=FUZZY_CUTOFF)
+            if match:
+                place = self._get(match[0])
+        return place
+
+    def _get(self, alias: str) -> Optional[Place]:
+        row = self.db.execute(
+            "SELECT p.name, p.country, p.latitude, p.longitude FROM aliases a JOIN places p ON p.id = a.place_id "
+            "WHERE a.alias = ?",
+            (alias,),
+        ).fetchone()
+        return Place(*row) if row else None
+
+    # === Learning ===
+    def add_result(self, query: str, result: Dict[str, Any]) -> Place:
+        """Store an Open-Meteo geocoding result under the query, its name and its postcodes."""
+        place = Place(result["name"], result.get("country_code", ""), result["latitude"], result["longitude"])
+        with self.db:
+            place_id = self._insert_place(*place)
+            self._insert_aliases(place_id, [query, place.name, *result.get("postcodes", [])])
+        return place
+
+    def add_alias(self, alias: str, place_query: str) -> Place:
+        place = self.lookup(place_query, fuzzy=False)
+        if place is None:
+            raise KeyError(f"Unknown place: {place_query}")
+        with self.db:
+            place_id = self._insert_place(*place)
+            self._insert_aliases(place_id, [alias])
+        return place
+
+    def _insert_place(self, name: str, country: str, latitude: float, longitude: float) -> int:
+        self.db.execute(
+            "INSERT OR IGNORE INTO places (name, country, latitude, longitude) VALUES (?, ?, ?, ?)",
+            (name, country, latitude, longitude),
+        )
+        return self.db.execute(
+            "SELECT id FROM places WHERE latitude = ? AND longitude = ?", (latitude, longitude)
+        ).fetchone()[0]
+
+    def _insert_aliases(self, place_id: int, aliases: Iterable[str], replace: bool = False) -> None:
+        keys = {normalize(a) for a in aliases} - {""}
+        # An existing alias keeps its place: seeds and manual aliases win over later results
+        # (seeds replace what an older index learned when it is upgraded)
+        verb = "REPLACE" if replace else "IGNORE"
+        self.db.executemany(f"INSERT OR {verb} INTO aliases (alias, place_id) VALUES (?, ?)", [(k, place_id) for k in keys])
+        self._aliases = None
+
+    # === Self-check ===
+    def check(self) -> List[str]:
+        """Return the CHECKS queries that do not resolve to their expected place."""
+        failures = []
+        for query, expected in CHECKS:
+            place = self.lookup(query)
+            if place is None or place.name != expected:
+                failures.append(f"{query!r} → {place.name if place else None}, expected {expected}")
+        return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query or extend the weather skill's geocoding index.")
+    parser.add_argument("place", nargs="?", help="Place to look up (or to alias, with --alias).")
+    parser.add_argument("--alias", help="Add this name as an alias of the place.")
+    parser.add_argument("--check", action="store_true", help="Check that known ambiguous names resolve as expected.")
+    parser.add_argument("--db", type=Path, default=DEFAULT_PATH)
+    args = parser.parse_args()
+    if not args.place and not args.check:
+        parser.error("a place is required unless --check is given.")
+
+    index = GeocodeIndex(args.db)
+    if args.check:
+        failures = index.check()
+        for failure in failures:
+            print(f"✗ {failure}")
+        print(f"{len(CHECKS) - len(failures)}/{len(CHECKS)} check(s) passed.")
+        sys.exit(1 if failures else 0)
+    if args.alias:
+        place = index.add_alias(args.alias, args.place)
+        print(f"{args.alias!r} → {place.name} ({place.latitude}, {place.longitude})")
+        return
+    place = index.lookup(args.place)
+    print(place if place else f"{args.place!r} is not in {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Shared async HTTP client for network skills, with a response cache.
+
+Skills run on the robot's event loop: a blocking `requests.get` stalls every other
+skill and callback for as long as the server takes to answer. This module provides:
+
+- one aiohttp session per event loop (pooled keep-alive connections, DNS cache),
+- an in-memory cache keyed by URL + parameters, with a TTL chosen per call
+  (`ttl=None`: kept until evicted, e.g. geocodes; `ttl=0`: not cached),
+- request coalescing: identical requests in flight at the same time (on the same loop)
+  share one call; each caller still waits at most its own `timeout`.
+
+Upload this file next to the skills that import it. Cached values are shared between
+callers: do not modify them.
+
+    data = await get_json("https://api.open-meteo.com/v1/forecast", {"latitude": 24.7}, ttl=900)
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import aiohttp
+
+MAX_ENTRIES = 256
+CONNECTIONS = 8
+DNS_TTL = 300
+
+logger = logging.getLogger("http_cache")
+
+
+class TTLCache:
+    """LRU-bounded mapping whose entries expire after their own TTL."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires is not None and expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        if ttl == 0:
+            return
+        self._data[key] = (None if ttl is None else time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+CACHE = TTLCache()
+STATS = Counter()  # "hit", "miss", "shared" (joined a request already in flight)
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+# Futures belong to their loop: requests are only shared between callers of the same loop
+_in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """The shared session of the running event loop."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=CONNECTIONS, ttl_dns_cache=DNS_TTL)
+        session = _sessions[loop] = aiohttp.ClientSession(connector=connector)
+    return session
+
+
+async def close() -> None:
+    """Close the session of the running loop (end of a script)."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def _request(url: str, params: Dict[str, Any], timeout: float, as_json: bool) -> Any:
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with get_session().get(url, params=params, timeout=client_timeout) as response:
+        response.raise_for_status()
+        if as_json:
+            return await response.json(content_type=None)
+        return await response.read()
+
+
+async def _get(url: str, params: Optional[Dict[str, Any]], ttl: Optional[float], timeout: float, as_json: bool) -> Any:
+    params = {k: str(v) for k, v in (params or {}).items()}
+    key = (url, tuple(sorted(params.items())), as_json)
+    value = CACHE.get(key)
+    if value is not None:
+        STATS["hit"] += 1
+        return value
+
+    in_flight = _in_flight.setdefault(asyncio.get_running_loop(), {})
+    deadline = time.monotonic() + timeout
+    future = in_flight.get(key)
+    shared = future is not None
+    if shared:
+        STATS["shared"] += 1
+    else:
+        STATS["miss"] += 1
+        future = in_flight[key] = asyncio.ensure_future(_request(url, params, timeout, as_json))
+
+        def done(f: asyncio.Future) -> None:
+            if in_flight.get(key) is f:
+                del in_flight[key]
+            if not f.cancelled() and f.exception() is None:
+                CACHE.set(key, f.result(), ttl)
+
+        future.add_done_callback(done)
+    try:
+        # shield: a cancelled (or timed out) caller does not cancel the request other callers wait for
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        remaining = deadline - time.monotonic()
+        if not shared or remaining <= 0:
+            raise
+    # The shared request ran out of the first caller's shorter timeout: retry within ours
+    value = await _request(url, params, remaining, as_json)
+    CACHE.set(key, value, ttl)
+    return value
+
+
+async def get_json(url: str, params: Optional[Dict[str, Any]] = None, ttl: Optional[float] = 0, timeout: float = 5) -> Any:
+    """GET a JSON document. Raises aiohttp.ClientError / asyncio.TimeoutError on failure."""
+    return await _get(url, params, ttl, timeout, as_json=True)
+
+
+async def get_bytes(url: str, params: Optional[Dict[str, Any]] = None, ttl: Optional[float] = 0, timeout: float = 5) -> bytes:
+    """GET a raw body (RSS, images…). Raises aiohttp.ClientError / asyncio.TimeoutError on failure."""
+    return await _get(url, params, ttl, timeout, as_json=False)
@@ -8,16 +8,29 @@ headlines using Google News RSS feeds, processes the results, and presents the h
 full article. If no news is found or the request fails, an appropriate message is returned.
 
 A utility function `remove_urls` is included to sanitize responses by removing URLs from the text output.
+The feed is fetched with `http_cache.py` (upload it next to this skill) without blocking the event loop, and kept
+NEWS_TTL seconds per country. GOOGLE_NEWS_RSS_URL can point at `stub_services.py` for offline tests.
 /!\ Work only in simulation
 """
 
-import requests
+import asyncio
+import os
 import re
+import sys
+from pathlib import Path
+
+import aiohttp
 from bs4 import BeautifulSoup
 
 from pymirokai.decorators.skill import skill, ParameterDescription
 from pymirokai.enums.enums import AccessLevel
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import http_cache  # noqa: E402
+
+NEWS_URL = os.getenv("GOOGLE_NEWS_RSS_URL", "https://news.google.com/rss")
+NEWS_TTL = 5 * 60
+
 VALID_COUNTRIES = {
     "us": "en-US",
     "fr": "fr-FR",
@@ -51,14 +64,13 @@ async def fetch_news(robot, country: str = "us", timeout: int = 5):
     country_code = country.lower()
     lang_region = VALID_COUNTRIES.get(country_code, "en-US")
 
-    rss_url = f"https://news.google.com/rss?hl={lang_region}&gl={country_code}&ceid={country_code}:en"
+    params = {"hl": lang_region, "gl": country_code, "ceid": f"{country_code}:en"}
 
     try:
-        response = requests.get(rss_url, timeout=timeout)
-        response.raise_for_status()
+        content = await http_cache.get_bytes(NEWS_URL, params, ttl=NEWS_TTL, timeout=timeout)
 
         # Parse XML with BeautifulSoup
-        soup = BeautifulSoup(response.content, "xml")
+        soup = BeautifulSoup(content, "xml")
         items = soup.find_all("item")
 
         if items:
@@ -71,7 +83,7 @@ async def fetch_news(robot, country: str = "us", timeout: int = 5):
         else:
             answer = "No news found at the moment."
 
-    except requests.RequestException:
+    except (aiohttp.ClientError, asyncio.TimeoutError):
         answer = "Couldn't fetch the news at this time."
 
     return {"llm_output": remove_urls(answer)}
@@ -6,6 +6,8 @@ import argparse
 import asyncio
 import logging
 import os
+from typing import Dict, List, Optional
+
 from dotenv import load_dotenv
 from pymirokai.robot import connect, Robot
 from pymirokai.mission import MissionError
@@ -14,42 +16,98 @@ from pymirokai.utils.run_until_interruption import run_until_interruption
 
 logger = logging.getLogger("pymirokai")
 
-# A global state to track the last detected click type
-last_click_state = {}
+CLICK_STATES = ("long_pressed", "double_clicked", "clicked")
 
 
-async def run(ip: str, api_key: str, rune: str) -> None:
+async def run(ip: str, api_key: str, runes: List[str]) -> None:
     """Run the robot, demonstrating various features."""
     async with connect(ip=ip, api_key=api_key) as robot:
         # Subscribe to topic runes
         await robot.subscribe("runes")
 
         # Register callback for rune events
-        robot.register_callback("runes", lambda msg: asyncio.create_task(rune_event(robot, msg, rune)))
+        watcher = RuneWatcher(robot, runes)
+        robot.register_callback("runes", watcher.on_message)
 
-        # Keep the script running indefinitely
-        await asyncio.Future()
+        try:
+            # Keep the script running indefinitely
+            await asyncio.Future()
+        finally:
+            logger.info(f"{watcher.messages} rune message(s), {watcher.evaluations} evaluation(s)")
 
 
-async def rune_event(robot: Robot, msg: dict, rune: str) -> None:
-    """Handle rune events."""
-    global last_click_state
+async def get_click_states(robot: Robot, rune: str) -> Dict[str, bool]:
+    """Click states of one rune, queried concurrently: one round-trip instead of three."""
+    results = await asyncio.gather(robot.is_long_pressed(rune), robot.is_double_clicked(rune), robot.is_clicked(rune))
+    return {state: result["result"] for state, result in zip(CLICK_STATES, results)}
 
-    try:
-        states = {
-            "long_pressed": (await robot.is_long_pressed(rune))["result"],
-            "double_clicked": (await robot.is_double_clicked(rune))["result"],
-            "clicked": (await robot.is_clicked(rune))["result"],
-        }
-        if last_click_state is None or last_click_state != states:
-            last_click_state = states
+
+async def get_all_click_states(robot: Robot, runes: List[str]) -> Dict[str, Dict[str, bool]]:
+    """Click states of several runes with three concurrent list queries, whatever their number."""
+    results = await asyncio.gather(
+        robot.get_long_pressed_runes(), robot.get_double_clicked_runes(), robot.get_clicked_runes()
+    )
+    lists = {state: set(result["result"]) for state, result in zip(CLICK_STATES, results)}
+    return {rune: {state: rune in lists[state] for state in CLICK_STATES} for rune in runes}
+
+
+class RuneWatcher:
+    """Reacts to the click state changes of runes on "runes" messages.
+
+    The first message of a burst is evaluated at once; the messages received while an
+    evaluation is running collapse into a single follow-up evaluation.
+    """
+
+    def __init__(self, robot: Robot, runes: List[str]):
+        self.robot = robot
+        self.runes = runes
+        self.last_click_state: Dict[str, Dict[str, bool]] = {}
+        self.messages = 0
+        self.evaluations = 0
+        self._task: Optional[asyncio.Task] = None
+        self._dirty = False
+
+    def on_message(self, msg: dict) -> None:
+        self.messages += 1
+        if self._task is not None and not self._task.done():
+            self._dirty = True
+            return
+        self._task = asyncio.create_task(self._evaluate_until_clean())
+
+    async def _evaluate_until_clean(self) -> None:
+        while True:
+            self._dirty = False
+            try:
+                await self.evaluate()
+            except MissionError:
+                logger.warning("Mission error occurred while handling rune event.")
+            if not self._dirty:
+                return
+
+    async def evaluate(self) -> None:
+        self.evaluations += 1
+        if len(self.runes) == 1:
+            all_states = {self.runes[0]: await get_click_states(self.robot, self.runes[0])}
+        else:
+            all_states = await get_all_click_states(self.robot, self.runes)
+
+        for rune, states in all_states.items():
+            if self.last_click_state.get(rune) == states:
+                continue
+            self.last_click_state[rune] = states
+            # Reactions run on their own: the next messages are evaluated while the robot speaks
             if states["clicked"]:
-                await react_click(robot, rune)
+                asyncio.create_task(rune_event(react_click, self.robot, rune))
             elif states["double_clicked"]:
-                await react_double_click(robot, rune)
+                asyncio.create_task(rune_event(react_double_click, self.robot, rune))
             elif states["long_pressed"]:
-                await react_long_click(robot, rune)
+                asyncio.create_task(rune_event(react_long_click, self.robot, rune))
 
+
+async def rune_event(reaction, robot: Robot, rune: str) -> None:
+    """Handle rune events."""
+    try:
+        await reaction(robot, rune)
     except MissionError:
         logger.warning("Mission error occurred while handling rune event.")
 
@@ -94,11 +152,12 @@ async def main() -> None:
         default=os.getenv("PYMIROKAI_API_KEY", ""),
     )
     parser.add_argument(
-        "-r", 
-        "--rune_name", 
-        help="Rune on which you want to run the behavior.", 
-        type=str, 
-        default="HANDLEA",
+        "-r",
+        "--rune_name",
+        help="Rune(s) on which you want to run the behavior.",
+        type=str,
+        nargs="+",
+        default=["HANDLEA"],
     )
     args = parser.parse_args()
 
@@ -0,0 +1,119 @@
+"""
+Local stand-in for the web services used by the weather and news examples, to run them
+offline (or at a venue without internet) and to measure the effect of http_cache.
+
+Serves, with a configurable latency:
+    GET /v1/search     Open-Meteo geocoding (a few known cities)
+    GET /v1/forecast   Open-Meteo forecast (current_weather or 48 hourly values, synthetic)
+    GET /rss           Google News RSS (two fixed items)
+    GET /stats         number of requests per route
+
+Usage:
+    python stub_services.py --port 8790 --latency 300
+    export OPEN_METEO_GEOCODING_URL=http://127.0.0.1:8790/v1/search
+    export OPEN_METEO_FORECAST_URL=http://127.0.0.1:8790/v1/forecast
+    export GOOGLE_NEWS_RSS_URL=http://127.0.0.1:8790/rss
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+from collections import Counter
+from datetime import datetime, timedelta
+
+from aiohttp import web
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger("stub_services")
+
+CITIES = {
+    # name: (latitude, longitude, country code, postcodes)
+    "riyadh": (24.68773, 46.72185, "SA", []),
+    "paris": (48.85341, 2.3488, "FR", ["75001", "75002"]),
+    "london": (51.50853, -0.12574, "GB", []),
+    "dubai": (25.07725, 55.30927, "AE", []),
+    "tokyo": (35.6895, 139.69171, "JP", []),
+    "nantes": (47.21725, -1.55336, "FR", ["44000", "44100"]),
+}
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Stub news</title>
+<item><title>Robots welcome visitors at the forum</title>
+<description>A humanoid robot answered questions all day long.</description>
+<link>https://example.com/robots</link></item>
+<item><title>Second headline</title><description>Less important.</description>
+<link>https://example.com/second</link></item>
+</channel></rss>"""
+
+STATS = Counter()
+
+
+def latency_middleware(latency: float):
+    @web.middleware
+    async def middleware(request: web.Request, handler):
+        if request.path != "/stats":
+            STATS[request.path] += 1
+            await asyncio.sleep(latency)
+        return await handler(request)
+
+    return middleware
+
+
+async def search(request: web.Request) -> web.Response:
+    query = request.query.get("name", "").strip().lower()
+    name = next((n for n, city in CITIES.items() if query == n or query in city[3]), None)
+    if name is None:
+        return web.json_response({"generationtime_ms": 0.1})
+    latitude, longitude, country, postcodes = CITIES[name]
+    result = {"name": name.title(), "latitude": latitude, "longitude": longitude, "country_code": country}
+    return web.json_response({"results": [dict(result, postcodes=postcodes)]})
+
+
+async def forecast(request: web.Request) -> web.Response:
+    latitude = float(request.query.get("latitude", 0))
+    if request.query.get("current_weather") == "true":
+        return web.json_response(
+            {"current_weather": {"temperature": 30 - abs(latitude) / 3, "weathercode": 1, "windspeed": 12.0, "winddirection": 200}}
+        )
+    start = datetime.now().replace(minute=0, second=0, microsecond=0)
+    hours = range(48)
+    return web.json_response(
+        {
+            "hourly": {
+                "time": [(start + timedelta(hours=h)).strftime("%Y-%m-%dT%H:%M") for h in hours],
+                "temperature_2m": [round(25 + 6 * math.sin(h / 24 * 2 * math.pi), 1) for h in hours],
+                "precipitation": [0.4 if 14 <= h % 24 <= 16 else 0.0 for h in hours],
+                "weathercode": [61 if 14 <= h % 24 <= 16 else 2 for h in hours],
+                "windspeed_10m": [10 + h % 7 for h in hours],
+                "winddirection_10m": [(h * 37) % 360 for h in hours],
+            }
+        }
+    )
+
+
+async def rss(request: web.Request) -> web.Response:
+    return web.Response(text=RSS, content_type="application/rss+xml")
+
+
+async def stats(request: web.Request) -> web.Response:
+    return web.json_response(dict(STATS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Open-Meteo / Google News server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--latency", type=float, default=300, help="Per-request latency (ms).")
+    args = parser.parse_args()
+
+    app = web.Application(middlewares=[latency_middleware(args.latency / 1000)])
+    app.router.add_get("/v1/search", search)
+    app.router.add_get("/v1/forecast", forecast)
+    app.router.add_get("/rss", rss)
+    app.router.add_get("/stats", stats)
+    web.run_app(app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
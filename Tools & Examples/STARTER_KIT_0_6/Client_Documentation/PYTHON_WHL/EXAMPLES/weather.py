@@ -5,20 +5,40 @@ The main skill, `get_weather`, retrieves weather data for a specified location (
 Open-Meteo API. Users can request either the current weather or an hourly forecast, and select between metric or
 imperial units. The response includes temperature, weather description, wind speed/direction, and precipitation data.
 
-The module includes helper functions for formatting weather codes, time strings, and wind directions, as well as for
-converting units. Data is formatted for both verbal presentation by the robot and optional logging/printing.
+The module includes helper functions for formatting weather codes and wind directions, as well as for converting
+units. The 48-hour forecast is converted column by column and summarized per day
+(temperature range, prevailing weather, strongest wind, rain windows) so the LLM gets a few lines instead of 48.
+
+HTTP calls go through `http_cache.py` (upload it next to this skill): they do not block the robot's event loop,
+and weather is cached for WEATHER_TTL seconds, so a repeated question answers from memory. Locations are first
+looked up in the on-disk index of `geocode_index.py` (also uploaded next to this skill), which learns every place
+geocoded over the network. The API base URLs can be pointed at `stub_services.py` with the OPEN_METEO_* variables.
 """
 
+import asyncio
 import logging
-import requests
+import os
+import sys
+from pathlib import Path
 
-from datetime import datetime
-from typing import Dict
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
 
 from pymirokai.decorators.skill import skill, ParameterDescription
 from pymirokai.enums.enums import AccessLevel, FaceAnim
 from pymirokai.robot import Robot
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import http_cache  # noqa: E402
+from geocode_index import GeocodeIndex  # noqa: E402
+
+GEOCODING_URL = os.getenv("OPEN_METEO_GEOCODING_URL", "https://geocoding-api.open-meteo.com/v1/search")
+FORECAST_URL = os.getenv("OPEN_METEO_FORECAST_URL", "https://api.open-meteo.com/v1/forecast")
+WEATHER_TTL = 15 * 60  # Open-Meteo refreshes current conditions every 15 minutes
+GEOCODES = GeocodeIndex()
+
 # Set up logging configuration
 logging.basicConfig(
     level=logging.INFO,  # You can adjust the logging level to DEBUG, WARNING, ERROR, etc.
@@ -68,32 +88,32 @@ async def get_weather(
     Returns:
         None: Logs the weather data.
     """
-    await robot.move_ears_to_target(0.2).completed()
-    await robot.play_face_reaction(FaceAnim.PERPLEXED).completed()
-    # Fetch coordinates directly inside the function
-    response = requests.get(
-        f"https://geocoding-api.open-meteo.com/v1/search?name={location}&count=1&language=en&format=json",
-        timeout=timeout,
-    )
-    results = response.json().get("results", [])
-    if not results:
-        logging.error("Invalid location!")
-        return
-    latitude, longitude = results[0]["latitude"], results[0]["longitude"]
-
-    # Build URL directly inside the function, incorporating the unit system
-    units = "metric" if is_metric else "imperial"
-    fc = "hourly=temperature_2m,precipitation,weathercode,windspeed_10m,winddirection_10m"
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&"
-        f"{fc if forecast else 'current_weather=true'}&"
-        f"timezone=auto&units={units}"
-    )
-    logging.debug(f"Fetching {'48-hour forecast' if forecast else 'current weather'} for {location}...\n")
+    # Geocoding starts now and runs while the robot reacts
+    coordinates = asyncio.ensure_future(geocode(location, timeout))
+    try:
+        await robot.move_ears_to_target(0.2).completed()
+        await robot.play_face_reaction(FaceAnim.PERPLEXED).completed()
+    except BaseException:
+        # A failed reaction ends the skill: do not leave the geocoding task (and its exception) behind
+        coordinates.cancel()
+        await asyncio.gather(coordinates, return_exceptions=True)
+        raise
 
+    units = "metric" if is_metric else "imperial"
     try:
-        # Fetch and process data directly inside the function
-        data = requests.get(url, timeout=timeout).json()
+        place = await coordinates
+        if place is None:
+            logging.error("Invalid location!")
+            return
+        latitude, longitude = place
+
+        params = {"latitude": latitude, "longitude": longitude, "timezone": "auto", "units": units}
+        if forecast:
+            params["hourly"] = "temperature_2m,precipitation,weathercode,windspeed_10m,winddirection_10m"
+        else:
+            params["current_weather"] = "true"
+        logging.debug(f"Fetching {'48-hour forecast' if forecast else 'current weather'} for {location}...\n")
+        data = await http_cache.get_json(FORECAST_URL, params, ttl=WEATHER_TTL, timeout=timeout)
         weather_data = {"location": location, "units": units}
 
         if "current_weather" in data:
@@ -110,24 +130,7 @@ async def get_weather(
             )
 
         if forecast and "hourly" in data:
-            weather_data["forecast"] = [
-                {
-                    "time": format_time(time),
-                    "temperature": temp,
-                    "weather": get_weather_description(code),
-                    "windspeed": wind_speed,
-                    "winddirection": get_wind_direction(wind_direction),
-                    "precipitation": prec if prec else "N/A",
-                }
-                for time, temp, code, wind_speed, wind_direction, prec in zip(
-                    data["hourly"]["time"],
-                    data["hourly"]["temperature_2m"],
-                    data["hourly"]["weathercode"],
-                    data["hourly"]["windspeed_10m"],
-                    data["hourly"]["winddirection_10m"],
-                    data["hourly"].get("precipitation", [""] * len(data["hourly"]["time"])),
-                )
-            ]
+            weather_data["forecast"] = forecast_columns(data["hourly"], units)
 
         readable_weather_data = {"llm_output": format_weather_data(weather_data)}
         if print_data:
@@ -140,70 +143,86 @@ async def get_weather(
 
         return readable_weather_data
 
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         await robot.reset_ears().started()
         await robot.play_face_reaction(FaceAnim.SADNESS).completed()
         logging.error(f"Error occurred: {e}")
         return {}
 
 
-def get_weather_description(code: int) -> str:
+async def geocode(location: str, timeout: float = 5) -> Optional[Tuple[float, float]]:
     """
-    Convert a weather code into a human-readable description.
+    Return (latitude, longitude) of a city name or ZIP code, or None if unknown.
 
     Args:
-        code (int): The weather code returned by the Open-Meteo API.
-
-    Returns:
-        str: A description of the weather corresponding to the given code.
+        location (str): The city name or ZIP code.
+        timeout (float): The timeout for the request in seconds.
     """
-    descriptions = {
-        0: "Clear",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Cloudy",
-        45: "Fog",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Heavy drizzle",
-        56: "Light freezing drizzle",
-        57: "Heavy freezing drizzle",
-        61: "Light rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        66: "Light freezing rain",
-        67: "Heavy freezing rain",
-        71: "Light snow",
-        73: "Moderate snow",
-        75: "Heavy snow",
-        77: "Snow grains",
-        80: "Light rain showers",
-        81: "Moderate rain showers",
-        82: "Heavy rain showers",
-        85: "Light snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with light hail",
-        99: "Thunderstorm with heavy hail",
-    }
-    return descriptions.get(code, "Unknown")
+    place = GEOCODES.lookup(location, fuzzy=False)
+    if place is not None:
+        return place.latitude, place.longitude
+
+    # Near misses ("Riyahd") only when the network cannot resolve the name:
+    # "Lyons" or "Medinah" are other places, not typos of the seed cities
+    params = {"name": " ".join(location.split()), "count": 1, "language": "en", "format": "json"}
+    try:
+        results = (await http_cache.get_json(GEOCODING_URL, params, timeout=timeout)).get("results")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        place = GEOCODES.lookup(location)
+        if place is None:
+            raise
+    else:
+        place = GEOCODES.add_result(location, results[0]) if results else GEOCODES.lookup(location)
+    return (place.latitude, place.longitude) if place else None
+
+
+WEATHER_DESCRIPTIONS = {
+    0: "Clear",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Cloudy",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Heavy drizzle",
+    56: "Light freezing drizzle",
+    57: "Heavy freezing drizzle",
+    61: "Light rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    66: "Light freezing rain",
+    67: "Heavy freezing rain",
+    71: "Light snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Light rain showers",
+    81: "Moderate rain showers",
+    82: "Heavy rain showers",
+    85: "Light snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with light hail",
+    99: "Thunderstorm with heavy hail",
+}
+# Lookup table indexed by weather code (codes go up to 99; the last slot is for unknown/missing ones)
+_DESCRIPTION_TABLE = [WEATHER_DESCRIPTIONS.get(code, "Unknown") for code in range(101)]
+
+WIND_DIRECTIONS = ["North", "North-East", "East", "South-East", "South", "South-West", "West", "North-West"]
 
 
-def format_time(utc_time: str) -> str:
+def get_weather_description(code: int) -> str:
     """
-    Convert a UTC time string to a human-readable format.
+    Convert a weather code into a human-readable description.
 
     Args:
-        utc_time (str): The time in UTC format, e.g., '2025-01-23T00:00'.
+        code (int): The weather code returned by the Open-Meteo API.
 
     Returns:
-        str: A human-readable formatted time string, e.g., '2025-01-23 00:00:00'.
+        str: A description of the weather corresponding to the given code.
     """
-    # If the string doesn't contain seconds, add ":00"
-    if len(utc_time) == 16:  # Format: '2025-01-23T00:00'
-        utc_time += ":00"
-    return datetime.strptime(utc_time.rstrip("Z"), "%Y-%m-%dT%H:%M:%S").strftime("%Y-%m-%d %H:%M:%S")
+    return WEATHER_DESCRIPTIONS.get(code, "Unknown")
 
 
 def get_wind_direction(degrees: float) -> str:
@@ -216,20 +235,8 @@ def get_wind_direction(degrees: float) -> str:
     Returns:
         str: A human-readable wind direction (e.g., "North", "South-East").
     """
-    directions = [
-        ("North", 0),
-        ("North-East", 45),
-        ("East", 90),
-        ("South-East", 135),
-        ("South", 180),
-        ("South-West", 225),
-        ("West", 270),
-        ("North-West", 315),
-    ]
-
-    # Find the closest cardinal direction
-    closest_direction = min(directions, key=lambda x: abs(degrees - x[1]))
-    return closest_direction[0]
+    # 45° sectors centred on each direction (337.5°–22.5° is North)
+    return WIND_DIRECTIONS[int((degrees + 22.5) // 45) % 8]
 
 
 def convert_wind_speed_to_imperial(wind_speed_metric: float) -> float:
@@ -245,12 +252,87 @@ def convert_wind_speed_to_imperial(wind_speed_metric: float) -> float:
     return wind_speed_metric * 0.621371
 
 
+def forecast_columns(hourly: Dict[str, List[Any]], units: str) -> Dict[str, List[Any]]:
+    """
+    Convert Open-Meteo hourly arrays into display columns in one pass per column.
+
+    Args:
+        hourly (Dict): The "hourly" object of the forecast response (local ISO times, metric values).
+        units (str): "metric" or "imperial"; temperatures and wind speeds are converted for the latter.
+
+    Returns:
+        Dict[str, List]: "date", "hour", "temperature", "weather", "windspeed", "winddirection" and
+        "precipitation" (mm, 0 when missing) columns, all the same length.
+    """
+    times = hourly["time"]
+    temperature = hourly["temperature_2m"]
+    windspeed = hourly["windspeed_10m"]
+    imperial = units == "imperial"
+    columns = {
+        "temperature": [t * 9 / 5 + 32 for t in temperature] if imperial else list(temperature),
+        # Table lookup and sector arithmetic instead of a dict call and a min() over 8 directions per row
+        "weather": [_DESCRIPTION_TABLE[c if c is not None and 0 <= c < 100 else 100] for c in hourly["weathercode"]],
+        "windspeed": [w * 0.621371 for w in windspeed] if imperial else list(windspeed),
+        "winddirection": [WIND_DIRECTIONS[int(((d or 0) + 22.5) // 45) % 8] for d in hourly["winddirection_10m"]],
+        "precipitation": [p or 0.0 for p in hourly.get("precipitation") or [0.0] * len(times)],
+    }
+    # Times are local ISO strings ("2025-01-23T14:00"): slicing is all the parsing needed
+    columns["date"] = [t[:10] for t in times]
+    columns["hour"] = [t[11:16] for t in times]
+    return columns
+
+
+def summarize_forecast(columns: Dict[str, List[Any]], units: str) -> str:
+    """
+    Summarize forecast columns into one line per day.
+
+    Args:
+        columns (Dict): Output of `forecast_columns`.
+        units (str): "metric" or "imperial".
+
+    Returns:
+        str: e.g. "2025-01-23: 18 to 27°C, mostly partly cloudy, wind up to 16 km/h from the South-West,
+        rain 14:00-17:00 (1.2 mm)".
+    """
+    temp_unit = "°C" if units == "metric" else "°F"
+    speed_unit = "km/h" if units == "metric" else "mph"
+    days: Dict[str, List[int]] = {}
+    for i, date in enumerate(columns["date"]):
+        days.setdefault(date, []).append(i)
+
+    lines = []
+    for date, hours in days.items():
+        temperatures = [columns["temperature"][i] for i in hours]
+        weather = Counter(columns["weather"][i] for i in hours).most_common(1)[0][0]
+        windiest = max(hours, key=lambda i: columns["windspeed"][i])
+
+        # Rain windows: runs of consecutive hours with precipitation
+        windows, run = [], []
+        for i in hours + [None]:
+            if i is not None and columns["precipitation"][i] > 0:
+                run.append(i)
+                continue
+            if run:
+                end = (int(columns["hour"][run[-1]][:2]) + 1) % 24
+                total = sum(columns["precipitation"][j] for j in run)
+                windows.append(f"{columns['hour'][run[0]]}-{end:02d}:00 ({total:.1f} mm)")
+                run = []
+
+        lines.append(
+            f"{date}: {min(temperatures):.0f} to {max(temperatures):.0f}{temp_unit}, mostly {weather.lower()}, "
+            f"wind up to {columns['windspeed'][windiest]:.0f} {speed_unit} "
+            f"from the {columns['winddirection'][windiest]}, "
+            + (f"rain {', '.join(windows)}" if windows else "no rain")
+        )
+    return "\n".join(lines) + "\n"
+
+
 def format_weather_data(weather_data: Dict) -> str:
     """
     Format the weather data into a human-readable string.
 
     Args:
-        weather_data (Dict): The weather data to be formatted, containing current weather and/or forecast information.
+        weather_data (Dict): The weather data to be formatted, containing current weather and/or forecast columns.
 
     Returns:
         str: The formatted weather data.
@@ -283,24 +365,8 @@ def format_weather_data(weather_data: Dict) -> str:
         result += f"Precipitation: {weather_data['current']['precipitation']} mm\n"
 
     if "forecast" in weather_data:
-        result += "\n48-Hour Forecast:\n"
-        for entry in weather_data["forecast"]:
-            # Temperature conversion for Imperial
-            temp_value = entry["temperature"]
-            if weather_data["units"] == "imperial":
-                temp_value = (temp_value * 9 / 5) + 32  # Celsius to Fahrenheit
-
-            # Wind speed conversion for Imperial
-            wind_speed_value = entry["windspeed"]
-            if weather_data["units"] == "imperial":
-                wind_speed_value = convert_wind_speed_to_imperial(wind_speed_value)
-
-            result += (
-                f"{entry['time']}: Temp: {temp_value:.2f}°{'C' if weather_data['units'] == 'metric' else 'F'}, "
-                f"Weather: {entry['weather']}, Wind Speed: {wind_speed_value:.2f} "
-                f"{'km/h' if weather_data['units'] == 'metric' else 'mph'}, "
-                f"Wind Direction: {entry['winddirection']}, Precipitation: {entry['precipitation']} mm\n"
-            )
+        result += f"\n48-Hour Forecast for {weather_data['location']}:\n"
+        result += summarize_forecast(weather_data["forecast"], weather_data["units"])
 
     return result
 
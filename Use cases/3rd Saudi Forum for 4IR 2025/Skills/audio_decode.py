@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Custom Skill: Play an Audio Asset"""
+
+
+import asyncio
+import functools
+import hashlib
+import json
+import sys
+from pathlib import Path
+from pymirokai.decorators.skill import skill
+from pymirokai.enums.enums import AccessLevel
+from pymirokai.robot import Robot
+
+# audio_player.py est un module helper de Skills/ : envoyé à côté de ce skill, jamais activé
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from audio_player import AudioPlayer  # noqa: E402
+
+
+# === Asset audio (Assets/, généré par Tools & Examples/Audio encoding/audio_batch.py) ===
+# Livré à côté du skill par deploy_use_case.py, avec manifest.json (hash de chaque clip)
+AUDIO_ASSET = "arabic_hello.opus"
+AUDIO_MANIFEST = "manifest.json"
+AUDIO_CACHE_DIR = Path("/tmp/mirokai_audio_cache")
+PLAYER = AudioPlayer()
+
+
+@functools.lru_cache(maxsize=None)
+def load_audio_asset(name: str) -> Path:
+    """Return a playable file for an asset, checked and decoded once per process.
+
+    The asset is looked up next to this module (skills folder on the robot), then in
+    the use case's Assets/ folder, and checked against the sha256 of the manifest.json
+    written next to it by audio_batch.py. Compressed assets (FLAC/Opus) are decoded to
+    WAV in AUDIO_CACHE_DIR, keyed by hash, so later plays (and restarts) reuse the
+    decoded file.
+    """
+    here = Path(__file__).resolve().parent
+    path = next((p for p in (here / name, here.parent / "Assets" / name) if p.exists()), None)
+    if path is None:
+        raise FileNotFoundError(f"Audio asset {name} not found next to the skill or in Assets/")
+    manifest = json.loads((path.parent / AUDIO_MANIFEST).read_text(encoding="utf-8"))
+    sha256 = next((c["sha256"] for c in manifest["clips"].values() if c["file"] == name), None)
+    if sha256 is None:
+        raise KeyError(f"Audio asset {name} is not listed in {AUDIO_MANIFEST}")
+    if hashlib.sha256(path.read_bytes()).hexdigest() != sha256:
+        raise ValueError(f"Audio asset {name} does not match its expected hash")
+    if path.suffix == ".wav":
+        return path
+
+    cached = AUDIO_CACHE_DIR / f"{sha256}.wav"
+    if not cached.exists():
+        try:
+            import soundfile as sf
+        except ImportError:
+            return path  # SoX lit directement FLAC/Opus
+        data, samplerate = sf.read(path)
+        AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        sf.write(cached, data, samplerate)
+    return cached
+
+
+@skill(
+    access_level=AccessLevel.ADMIN,
+    verbal_descriptions={
+        "en": ["Say hello in arabic", "Show your arabic skills"],
+        "fr": ["parle en arabe"],
+    },
+)
+async def play_audio_verbose(robot: Robot) -> dict:
+    """
+    Play the audio asset without blocking the robot's event loop.
+    Provides detailed spoken and logged debug output.
+    """
+
+    try:
+        await robot.stop_conversation().completed()
+        phrase = robot.say("okay, let me think... Arabic is still hard for me I just started learning!")
+        await phrase.started()
+        
+        print("=== [DEBUG] Starting audio playback skill ===")
+
+        # --- Locate asset (decoded once, cached) ---
+        audio_file = load_audio_asset(AUDIO_ASSET)
+        print(f"[DEBUG] Audio asset: {audio_file} ({audio_file.stat().st_size} bytes)")
+
+        await phrase.completed()
+        await asyncio.sleep(1)
+        
+        await robot.animate_arms("SHOW_SOMETHING_UP_1").started()
+
+        # --- Playback (non-blocking: other robot callbacks keep running) ---
+        print(f"[DEBUG] Playing with backend: {PLAYER.backend}")
+        clip = PLAYER.play(audio_file)
+        latency = await clip.started()
+        print(f"[DEBUG] Playback started after {latency * 1000:.0f} ms")
+
+        if not await clip.completed():
+            msg = "Aucun lecteur audio disponible ou tous ont échoué."
+            print("[ERROR]", msg)
+            #await robot.say(msg).completed()
+            raise RuntimeError(msg)
+
+        #await robot.say("Lecture audio terminée avec succès.").completed()
+        result = "You managed to speak just a bit arabic!"
+
+    except Exception as e:
+        print(f"[FATAL] Exception occurred: {e}")
+        #await robot.say(f"Erreur critique détectée : {str(e)}").completed()
+        result = "something went wrong, you could not speak arabic"
+
+    #await robot.say("Fin du débogage audio détaillé.").completed()
+    print("=== [DEBUG] Audio debug skill completed ===")
+    await robot.arms_down().started()
+    await robot.say("Tadaaam! I hope you enjoyed!").completed()
+    await robot.start_conversation().completed()
+    return {"llm_output": result}
\ No newline at end of file
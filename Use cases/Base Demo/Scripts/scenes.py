@@ -0,0 +1,225 @@
+"""Scenes of the Base Demo, run by the shared orchestrator.
+
+Launch with `python ILMI_Orchestration.py` (see Tools & Examples/Orchestration/README.md).
+Each scene is an async function taking the robot; `ACTIONS` maps keys to scenes.
+"""
+
+import asyncio
+
+try:
+    from pymirokai.enums.enums import AccessLevel, Hand, Arm, FaceAnim
+except Exception as e:
+    print("Error, pymirokai enums not found")
+
+from orchestrator import ROBOT_VOLUME, handle_error
+
+
+# =========================
+#  Actions async
+# =========================
+async def Entrance_and_Greeting(robot):
+    try:
+        await robot.move_forward(distance_meters=2).started()
+        await asyncio.sleep(3)
+        await robot.scan_neck_and_wait_infinitely().started()
+        await robot.soft_coo().completed()
+        hello = robot.say("oh! Hello I'm very happy to be here!! I’m Miroka, your companion in exploration! I can’t promise to know everything, but I’ll never get tired of your questions.")
+        await hello.started()
+        await robot.play_face_reaction(FaceAnim.AMAZED).started()
+        await asyncio.sleep(6)
+        await robot.wave().completed()
+        await hello.completed()
+        # phrase = robot.say("Together with eilmi, we are here to spark curiosity and bring science to life in new ways.")
+        # await phrase.completed()
+        await robot.take_neck_resource_punctually().completed()
+        await asyncio.sleep(1)
+        go = robot.say("Dear Sarrah, let's go together in front of this wonderfull audience. Grab my hand!")
+        await go.started()
+        await robot.animate_arms("HOLD_HAND_0").started()
+        await go.completed()
+         
+         # Left wave
+        # left_wave = robot.animate_arm("wave", Arm.LEFT)
+        # await left_wave.completed()
+
+        # # Right wave
+        # right_wave = robot.animate_arm("wave", Arm.RIGHT)
+        # await right_wave.completed() 
+    except Exception as e:
+        await handle_error(e, robot)
+
+async def ILMI_role(robot):
+
+    try:
+        # Phrase 1
+        await robot.play_face_reaction(FaceAnim.JOY).started()
+        phrase = robot.say("Of course! I guide visitors through stories that deepen their connection to what’s around them.")
+        await phrase.started()
+        await robot.animate_arms("HOLD_MY_BEER_0").started()
+        await phrase.completed()
+
+        # Phrase 2
+        await robot.play_face_reaction(FaceAnim.PERPLEXED).started()
+        phrase = robot.say("I may not feel the smoothness of coral or breathe in the scent of the desert wind,")
+        await phrase.started()
+        await asyncio.sleep(2)
+        await robot.wriggle_ears().started()
+        await phrase.completed()
+
+        # Phrase 3
+        await robot.play_face_reaction(FaceAnim.INTEREST).started()
+        phrase = robot.say("but I can help others notice and appreciate those details that bring eilmi’s discoveries to life…")
+        await phrase.started()
+        await robot.arms_down().started()
+        await phrase.completed()
+
+        # Phrase 4
+        await robot.play_face_reaction(FaceAnim.PRIDE).started()
+        phrase = robot.say("I am here to work alongside people to make the experience richer ...")
+        await phrase.started()
+        await robot.animate_arms("HANDS_ON_HIPS").started()
+        await phrase.completed()
+
+        await robot.play_face_reaction(FaceAnim.HAPPY_BIG_SMILE).started()
+        phrase = robot.say("like adding another layer of perspective to the customer’s visit.")
+        await phrase.started()
+        await robot.arms_down().started()
+        await phrase.completed()
+    except Exception as e:
+        await handle_error(e, robot)
+
+async def Red_sea(robot):
+    try:
+        # Phrase 1: Excitement
+        await robot.play_face_reaction(FaceAnim.SURPRISE).started()
+        phrase = robot.say(
+            "Oh Yes!! One of my favorite stories comes from the Red Sea. "
+            "The water there is unusually warm and salty, yet life flourishes."
+        )
+        await phrase.started()
+        await asyncio.sleep(0.3)
+        await robot.animate_arms("HAND_CHECK_0").started()
+        await asyncio.sleep(1.5)
+        await robot.arms_down().started()
+        await phrase.completed()
+
+        # Phrase 2 — Admiration and curiosity
+        await robot.play_face_reaction(FaceAnim.DAZZLED).started()
+        phrase = robot.say(
+            "Corals and fish have adapted in remarkable ways ... "
+            "small creatures teaching us big lessons about resilience."
+        )
+        await phrase.started()
+        await asyncio.sleep(1.5)
+        await robot.wriggle_ears(rounds=2).started()
+        await phrase.completed()
+
+        # Phrase 3 — Reflection and hope
+        await robot.play_face_reaction(FaceAnim.PRIDE).started()
+        phrase = robot.say(
+            "Some scientists call these corals heat-tough because they can handle temperatures that would destroy most reefs. "
+            "Studying them helps us understand how life might survive in a changing climate. "
+            "For me, that story is a reminder that science is not only about knowledge ... it’s also about hope."
+        )
+        await phrase.started()
+        await robot.animate_arms("HANDS_ON_HIPS").started()
+        await phrase.completed()
+
+        # Wrap up: Arms down to neutral
+        await robot.arms_down().started()
+    except Exception as e:
+        await handle_error(e, robot)
+    
+async def Vision2030(robot):
+    try:
+        # Phrase 1 — Vision and aspiration
+        await robot.play_face_reaction(FaceAnim.DETERMINED).started()
+        phrase = robot.say("Vision 2030 is about building a creative, knowledge-driven Saudi Arabia.")
+        await phrase.started()
+        await robot.animate_arms("SHOW_SOMETHING_UP_0").started()
+        await phrase.completed()
+
+        # Phrase 2 — ILMI's purpose (no arm movement)
+        await robot.play_face_reaction(FaceAnim.INTEREST).started()
+        phrase = robot.say("eilmi is part of that vision ... it turns curiosity into learning, and learning into real skills.")
+        await phrase.started()
+        await robot.arms_down().started()
+        await phrase.completed()
+
+        # Phrase 3 — Engagement and future
+        await robot.play_face_reaction(FaceAnim.HAPPY_BIG_SMILE).started()
+        phrase = robot.say(
+            "Here, people don’t just see science; they experience it, create with it, and grow from it. "
+            "That’s how eilmi helps shape the future the Kingdom is reaching for."
+        )
+        await phrase.started()
+        await robot.wriggle_ears(rounds=2).started()
+        await phrase.completed()
+
+        # Return arms to neutral
+        await robot.arms_down().started()
+    except Exception as e:
+        await handle_error(e, robot)
+
+async def END(robot):
+    try:
+        # Phrase 1 — Gratitude
+        await robot.play_face_reaction(FaceAnim.JOY).started()
+        phrase = robot.say("Thank you. If you want to continue the conversation, I’ll be just outside after the session.")
+        await phrase.started()
+        await robot.arms_down().started()
+        await phrase.completed()
+
+        # Phrase 2 — Invitation
+        await robot.play_face_reaction(FaceAnim.HAPPY_BIG_SMILE).started()
+        phrase = robot.say("I would be happy if you stopped by to talk to me!")
+        await phrase.started()
+        await phrase.completed()
+
+        # Phrase 3 — Goodbye with double wave
+        await robot.play_face_reaction(FaceAnim.PRIDE).started()
+        phrase = robot.say("Goodbye everyone!")
+        wave = robot.animate_arms("HELLO")
+        await robot.scan_neck_and_wait_infinitely().started()
+        await wave.started()
+        await phrase.started()
+        await phrase.completed()
+        await wave.completed()
+        #await robot.animate_arms("HOLD_HAND_1").started()
+        await robot.take_neck_resource_punctually().completed()
+        #phrase = robot.say("Let's go outside!")
+        #await phrase.completed()
+
+
+    except Exception as e:
+        await handle_error(e, robot)
+
+async def Start_llm(robot):
+    try:
+        await robot.set_sound_level(0)
+        await robot.start_conversation().completed()
+        await asyncio.sleep(1.5)
+        await robot.set_sound_level(ROBOT_VOLUME)
+    except Exception as e:
+        await handle_error(e, robot)
+
+async def Stop_llm(robot):
+    try:
+        await robot.stop_conversation().completed()
+    except Exception as e:
+        await handle_error(e, robot)
+
+async def Arms_Down(robot):
+    await robot.arms_down().completed()
+
+# Map touches -> fonctions
+ACTIONS = {
+    "1": Entrance_and_Greeting, "num 1": Entrance_and_Greeting,
+    "2": ILMI_role, "num 2": ILMI_role,
+    "3": Red_sea, "num 3": Red_sea,
+    "4": Vision2030, "num 4": Vision2030,
+    "5": END, "num 5": END,
+    "6": Arms_Down, "num 6": Arms_Down,
+    "7": Start_llm, "num 7": Start_llm,
+    "8": Stop_llm, "num 8": Stop_llm,
+}